@@ -0,0 +1,143 @@
+"""Checks the memory allocated by resolutions of common graphs against budgets.
+
+Usage:
+    python benchmarks/bench_alloc.py [--calls 200] [--scale 1.0]
+
+For every graph, the largest `tracemalloc` peak of a single resolution (after a warm-up
+call) is compared with its budget in bytes, multiplied by `--scale`. Exits with status 1
+when a graph goes over budget, so it can run in CI.
+"""
+
+import argparse
+import asyncio
+import sys
+import tracemalloc
+from typing import Callable
+
+from depin import Container, RequestScopeService, Scope
+
+# bytes, measured on CPython 3.13 and rounded up with some headroom
+BUDGETS = {
+    'singleton hit': 256,
+    'async singleton hit': 1024,
+    'transient chain (depth 5)': 4096,
+    'request scope (10 providers)': 8192,
+}
+
+
+class Settings: ...
+
+
+class Level0:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Level1:
+    def __init__(self, level: Level0):
+        self.level = level
+
+
+class Level2:
+    def __init__(self, level: Level1):
+        self.level = level
+
+
+class Level3:
+    def __init__(self, level: Level2):
+        self.level = level
+
+
+class Level4:
+    def __init__(self, level: Level3):
+        self.level = level
+
+
+def build_graphs() -> list[tuple[str, Callable[[], object]]]:
+    container = Container()
+    container.bind(source=Settings, scope=Scope.SINGLETON)
+
+    for level in (Level0, Level1, Level2, Level3, Level4):
+        container.bind(source=level, scope=Scope.TRANSIENT)
+
+    scoped = []
+
+    for _ in range(10):
+
+        class Scoped:
+            def __init__(self, settings: Settings):
+                self.settings = settings
+
+        container.bind(source=Scoped, scope=Scope.REQUEST)
+        scoped.append(Scoped)
+
+    async def engine():
+        return object()
+
+    container.bind(source=engine, scope=Scope.SINGLETON)
+    container.warm()
+    asyncio.run(container.get_async(engine))
+
+    def request_scope():
+        with RequestScopeService.request_scope():
+            for source in scoped:
+                container.get(source)
+
+    def async_hit():
+        coroutine = container.get_async(engine)
+
+        try:
+            coroutine.send(None)
+        except StopIteration:
+            pass
+
+    graphs = [
+        ('singleton hit', lambda: container.get(Settings)),
+        ('async singleton hit', async_hit),
+        ('transient chain (depth 5)', lambda: container.get(Level4)),
+        ('request scope (10 providers)', request_scope),
+    ]
+
+    return graphs
+
+
+def measure(func: Callable[[], object], calls: int) -> int:
+    func()
+    peak = 0
+
+    for _ in range(calls):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+
+    return peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--scale', type=float, default=1.0, help='multiplier applied to every budget')
+    args = parser.parse_args()
+
+    graphs = build_graphs()
+    failed = False
+
+    tracemalloc.start()
+
+    try:
+        for name, func in graphs:
+            peak = measure(func, args.calls)
+            budget = int(BUDGETS[name] * args.scale)
+            status = 'ok' if peak <= budget else 'OVER BUDGET'
+            failed = failed or peak > budget
+
+            print(f'{name:<30} {peak:>8} bytes (budget {budget:>6})  {status}')
+    finally:
+        tracemalloc.stop()
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Measures the time it takes to `import depin` in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 20] [--budget-ms 100]
+
+Exits with status 1 when the median import time exceeds the budget or when the
+import pulls in a web framework, so it can be used as a CI guard.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+FRAMEWORK_MODULES = ('fastapi', 'starlette', 'pydantic')
+
+PROBE = """
+import sys, time
+start = time.perf_counter_ns()
+import depin
+elapsed = time.perf_counter_ns() - start
+loaded = sorted({m.split('.')[0] for m in sys.modules} & set(%r))
+print(elapsed, ','.join(loaded))
+""" % (FRAMEWORK_MODULES,)
+
+
+def measure_once() -> tuple[float, list[str]]:
+    output = subprocess.check_output([sys.executable, '-c', PROBE], text=True).split()
+    elapsed_ms = int(output[0]) / 1_000_000
+    loaded = output[1].split(',') if len(output) > 1 else []
+    return elapsed_ms, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=100.0)
+    args = parser.parse_args()
+
+    timings = []
+    loaded: set[str] = set()
+
+    for _ in range(args.runs):
+        elapsed_ms, modules = measure_once()
+        timings.append(elapsed_ms)
+        loaded.update(modules)
+
+    median = statistics.median(timings)
+    print(f'import depin: median {median:.1f}ms, min {min(timings):.1f}ms, max {max(timings):.1f}ms ({args.runs} runs)')
+
+    if loaded:
+        print(f'FAIL: importing depin loaded {", ".join(sorted(loaded))}')
+        return 1
+
+    if median > args.budget_ms:
+        print(f'FAIL: median import time above the {args.budget_ms:.0f}ms budget')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
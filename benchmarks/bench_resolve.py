@@ -0,0 +1,78 @@
+"""Measures the per-call cost of `Container.get_async` for already built instances.
+
+Usage:
+    python benchmarks/bench_resolve.py [--calls 100000] [--deps 10]
+
+Resolves `--deps` async SINGLETON providers and `--deps` REQUEST providers inside a
+single request scope, the way a handler with many dependencies does, and reports the
+mean time per resolution after the first (building) call.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from depin import Container, RequestScopeService, Scope
+
+
+def build_container(deps: int) -> tuple[Container, list, list]:
+    container = Container()
+    singletons = []
+    scoped = []
+
+    for _ in range(deps):
+
+        async def singleton():
+            return object()
+
+        async def request():
+            return object()
+
+        container.bind(source=singleton, scope=Scope.SINGLETON)
+        container.bind(source=request, scope=Scope.REQUEST)
+        singletons.append(singleton)
+        scoped.append(request)
+
+    return container, singletons, scoped
+
+
+async def measure(container: Container, sources: list, calls: int) -> float:
+    for source in sources:
+        await container.get_async(source)
+
+    rounds = max(calls // len(sources), 1)
+    start = time.perf_counter_ns()
+
+    for _ in range(rounds):
+        for source in sources:
+            await container.get_async(source)
+
+    return (time.perf_counter_ns() - start) / (rounds * len(sources))
+
+
+async def run(calls: int, deps: int):
+    container, singletons, scoped = build_container(deps)
+
+    singleton_ns = await measure(container, singletons, calls)
+
+    async with RequestScopeService.request_scope_async():
+        request_ns = await measure(container, scoped, calls)
+
+    print(f'get_async singleton hit: {singleton_ns:.0f}ns/call')
+    print(f'get_async request hit:   {request_ns:.0f}ns/call')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=100_000)
+    parser.add_argument('--deps', type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.calls, args.deps))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Measures `Container.get` throughput as the number of threads grows.
+
+Usage:
+    python benchmarks/bench_threads.py [--calls 200000] [--threads 1,2,4,8]
+
+Every thread resolves an already built singleton and a transient depending on it.
+On free-threaded CPython (3.13t+) throughput should scale with the thread count,
+with the GIL it stays roughly flat; a collapse points at lock contention.
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from depin import Container, Scope
+
+
+class Settings: ...
+
+
+class Service:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+def build_container() -> Container:
+    container = Container()
+    container.bind(source=Settings, scope=Scope.SINGLETON)
+    container.bind(source=Service, scope=Scope.TRANSIENT)
+    container.warm()
+
+    return container
+
+
+def measure(container: Container, threads: int, calls: int) -> float:
+    per_thread = calls // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        get = container.get
+        barrier.wait()
+
+        for _ in range(per_thread):
+            get(Settings)
+            get(Service)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+
+    for thread in workers:
+        thread.join()
+
+    elapsed = time.perf_counter() - start
+
+    return per_thread * threads * 2 / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=200_000)
+    parser.add_argument('--threads', default='1,2,4,8')
+    args = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    container = build_container()
+    baseline = None
+
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}')
+
+    for threads in (int(count) for count in args.threads.split(',')):
+        throughput = measure(container, threads, args.calls)
+        baseline = baseline or throughput
+        print(f'{threads:>3} threads: {throughput:>12,.0f} resolutions/s ({throughput / baseline:.2f}x)')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,37 @@
+from typing import TYPE_CHECKING, Any
+
 from ._internal.container import Container, Inject, Scope
+from ._internal.event_loop_scope import EventLoopScopeService
+from ._internal.profiling import StartupProfiler
 from ._internal.request_scope import RequestScopeService
+from ._internal.thread_scope import ThreadScopeService
 from ._internal.types import Request, Singleton, Transient
 
+if TYPE_CHECKING:
+    from ._internal.leaks import RequestLeakDetector
+    from ._internal.metrics import ContainerMetrics
+    from ._internal.process_pool import ContainerSpec, ProcessPoolService
+    from ._internal.tracing import ResolutionTracer
+
+# optional tooling, imported on first access to keep `import depin` cheap
+_LAZY_EXPORTS = {
+    'ProcessPoolService': '._internal.process_pool',
+    'ContainerSpec': '._internal.process_pool',
+    'ContainerMetrics': '._internal.metrics',
+    'ResolutionTracer': '._internal.tracing',
+    'RequestLeakDetector': '._internal.leaks',
+}
+
 __all__ = [
     'RequestScopeService',
+    'ThreadScopeService',
+    'EventLoopScopeService',
+    'ProcessPoolService',
+    'ContainerSpec',
+    'StartupProfiler',
+    'ContainerMetrics',
+    'ResolutionTracer',
+    'RequestLeakDetector',
     'Container',
     'Scope',
     'Inject',
@@ -11,3 +39,21 @@ __all__ = [
     'Singleton',
     'Transient',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,5 @@
+import sys
+
+from depin._internal.cli import main
+
+sys.exit(main())
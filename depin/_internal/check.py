@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from depin._internal.exceptions import CircularDependencyError, MissingProviderError
+from depin._internal.helpers import is_async_callable, is_async_generator_callable
+from depin._internal.types import ProviderInfo, ProviderSource, Scope
+
+if TYPE_CHECKING:
+    from depin._internal.container import Container
+
+# how long an instance of each scope lives, providers may only depend on equal or longer lifetimes
+SCOPE_LIFETIME = {
+    Scope.REQUEST: 1,
+    Scope.EVENT_LOOP: 2,
+    Scope.THREAD: 3,
+    Scope.SINGLETON: 4,
+}
+
+
+@dataclass(frozen=True)
+class GraphIssue:
+    kind: Literal['missing', 'cycle', 'captive', 'async', 'import']
+    severity: Literal['error', 'warning']
+    source: Any
+    message: str
+
+    def __str__(self) -> str:
+        return f'{self.severity}[{self.kind}] {describe(self.source)}: {self.message}'
+
+
+def check_container(container: 'Container') -> list[GraphIssue]:
+    """Validates every binding visible from `container` without instantiating anything."""
+
+    bindings = get_bindings(container)
+    issues: list[GraphIssue] = []
+
+    for source, provider_info in bindings.items():
+        issues.extend(_check_missing(container, source, provider_info))
+        issues.extend(_check_captive(container, source, provider_info))
+        issues.extend(_check_async(source, provider_info))
+
+    issues.extend(_check_cycles(container, bindings))
+
+    return issues
+
+
+def describe(source: ProviderSource) -> str:
+    module = getattr(source, '__module__', None)
+    qualname = getattr(source, '__qualname__', None)
+
+    if module is None or qualname is None:
+        return repr(source)
+
+    return f'{module}.{qualname}'
+
+
+def get_bindings(container: 'Container') -> dict[ProviderSource, ProviderInfo]:
+    bindings: dict[ProviderSource, ProviderInfo] = {}
+    seen: set[int] = set()
+    layer: Container | None = container
+
+    while layer is not None:
+        for key in layer._providers:  # pyright: ignore[reportPrivateUsage]
+            provider_info = container._get_provider_info(key)  # pyright: ignore[reportPrivateUsage]
+
+            # aliases share the record of their binding and are checked once
+            if key not in bindings and provider_info is not None and id(provider_info) not in seen:
+                seen.add(id(provider_info))
+                bindings[key] = provider_info
+
+        layer = layer._parent  # pyright: ignore[reportPrivateUsage]
+
+    return bindings
+
+
+def _check_missing(container: 'Container', source: ProviderSource, provider_info: ProviderInfo) -> list[GraphIssue]:
+    try:
+        plan = container._compile_plan(provider_info.source)  # pyright: ignore[reportPrivateUsage]
+    except MissingProviderError as exc:
+        return [GraphIssue('missing', 'error', source, str(exc))]
+    except (TypeError, AttributeError, NameError) as exc:
+        return [GraphIssue('missing', 'error', source, f'Cannot inspect {provider_info.source}: {exc}')]
+
+    return [
+        GraphIssue(
+            'missing', 'error', source, f"Provider for parameter '{name}' ({describe(dependency)}) not registered"
+        )
+        for name, dependency in plan
+        if not container._has_provider_for(dependency)  # pyright: ignore[reportPrivateUsage]
+    ]
+
+
+def _check_captive(container: 'Container', source: ProviderSource, provider_info: ProviderInfo) -> list[GraphIssue]:
+    lifetime = SCOPE_LIFETIME.get(provider_info.scope)
+
+    if lifetime is None:
+        return []
+
+    issues = []
+    visited = {source}
+    sources = container._get_dependency_sources(provider_info.source)  # pyright: ignore[reportPrivateUsage]
+    pending = [(dependency, [dependency]) for dependency in sources]
+
+    while pending:
+        dependency, path = pending.pop()
+
+        if dependency in visited:
+            continue
+
+        visited.add(dependency)
+        dependency_info = container._get_provider_info(dependency)  # pyright: ignore[reportPrivateUsage]
+
+        if dependency_info is None:
+            continue
+
+        # transients are created for their consumer and live as long as it does
+        if dependency_info.scope == Scope.TRANSIENT:
+            pending.extend(
+                (nested, [*path, nested])
+                for nested in container._get_dependency_sources(dependency_info.source)  # pyright: ignore[reportPrivateUsage]
+            )
+
+        elif SCOPE_LIFETIME[dependency_info.scope] < lifetime:
+            chain = ' -> '.join(describe(item) for item in path)
+            issues.append(
+                GraphIssue(
+                    'captive',
+                    'error',
+                    source,
+                    f'{provider_info.scope.name} provider captures {dependency_info.scope.name} dependency '
+                    f'{describe(dependency)} (via {chain}), which outlives its scope',
+                )
+            )
+
+    return issues
+
+
+def _check_async(source: ProviderSource, provider_info: ProviderInfo) -> list[GraphIssue]:
+    implementation = provider_info.source
+
+    if not provider_info.needs_async or is_async_callable(implementation):
+        return []
+
+    if is_async_generator_callable(implementation):
+        return []
+
+    if provider_info.scope in (Scope.SINGLETON, Scope.THREAD):
+        return [
+            GraphIssue(
+                'async',
+                'warning',
+                source,
+                f'synchronous {provider_info.scope.name} provider depends on async providers, '
+                'it can only be resolved with get_async (Container.get will fail)',
+            )
+        ]
+
+    return []
+
+
+def _check_cycles(container: 'Container', bindings: dict[ProviderSource, ProviderInfo]) -> list[GraphIssue]:
+    issues = []
+    reported: set[frozenset[Any]] = set()
+    done: set[Any] = set()
+
+    def visit(source: ProviderSource, visiting: dict[Any, Literal[True]]):
+        if source in done:
+            return
+
+        if source in visiting:
+            path = list(visiting)
+            cycle = dict.fromkeys(path[path.index(source) :], True)
+
+            if frozenset(cycle) not in reported:
+                reported.add(frozenset(cycle))
+                issues.append(GraphIssue('cycle', 'error', source, str(CircularDependencyError(cycle, source))))
+
+            return
+
+        provider_info = container._get_provider_info(source)  # pyright: ignore[reportPrivateUsage]
+        implementation = provider_info.source if provider_info is not None else source
+
+        visiting[source] = True
+
+        for dependency in container._get_dependency_sources(implementation):  # pyright: ignore[reportPrivateUsage]
+            visit(dependency, visiting)
+
+        visiting.pop(source)
+        done.add(source)
+
+    for source in bindings:
+        visit(source, {})
+
+    return issues
@@ -0,0 +1,136 @@
+import argparse
+import sys
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from depin._internal.helpers import import_object
+
+if TYPE_CHECKING:
+    from depin._internal.container import Container
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m depin', description='depin command line tools')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    check = commands.add_parser(
+        'check',
+        help='validate a container graph without instantiating anything',
+        description='Reports missing providers, cycles, captive dependencies and async/sync mismatches. '
+        'Exits with status 1 when errors are found.',
+    )
+    check.add_argument('target', help="import path of the container, e.g. 'app.di:DI'")
+    check.add_argument('--strict', action='store_true', help='exit with status 1 on warnings too')
+
+    startup = commands.add_parser(
+        'startup',
+        help='report the time depin spends registering (and warming) a container',
+        description='Imports the container module under a StartupProfiler and prints the slowest providers.',
+    )
+    startup.add_argument('target', help="import path of the container, e.g. 'app.di:DI'")
+    startup.add_argument('--warm', action='store_true', help='also build the synchronous singletons')
+    startup.add_argument('--limit', type=int, default=20, help='number of providers in the report')
+    startup.add_argument('--json', metavar='PATH', help='write the full report as JSON')
+
+    generate = commands.add_parser(
+        'generate',
+        help='generate a wiring module replacing provider introspection at startup',
+        description='Records the injectable parameters of every provider in a plain Python module. '
+        'Pass its import path as Container(wiring=...) to skip inspect.signature/get_type_hints at startup.',
+    )
+    generate.add_argument('target', help="import path of the container, e.g. 'app.di:DI'")
+    generate.add_argument('-o', '--output', metavar='PATH', help='file to write, defaults to stdout')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'startup':
+        return run_startup(args.target, warm=args.warm, limit=args.limit, json_path=args.json)
+
+    if args.command == 'generate':
+        return run_generate(args.target, output=args.output)
+
+    return run_check(args.target, strict=args.strict)
+
+
+def run_check(target: str, strict: bool = False) -> int:
+    from depin._internal.check import get_bindings
+
+    container = load_container(target)
+    issues = container.check()
+
+    for issue in issues:
+        print(issue)
+
+    errors = sum(issue.severity == 'error' for issue in issues)
+    warnings = len(issues) - errors
+    scopes = Counter(info.scope.name.lower() for info in get_bindings(container).values())
+    summary = ', '.join(f'{count} {scope}' for scope, count in sorted(scopes.items()))
+
+    print(f'Checked {scopes.total()} providers ({summary or "none"}): {errors} errors, {warnings} warnings')
+
+    return 1 if errors or (strict and warnings) else 0
+
+
+def run_startup(target: str, warm: bool = False, limit: int = 20, json_path: str | None = None) -> int:
+    from depin._internal.profiling import StartupProfiler
+
+    with StartupProfiler() as profiler:
+        container = load_container(target)
+
+        if warm:
+            container.warm()
+
+    print(profiler.report(limit))
+
+    if json_path is not None:
+        profiler.write_json(json_path)
+
+    return 0
+
+
+def run_generate(target: str, output: str | None = None) -> int:
+    from depin._internal.wiring import generate_wiring
+
+    source = generate_wiring(load_container(target), target)
+
+    if output is None:
+        sys.stdout.write(source)
+    else:
+        with open(output, 'w') as file:
+            file.write(source)
+
+    return 0
+
+
+def load_container(target: str) -> 'Container':
+    from depin._internal.check import GraphIssue
+    from depin._internal.container import Container
+    from depin._internal.exceptions import CircularDependencyError, MissingProviderError
+
+    if ':' not in target:
+        raise SystemExit(f"error: target must look like 'module:container', got {target!r}")
+
+    # `bind` validates the graph as the module registers it, so most cycles surface here
+    try:
+        container = import_object(target)
+    except CircularDependencyError as exc:
+        issue = GraphIssue('cycle', 'error', exc.source, str(exc))
+    except MissingProviderError as exc:
+        issue = GraphIssue('missing', 'error', target, str(exc))
+    except (ImportError, AttributeError) as exc:
+        issue = GraphIssue('import', 'error', target, f'{type(exc).__name__}: {exc}')
+    else:
+        issue = None
+
+    if issue is not None:
+        print(issue)
+        raise SystemExit(1)
+
+    if not isinstance(container, Container):
+        raise SystemExit(f'error: {target!r} is not a depin Container')
+
+    return container
+
+
+if __name__ == '__main__':
+    sys.exit(main())
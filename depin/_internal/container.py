@@ -1,19 +1,47 @@
 import inspect
-from typing import Any, Callable, Literal, cast
-
-from fastapi import Depends
-
+import os
+import threading
+import weakref
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar, copy_context
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator, Literal, cast
+
+from depin._internal.event_loop_scope import EventLoopScopeService
 from depin._internal.exceptions import CircularDependencyError, MissingProviderError, UnexpectedCoroutineError
 from depin._internal.helpers import (
-    get_cached_signature,
-    get_cached_type_hints,
+    CacheInfo,
+    ConstructionLock,
+    IntrospectionCache,
+    Parameter,
+    inspect_parameters,
     is_async_callable,
     is_async_generator_callable,
     is_generator_callable,
 )
+from depin._internal.overrides import OVERRIDE_CACHE, OverrideCache, OverridesMap, ProviderOverride
+from depin._internal.profiling import get_startup_profiler
 from depin._internal.request_scope import RequestScopeService
-from depin._internal.types import Provider, ProviderDependency, ProviderInfo, ProviderSource, Resolvable, Scope
-from depin._internal.wraps import wrap_async_gen, wrap_sync_gen
+from depin._internal.thread_scope import ThreadScopeService
+from depin._internal.types import (
+    MISSING,
+    ContainerSnapshot,
+    ProviderDependency,
+    ProviderInfo,
+    ProviderSource,
+    Resolvable,
+    Scope,
+)
+from depin._internal.wraps import wrap_async_gen, wrap_async_gen_untracked, wrap_blocking_exit, wrap_sync_gen
+
+# tooling modules are imported on first use, like the FastAPI integration, to keep `import depin` cheap
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from depin._internal.check import GraphIssue
+    from depin._internal.graph import DependencyGraph
+    from depin._internal.process_pool import ContainerSpec
+    from depin._internal.profiling import ResolutionObserver, ResolutionProfile
+    from depin._internal.wiring import Wiring, WiringInfo
 
 INSPECT_EMPTY = inspect._empty  # pyright: ignore[reportPrivateUsage]
 
@@ -22,13 +50,55 @@ def Inject[T](dependency: ProviderSource[T]) -> T:
     return ProviderDependency(dependency)  # type: ignore[return-value]
 
 
+class _RetiredResource:
+    """Key of the open resource of a re-bound singleton, still torn down by `close`/`aclose`."""
+
+    __slots__ = ('source', 'fork_safe')
+
+    def __init__(self, source: ProviderSource, fork_safe: bool):
+        self.source = source
+        self.fork_safe = fork_safe
+
+    def __repr__(self) -> str:
+        return f'<retired resource of {self.source!r}>'
+
+
 class Container:
-    """Dependency injection container"""
+    """Dependency injection container
+
+    Args:
+        blocking: Default of the `blocking` option of `bind`/`register`, not applied to
+            THREAD and EVENT_LOOP scopes.
+        executor: Executor running blocking providers on async paths, defaults to the
+            running loop's default (bounded) executor.
+        wiring: Import path of a module generated by `python -m depin generate`, whose
+            recorded provider parameters replace introspection. A missing module or stale
+            entries fall back to introspection.
+    """
 
     Scope = Scope
 
-    def __init__(self):
+    def __init__(self, *, blocking: bool = False, executor: 'Executor | None' = None, wiring: str | None = None):
+        self._blocking = blocking
+        self._executor = executor
+        self._introspection = IntrospectionCache()
+        self._wiring = self._load_wiring(wiring) if wiring is not None else None
+        # guards registry mutation and teardown, resolution reads are lock-free
+        self._lock = threading.RLock()
+        # per-provider locks of cold sync singleton constructions, see `_build_provider_info`
+        self._construction_locks: weakref.WeakSet[ConstructionLock] = weakref.WeakSet()
+        self._dependencies: dict[ProviderSource, Callable[[], Any]] = {}
+        self._parent: Container | None = None
+        self._observers: tuple[ResolutionObserver, ...] = ()
         self._providers: dict[ProviderSource, ProviderInfo] = {}
+        self._singletons: dict[ProviderSource, Any] = {}
+        self._singleton_resources: dict[ProviderSource, Any] = {}
+        self._plans: dict[ProviderSource, tuple[int, tuple[tuple[str, ProviderSource], ...]]] = {}
+        self._batch_plans: dict[tuple[ProviderSource, ...], tuple[int, tuple[tuple[ProviderSource, ...], ...]]] = {}
+        self._generation = 0
+        self._overrides: ContextVar[OverridesMap | None] = ContextVar('depin_overrides', default=None)
+
+        _FORK_AWARE_CONTAINERS.add(self)
 
     def register[T](
         self,
@@ -36,6 +106,8 @@ class Container:
         *,
         abstract: type[T] | None = None,
         aliases: list[type] | None = None,
+        fork_safe: bool = True,
+        blocking: bool | None = None,
     ):
         """Decorator that registers a class or function as a provider in the container.
 
@@ -60,6 +132,8 @@ class Container:
                 source=source,  # type: ignore[arg-type]
                 scope=scope,
                 aliases=aliases,
+                fork_safe=fork_safe,
+                blocking=blocking,
             )
 
             return source
@@ -73,6 +147,8 @@ class Container:
         source: ProviderSource[T],
         abstract: type[T] | None = None,
         aliases: list[type] | None = None,
+        fork_safe: bool = True,
+        blocking: bool | None = None,
     ):
         """Function used to register a class or function as a provider in the container.
 
@@ -89,13 +165,18 @@ class Container:
             container.bind(source=get_session, scope=Scope.REQUEST)
             container.bind(source=SomeRepository, scope=Scope.REQUEST)
             ```
+
+        Singletons bound with `fork_safe=False` (sockets, pools, threads) are dropped in
+        child processes after `os.fork` and rebuilt there on first use, fork-safe ones
+        built in the parent are shared copy-on-write.
+
+        Synchronous providers bound with `blocking=True` (the container default when None,
+        except for THREAD and EVENT_LOOP scopes) do I/O: `get_async` builds them, and tears
+        down their generators, in an executor instead of blocking the event loop. Cached
+        instances are still returned inline.
         """
 
-        if scope != Scope.REQUEST:
-            if is_async_generator_callable(source):
-                raise RuntimeError('Async generators are not supported in non-request scopes')
-            elif is_generator_callable(source):
-                raise RuntimeError('Generators are not supported in non-request scopes')
+        self._check_scope_supports(source, scope)
 
         if isinstance(source, type):
             return self._register(
@@ -104,6 +185,8 @@ class Container:
                 callable_source=None,
                 scope=scope,
                 aliases=aliases,
+                fork_safe=fork_safe,
+                blocking=blocking,
             )
 
         elif callable(source):
@@ -113,10 +196,22 @@ class Container:
                 callable_source=source,
                 scope=scope,
                 aliases=aliases,
+                fork_safe=fork_safe,
+                blocking=blocking,
             )
 
         raise ValueError(f'failed to register {source=}; source must be a type or callable')
 
+    def _check_scope_supports(self, source: ProviderSource, scope: Scope):
+        if scope == Scope.TRANSIENT:
+            if is_async_generator_callable(source):
+                raise RuntimeError('Async generators are not supported in transient scope')
+            elif is_generator_callable(source):
+                raise RuntimeError('Generators are not supported in transient scope')
+
+        if scope == Scope.THREAD and is_async_generator_callable(source):
+            raise RuntimeError('Async generators are not supported in thread scope')
+
     def _register[T](
         self,
         *,
@@ -125,6 +220,8 @@ class Container:
         implementation: type[T] | None,
         callable_source: Resolvable[T] | None,
         aliases: list[type] | None = None,
+        fork_safe: bool = True,
+        blocking: bool | None = None,
     ):
 
         abstract = abstract or implementation
@@ -141,64 +238,258 @@ class Container:
         implementation = cast(type[T], implementation)
         abstract = cast(type[T], abstract)
 
+        key = abstract or callable_source
+        assert key is not None
+
+        if blocking is None:
+            blocking = self._blocking and scope not in (Scope.EVENT_LOOP, Scope.THREAD)
+        elif blocking and scope in (Scope.EVENT_LOOP, Scope.THREAD):
+            # an executor worker would build the instance, and cache it in its own thread store
+            raise ValueError(f'Blocking providers are not supported in {scope.value} scope')
+
+        profiler = get_startup_profiler()
+
+        with profiler.measure('register', key) if profiler is not None else nullcontext():
+            provider_info = self._build_provider_info(
+                scope=scope,
+                implementation=implementation,
+                callable_source=callable_source,
+                cache_key=key,
+                instances=self._singletons,
+                resources=self._singleton_resources,
+                fork_safe=fork_safe,
+                blocking=blocking,
+            )
+
+            with self._lock:
+                previous = self._providers.get(key)
+
+                for item in [key, *(aliases or [])]:
+                    self._providers[item] = provider_info
+
+                # a re-bound singleton must not keep serving the previous instance
+                self._singletons.pop(key, None)
+                self._retire_singleton_resource(key, previous)
+                # bumped after publishing, so a plan compiled against the old bindings is never cached as current
+                self._generation += 1
+
+    def _build_provider_info[T](
+        self,
+        *,
+        scope: Scope,
+        implementation: type[T],
+        callable_source: Resolvable[T] | None,
+        cache_key: Any,
+        instances: dict[Any, Any],
+        resources: dict[Any, Any],
+        fork_safe: bool = True,
+        blocking: bool = False,
+    ) -> ProviderInfo[T]:
         is_callable = bool(callable_source)
         is_class = not is_callable
         needs_async = False
         provider = None
+        lookup = None
+
+        profiler = get_startup_profiler()
 
-        if is_class:
-            needs_async = self._class_needs_async_resolution(implementation)
+        with profiler.measure('analysis', cache_key) if profiler is not None else nullcontext():
+            if is_class:
+                needs_async = self._class_needs_async_resolution(implementation)
 
-        if is_callable and callable_source is not None:
-            needs_async = self._callable_needs_async_resolution(callable_source)
+            if is_callable and callable_source is not None:
+                needs_async = self._callable_needs_async_resolution(callable_source)
 
         if scope == Scope.SINGLETON:
-            instance_holder = {}
+            # singletons are built and shared by the container that registered them,
+            # children resolving an inherited singleton get the parent's instance
+            # sync singletons are built under a lock of their own (double-checked, so cached reads
+            # never take it): unrelated cold singletons are built in parallel, and a constructor
+            # waiting on another thread resolving from this container doesn't deadlock
+            # async ones can't hold a thread lock across awaits, they publish the build in progress
+            # and concurrent callers (from any thread or event loop) await it instead
+            singleton_key = cache_key
+            construction_lock = ConstructionLock()
+            self._construction_locks.add(construction_lock)
+
+            def lookup_singleton(_container: Container):
+                return instances.get(singleton_key, MISSING)
+
+            lookup = lookup_singleton
 
             if is_class:
                 if needs_async:
 
-                    async def provider_singleton_class_async():
-                        if 'inst' not in instance_holder:
-                            instance_holder['inst'] = await self._construct_async(implementation)
-                        return instance_holder['inst']
+                    async def provider_singleton_class_async(_container: Container):
+                        instance = instances.get(singleton_key, MISSING)
+
+                        if instance is MISSING:
+                            override_cache = self._get_override_cache(singleton_key)
+
+                            if override_cache is not None:
+                                return await self._build_overridden_async(
+                                    override_cache,
+                                    singleton_key,
+                                    lambda: self._construct_async(implementation, blocking),
+                                )
+
+                            instance = await self._build_singleton_async(
+                                construction_lock,
+                                instances,
+                                singleton_key,
+                                lambda: self._construct_async(implementation, blocking),
+                            )
+
+                        return instance
 
                     provider = provider_singleton_class_async
                 else:
 
-                    def provider_singleton_class():
-                        if 'inst' not in instance_holder:
-                            instance_holder['inst'] = self._construct(implementation)
-                        return instance_holder['inst']
+                    def provider_singleton_class(_container: Container):
+                        instance = instances.get(singleton_key, MISSING)
+
+                        if instance is MISSING:
+                            override_cache = self._get_override_cache(singleton_key)
+
+                            if override_cache is not None:
+                                return self._build_overridden(
+                                    override_cache, singleton_key, lambda: self._construct(implementation)
+                                )
+
+                            with construction_lock.lock:
+                                instance = instances.get(singleton_key, MISSING)
+
+                                if instance is MISSING:
+                                    instance = instances[singleton_key] = self._construct(implementation)
+
+                        return instance
 
                     provider = provider_singleton_class
 
             elif is_callable:
-                if needs_async:
+                assert callable_source is not None
 
-                    async def provider_singleton_callable_async():
+                if is_async_generator_callable(callable_source):
+
+                    async def provider_singleton_async_gen(_container: Container):
                         assert callable_source is not None
+                        instance = instances.get(singleton_key, MISSING)
+
+                        if instance is MISSING:
+                            override_cache = self._get_override_cache(singleton_key)
+
+                            if override_cache is not None:
 
-                        if 'inst' not in instance_holder:
-                            params = await self._resolve_func_params_async(callable_source)
+                                async def enter_overridden():
+                                    params = await self._resolve_func_params_async(callable_source)
+                                    ctx = wrap_async_gen_untracked(callable_source, params)
+                                    instance = await ctx.__aenter__()
+                                    override_cache.resources.append(ctx)
+                                    return instance
 
-                            if is_async_callable(callable_source):
-                                instance_holder['inst'] = await callable_source(**params)  # pyright: ignore[reportGeneralTypeIssues]
-                            else:
-                                instance_holder['inst'] = callable_source(**params)
+                                return await self._build_overridden_async(
+                                    override_cache, singleton_key, enter_overridden
+                                )
+
+                            async def enter_async():
+                                params = await self._resolve_func_params_async(callable_source)
+                                ctx = wrap_async_gen_untracked(callable_source, params)
+                                instance = await ctx.__aenter__()
+                                resources[singleton_key] = ctx
+                                return instance
+
+                            instance = await self._build_singleton_async(
+                                construction_lock, instances, singleton_key, enter_async
+                            )
 
-                        return instance_holder['inst']
+                        return instance
+
+                    provider = provider_singleton_async_gen
+
+                elif is_generator_callable(callable_source):
+
+                    def provider_singleton_gen_sync(_container: Container):
+                        assert callable_source is not None
+                        instance = instances.get(singleton_key, MISSING)
+
+                        if instance is MISSING:
+                            override_cache = self._get_override_cache(singleton_key)
+
+                            if override_cache is not None:
+
+                                def enter():
+                                    ctx = wrap_sync_gen(callable_source, self._resolve_func_params(callable_source))
+                                    instance = ctx.__enter__()
+                                    override_cache.resources.append(ctx)
+                                    return instance
+
+                                return self._build_overridden(override_cache, singleton_key, enter)
+
+                            with construction_lock.lock:
+                                instance = instances.get(singleton_key, MISSING)
+
+                                if instance is MISSING:
+                                    params = self._resolve_func_params(callable_source)
+                                    ctx = wrap_sync_gen(callable_source, params)
+                                    instance = instances[singleton_key] = ctx.__enter__()
+                                    resources[singleton_key] = (
+                                        wrap_blocking_exit(ctx, self._run_blocking) if blocking else ctx
+                                    )
+
+                        return instance
+
+                    provider = provider_singleton_gen_sync
+
+                elif needs_async:
+
+                    async def provider_singleton_callable_async(_container: Container):
+                        assert callable_source is not None
+                        instance = instances.get(singleton_key, MISSING)
+
+                        if instance is MISSING:
+                            override_cache = self._get_override_cache(singleton_key)
+
+                            if override_cache is not None:
+                                return await self._build_overridden_async(
+                                    override_cache,
+                                    singleton_key,
+                                    lambda: self._call_async(callable_source, blocking),
+                                )
+
+                            instance = await self._build_singleton_async(
+                                construction_lock,
+                                instances,
+                                singleton_key,
+                                lambda: self._call_async(callable_source, blocking),
+                            )
+
+                        return instance
 
                     provider = provider_singleton_callable_async
                 else:
 
-                    def provider_singleton_callable_sync():
+                    def provider_singleton_callable_sync(_container: Container):
                         assert callable_source is not None
+                        instance = instances.get(singleton_key, MISSING)
+
+                        if instance is MISSING:
+                            override_cache = self._get_override_cache(singleton_key)
+
+                            if override_cache is not None:
+                                return self._build_overridden(
+                                    override_cache,
+                                    singleton_key,
+                                    lambda: callable_source(**self._resolve_func_params(callable_source)),
+                                )
 
-                        if 'inst' not in instance_holder:
-                            params = self._resolve_func_params(callable_source)
-                            instance_holder['inst'] = callable_source(**params)
-                        return instance_holder['inst']
+                            with construction_lock.lock:
+                                instance = instances.get(singleton_key, MISSING)
+
+                                if instance is MISSING:
+                                    params = self._resolve_func_params(callable_source)
+                                    instance = instances[singleton_key] = callable_source(**params)
+
+                        return instance
 
                     provider = provider_singleton_callable_sync
 
@@ -206,163 +497,244 @@ class Container:
             if is_class:
                 if needs_async:
 
-                    async def provider_transient_class_async():
-                        return await self._construct_async(implementation)
+                    async def provider_transient_class_async(container: Container):
+                        return await container._construct_async(implementation, blocking)
 
                     provider = provider_transient_class_async
                 else:
 
-                    def provider_transient_class():
-                        return self._construct(implementation)
+                    def provider_transient_class(container: Container):
+                        return container._construct(implementation)
 
                     provider = provider_transient_class
 
             if is_callable:
                 if needs_async:
 
-                    async def provider_transient_callable_async():
+                    async def provider_transient_callable_async(container: Container):
                         assert callable_source is not None
 
-                        params = await self._resolve_func_params_async(callable_source)
-
-                        if is_async_callable(callable_source):
-                            return await callable_source(**params)  # pyright: ignore[reportGeneralTypeIssues]
-                        else:
-                            return callable_source(**params)
+                        return await container._call_async(callable_source, blocking)
 
                     provider = provider_transient_callable_async
                 else:
 
-                    def provider_transient_callable_sync():
+                    def provider_transient_callable_sync(container: Container):
                         assert callable_source is not None
 
-                        params = self._resolve_func_params(callable_source)
+                        params = container._resolve_func_params(callable_source)
                         return callable_source(**params)
 
                     provider = provider_transient_callable_sync
 
-        elif scope == Scope.REQUEST:
+        elif scope in (Scope.REQUEST, Scope.THREAD, Scope.EVENT_LOOP):
+            if scope == Scope.REQUEST:
+                get_store = RequestScopeService.get_request_store
+                get_key = RequestScopeService.get_request_key
+                context_managers_key = RequestScopeService.CONTEXT_MANAGERS_KEY
+                child_stores_key = RequestScopeService.CHILD_STORES_KEY
+            elif scope == Scope.THREAD:
+                get_store = ThreadScopeService.get_thread_store
+                get_key = ThreadScopeService.get_thread_key
+                context_managers_key = ThreadScopeService.CONTEXT_MANAGERS_KEY
+                child_stores_key = ThreadScopeService.CHILD_STORES_KEY
+            else:
+                get_store = EventLoopScopeService.get_event_loop_store
+                get_key = EventLoopScopeService.get_event_loop_key
+                context_managers_key = EventLoopScopeService.CONTEXT_MANAGERS_KEY
+                child_stores_key = EventLoopScopeService.CHILD_STORES_KEY
+
+            wrap_gen_async = wrap_async_gen_untracked if scope == Scope.EVENT_LOOP else wrap_async_gen
+
+            def lookup_scoped(container: Container):
+                return container._scoped_store(get_store(), child_stores_key).get(get_key(cache_key), MISSING)
+
+            lookup = lookup_scoped
+
             if is_class:
                 if needs_async:
 
-                    async def provider_request_class_async():
-                        store = RequestScopeService.get_request_store()
-                        key = RequestScopeService.get_request_key(abstract)
+                    async def provider_scoped_class_async(container: Container):
+                        store = container._scoped_store(get_store(), child_stores_key)
+                        key = get_key(cache_key)
 
                         if key not in store:
-                            store[key] = await self._construct_async(implementation)
+                            override_cache = container._get_override_cache(cache_key)
+
+                            if override_cache is not None:
+                                return await container._build_overridden_async(
+                                    override_cache,
+                                    cache_key,
+                                    lambda: container._construct_async(implementation, blocking),
+                                )
+
+                            store[key] = await container._construct_async(implementation, blocking)
                         return store[key]
 
-                    provider = provider_request_class_async
+                    provider = provider_scoped_class_async
                 else:
 
-                    def provider_request_class():
-                        store = RequestScopeService.get_request_store()
-                        key = RequestScopeService.get_request_key(abstract)
+                    def provider_scoped_class(container: Container):
+                        store = container._scoped_store(get_store(), child_stores_key)
+                        key = get_key(cache_key)
 
                         if key not in store:
-                            store[key] = self._construct(implementation)
+                            override_cache = container._get_override_cache(cache_key)
+
+                            if override_cache is not None:
+                                return container._build_overridden(
+                                    override_cache, cache_key, lambda: container._construct(implementation)
+                                )
+
+                            store[key] = container._construct(implementation)
                         return store[key]
 
-                    provider = provider_request_class
+                    provider = provider_scoped_class
 
             if is_callable:
                 assert callable_source is not None
 
                 if is_async_generator_callable(callable_source):
 
-                    async def provider_request_async_gen():
+                    async def provider_scoped_async_gen(container: Container):
                         assert callable_source is not None
 
-                        store = RequestScopeService.get_request_store()
-                        key = RequestScopeService.get_request_key(callable_source)
+                        scope_store = get_store()
+                        # teardown belongs to the scope, not to the (possibly collected) child container
+                        store = container._scoped_store(scope_store, child_stores_key)
+                        key = get_key(cache_key)
 
                         if key not in store:
-                            params = await self._resolve_func_params_async(callable_source)
-                            ctx = wrap_async_gen(callable_source, params)
+                            override_cache = container._get_override_cache(cache_key)
+
+                            if override_cache is not None:
+
+                                async def enter_async():
+                                    params = await container._resolve_func_params_async(callable_source)
+                                    ctx = wrap_async_gen_untracked(callable_source, params)
+                                    instance = await ctx.__aenter__()
+                                    override_cache.resources.append(ctx)
+                                    return instance
+
+                                return await container._build_overridden_async(override_cache, cache_key, enter_async)
+
+                            params = await container._resolve_func_params_async(callable_source)
+                            ctx = wrap_gen_async(callable_source, params)
                             store[key] = await ctx.__aenter__()
 
-                            if RequestScopeService.CONTEXT_MANAGERS_KEY not in store:
-                                store[RequestScopeService.CONTEXT_MANAGERS_KEY] = []
+                            if context_managers_key not in scope_store:
+                                scope_store[context_managers_key] = []
 
-                            store[RequestScopeService.CONTEXT_MANAGERS_KEY].append(ctx)
+                            scope_store[context_managers_key].append(ctx)
 
                         return store[key]
 
-                    provider = provider_request_async_gen
+                    provider = provider_scoped_async_gen
 
                 elif is_generator_callable(callable_source):
 
-                    def provider_request_gen_sync():
+                    def provider_scoped_gen_sync(container: Container):
                         assert callable_source is not None
 
-                        store = RequestScopeService.get_request_store()
-                        key = RequestScopeService.get_request_key(callable_source)
+                        scope_store = get_store()
+                        # teardown belongs to the scope, not to the (possibly collected) child container
+                        store = container._scoped_store(scope_store, child_stores_key)
+                        key = get_key(cache_key)
 
                         if key not in store:
-                            params = self._resolve_func_params(callable_source)
+                            override_cache = container._get_override_cache(cache_key)
+
+                            if override_cache is not None:
+
+                                def enter():
+                                    ctx = wrap_sync_gen(
+                                        callable_source, container._resolve_func_params(callable_source)
+                                    )
+                                    instance = ctx.__enter__()
+                                    override_cache.resources.append(ctx)
+                                    return instance
+
+                                return container._build_overridden(override_cache, cache_key, enter)
+
+                            params = container._resolve_func_params(callable_source)
                             ctx = wrap_sync_gen(callable_source, params)
                             store[key] = ctx.__enter__()
 
-                            if RequestScopeService.CONTEXT_MANAGERS_KEY not in store:
-                                store[RequestScopeService.CONTEXT_MANAGERS_KEY] = []
+                            if context_managers_key not in scope_store:
+                                scope_store[context_managers_key] = []
 
-                            store[RequestScopeService.CONTEXT_MANAGERS_KEY].append(ctx)
+                            scope_store[context_managers_key].append(
+                                wrap_blocking_exit(ctx, self._run_blocking) if blocking else ctx
+                            )
 
                         return store[key]
 
-                    provider = provider_request_gen_sync
+                    provider = provider_scoped_gen_sync
 
                 elif needs_async:
 
-                    async def provider_request_callable_async():
+                    async def provider_scoped_callable_async(container: Container):
                         assert callable_source is not None
 
-                        store = RequestScopeService.get_request_store()
-                        key = RequestScopeService.get_request_key(callable_source)
+                        store = container._scoped_store(get_store(), child_stores_key)
+                        key = get_key(cache_key)
 
                         if key not in store:
-                            params = await self._resolve_func_params_async(callable_source)
+                            override_cache = container._get_override_cache(cache_key)
+
+                            if override_cache is not None:
+                                return await container._build_overridden_async(
+                                    override_cache, cache_key, lambda: container._call_async(callable_source, blocking)
+                                )
 
-                            if is_async_callable(callable_source):
-                                store[key] = await callable_source(**params)  # pyright: ignore[reportGeneralTypeIssues]
-                            else:
-                                store[key] = callable_source(**params)
+                            store[key] = await container._call_async(callable_source, blocking)
 
                         return store[key]
 
-                    provider = provider_request_callable_async
+                    provider = provider_scoped_callable_async
 
                 else:
 
-                    def provider_request_callable_sync():
+                    def provider_scoped_callable_sync(container: Container):
                         assert callable_source is not None
 
-                        store = RequestScopeService.get_request_store()
-                        key = RequestScopeService.get_request_key(callable_source)
+                        store = container._scoped_store(get_store(), child_stores_key)
+                        key = get_key(cache_key)
 
                         if key not in store:
-                            params = self._resolve_func_params(callable_source)
+                            override_cache = container._get_override_cache(cache_key)
+
+                            if override_cache is not None:
+                                return container._build_overridden(
+                                    override_cache,
+                                    cache_key,
+                                    lambda: callable_source(**container._resolve_func_params(callable_source)),
+                                )
+
+                            params = container._resolve_func_params(callable_source)
                             store[key] = callable_source(**params)
                         return store[key]
 
-                    provider = provider_request_callable_sync
+                    provider = provider_scoped_callable_sync
 
-        key = abstract or callable_source
         impl = callable_source if is_callable else implementation
 
         if provider is None:
-            raise RuntimeError(f'Cannot register {key=}, {impl=}: no provider found')
-
-        assert key is not None
-
-        for item in [key, *(aliases or [])]:
-            self._providers[item] = ProviderInfo(
-                provider=provider,
-                source=impl,
-                scope=scope,
-                needs_async=needs_async,
-            )
+            raise RuntimeError(f'Cannot register {cache_key=}, {impl=}: no provider found')
+
+        return ProviderInfo(
+            provider=provider,
+            source=impl,
+            scope=scope,
+            needs_async=needs_async,
+            is_async=is_async_callable(provider),
+            is_generator=is_generator_callable(impl) or is_async_generator_callable(impl),
+            fork_safe=fork_safe,
+            # providers with asynchronous dependencies resolve them on the loop and only send
+            # the blocking call to the executor, see `_call_async` / `_construct_async`
+            blocking=blocking and not needs_async,
+            lookup=lookup,
+        )
 
     def get[T](self, abstract: ProviderSource[T]) -> T:
         """Function used to resolve some dependency manually.
@@ -373,14 +745,17 @@ class Container:
             ```
         """
 
-        provider = self._get_provider(abstract)
+        provider_info = self._get_required_provider_info(abstract)
 
-        if is_async_callable(provider):
+        if provider_info.is_async:
             raise UnexpectedCoroutineError(f'Provider for {abstract} is asynchronous, use get_async instead.')
 
-        sync_provider = cast(Callable[[], T], provider)
+        if self._observers:
+            return self._resolve_observed(abstract, provider_info)
 
-        return sync_provider()
+        sync_provider = cast(Callable[[Container], T], provider_info.provider)
+
+        return sync_provider(self)
 
     async def get_async[T](self, abstract: ProviderSource[T]) -> T:
         """Function used to resolve some asynchronous dependency manually.
@@ -391,15 +766,523 @@ class Container:
             ```
         """
 
-        provider = cast(Callable[[], T], self._get_provider(abstract))
+        provider_info = self._get_required_provider_info(abstract)
+
+        if self._observers:
+            return await self._resolve_observed_async(abstract, provider_info)
+
+        cached = self._get_cached(provider_info)
+
+        # already built instances are returned without creating a coroutine for the provider
+        if cached is not MISSING:
+            return cached
+
+        if provider_info.blocking:
+            return await self._run_blocking(provider_info.provider, self)
+
+        provider = cast(Callable[[Container], T], provider_info.provider)
+
+        result = provider(self)
+
+        if inspect.iscoroutine(result):
+            return await result
+
+        return result
+
+    def _resolve_observed(self, source: ProviderSource, provider_info: ProviderInfo) -> Any:
+        observers = self._observers
+        cached = self._get_cached(provider_info)
+
+        if cached is not MISSING:
+            for observer in observers:
+                observer.on_hit(source, provider_info)
+
+            return cached
+
+        states = [observer.on_start(source, provider_info) for observer in observers]
+        error = None
+
+        try:
+            return provider_info.provider(self)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            for observer, state in zip(reversed(observers), reversed(states)):
+                observer.on_end(source, provider_info, state, error)
+
+    async def _resolve_observed_async(self, source: ProviderSource, provider_info: ProviderInfo) -> Any:
+        observers = self._observers
+        cached = self._get_cached(provider_info)
+
+        if cached is not MISSING:
+            for observer in observers:
+                observer.on_hit(source, provider_info)
+
+            return cached
+
+        states = [observer.on_start(source, provider_info) for observer in observers]
+        error = None
+
+        try:
+            return await self._create_async(provider_info)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            for observer, state in zip(reversed(observers), reversed(states)):
+                observer.on_end(source, provider_info, state, error)
+
+    def _get_override_cache(self, singleton_key: Any) -> OverrideCache | None:
+        """Context-local cache for a cold singleton or scoped instance depending on an active override.
+
+        None when there is none. Such instances are built for the override block only,
+        caching them in the container or in a thread / event loop store would leak the
+        override into other contexts and past the block.
+        """
+
+        cache = OVERRIDE_CACHE.get()
+
+        if cache is None:
+            return None
+
+        key = (self, singleton_key)
+        affected = cache.affected.get(key)
+
+        if affected is None:
+            overridden: set[Any] = set()
+            layer: Container | None = self
+
+            while layer is not None:
+                overridden.update(layer._overrides.get() or ())
+                layer = layer._parent
+
+            affected = cache.affected[key] = not overridden.isdisjoint(self._collect_dependencies(singleton_key))
+
+        return cache if affected else None
+
+    def _build_overridden(self, cache: OverrideCache, singleton_key: Any, build: Callable[[], Any]) -> Any:
+        instance = cache.instances.get((self, singleton_key), MISSING)
+
+        if instance is MISSING:
+            instance = cache.instances[(self, singleton_key)] = build()
+
+        return instance
+
+    async def _build_overridden_async(
+        self, cache: OverrideCache, singleton_key: Any, build: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        instance = cache.instances.get((self, singleton_key), MISSING)
+
+        if instance is MISSING:
+            instance = cache.instances[(self, singleton_key)] = await build()
+
+        return instance
+
+    async def _build_singleton_async(
+        self,
+        construction_lock: ConstructionLock,
+        instances: dict[Any, Any],
+        singleton_key: Any,
+        build: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Builds a cold asynchronous singleton once, whatever threads and event loops resolve it concurrently.
+
+        The first caller builds it while the others wait on a `concurrent.futures.Future`
+        (awaitable from any loop), then look again: a failed or cancelled build is retried
+        by the next caller, like a synchronous one released by its lock.
+        """
+
+        import asyncio
+        from concurrent.futures import Future
+
+        while True:
+            with construction_lock.lock:
+                instance = instances.get(singleton_key, MISSING)
+
+                if instance is not MISSING:
+                    return instance
+
+                pending = construction_lock.pending
+                building = pending is None
+
+                if pending is None:
+                    pending = construction_lock.pending = Future()
+
+            if not building:
+                # shielded, a cancelled waiter must not cancel the build it waits for
+                await asyncio.shield(asyncio.wrap_future(pending))
+                continue
+
+            try:
+                instance = instances[singleton_key] = await build()
+                return instance
+            finally:
+                with construction_lock.lock:
+                    construction_lock.pending = None
+
+                pending.set_result(None)
+
+    async def _call_async(self, func: Resolvable[Any], blocking: bool = False) -> Any:
+        params = await self._resolve_func_params_async(func)
+
+        if is_async_callable(func):
+            return await func(**params)  # pyright: ignore[reportGeneralTypeIssues]
+
+        if blocking:
+            # the asynchronous dependencies are resolved on the loop, only the call leaves it
+            return await self._run_blocking(lambda: func(**params))
+
+        return func(**params)
 
-        result = provider()
+    async def _create_async(self, provider_info: ProviderInfo) -> Any:
+        if provider_info.blocking:
+            return await self._run_blocking(provider_info.provider, self)
+
+        result = provider_info.provider(self)
 
         if inspect.iscoroutine(result):
             return await result
 
         return result
 
+    def get_many(self, *sources: ProviderSource) -> tuple[Any, ...]:
+        """Resolves several dependencies at once, returning them in the given order.
+
+        Shared non-transient dependencies are built once and reused by every root.
+
+        ### Example:
+            ```python
+            user_service, role_service = container.get_many(UserService, RoleService)
+            ```
+        """
+
+        return tuple([self.get(source) for source in sources])
+
+    async def get_many_async(self, *sources: ProviderSource) -> tuple[Any, ...]:
+        """Asynchronous version of `get_many`.
+
+        The roots are resolved with a merged plan: asynchronous non-transient dependencies
+        shared between them are built once, level by level, and independent branches of
+        the same level are awaited concurrently.
+
+        ### Example:
+            ```python
+            user_service, role_service = await container.get_many_async(UserService, RoleService)
+            ```
+        """
+
+        import asyncio
+
+        for group in self._get_batch_plan(sources):
+            if len(group) == 1:
+                await self.get_async(group[0])
+            else:
+                await asyncio.gather(*[self.get_async(source) for source in group])
+
+        if len(sources) == 1:
+            return (await self.get_async(sources[0]),)
+
+        return tuple(await asyncio.gather(*[self.get_async(source) for source in sources]))
+
+    def child(self) -> 'Container':
+        """Creates a child container that falls back to this one for every binding it doesn't override.
+
+        Creating a child is O(1): bindings are not copied, lookups fall through to the parent.
+        Singletons registered in the parent are shared with every child, while inherited
+        TRANSIENT/REQUEST/THREAD/EVENT_LOOP providers resolved through the child use its overrides.
+        Overrides must keep the sync/async nature of the provider they replace.
+
+        ### Example:
+            ```python
+            tenant = container.child()
+            tenant.bind(abstract=Engine, source=tenant_engine, scope=Scope.REQUEST)
+
+            user_service = tenant.get(UserService)
+            ```
+        """
+
+        child = type(self)(blocking=self._blocking, executor=self._executor)
+        child._parent = self
+        child._introspection = self._introspection
+        child._wiring = self._wiring
+        return child
+
+    def spec(self, path: str | None = None) -> 'ContainerSpec':
+        """Returns a picklable `ContainerSpec` used to rebuild this container in worker processes.
+
+        Every provider, abstract and alias must be importable (defined at module level).
+
+        Args:
+            path: Import path (`'module:attribute'`) of this container. Workers import it, so
+                functions decorated with `inject` in that module use the rebuilt container.
+                When None, workers create a new container from the bindings.
+
+        ### Example:
+            ```python
+            spec = container.spec('app.di:DI')
+
+            pool = ProcessPoolExecutor(initializer=ProcessPoolService.initializer, initargs=(spec,))
+            ```
+        """
+
+        from depin._internal.process_pool import ContainerSpec
+
+        return ContainerSpec.from_container(self, path)
+
+    @contextmanager
+    def profile(self, profile: 'ResolutionProfile | None' = None) -> Iterator['ResolutionProfile']:
+        """Records construction counts and times of providers resolved through this container.
+
+        Cache hits are not recorded. Meant for profiling runs (e.g. a test suite or a load
+        test) whose result can annotate `graph` or be exported with `to_collapsed`. Pass the
+        profile of a previous run to keep aggregating into it.
+
+        ### Example:
+            ```python
+            with container.profile() as profile:
+                run_smoke_tests()
+
+            print(container.graph(profile).to_dot())
+            ```
+        """
+
+        from depin._internal.profiling import ResolutionProfile
+
+        profile = profile if profile is not None else ResolutionProfile()
+        self.add_observer(profile)
+
+        try:
+            yield profile
+        finally:
+            self.remove_observer(profile)
+
+    def add_observer(self, observer: 'ResolutionObserver') -> None:
+        """Installs a `ResolutionObserver` called around every resolution through this container.
+
+        Observers are not inherited by child containers. Without observers the resolution
+        path only pays a truthiness check.
+        """
+
+        with self._lock:
+            self._observers = (*self._observers, observer)
+
+    def remove_observer(self, observer: 'ResolutionObserver') -> None:
+        with self._lock:
+            self._observers = tuple(item for item in self._observers if item is not observer)
+
+    def graph(self, profile: 'ResolutionProfile | None' = None) -> 'DependencyGraph':
+        """Returns the providers visible from this container and their dependencies.
+
+        Nodes carry scope and async-ness, and construction counts and times when a
+        `profile` is given. Export with `to_dot()` (Graphviz) or `to_json()`.
+
+        ### Example:
+            ```python
+            Path('graph.dot').write_text(container.graph().to_dot())
+            ```
+        """
+
+        from depin._internal.graph import build_graph
+
+        return build_graph(self, profile)
+
+    def check(self) -> list['GraphIssue']:
+        """Validates the dependency graph without instantiating anything.
+
+        Reports missing providers, cycles, providers capturing dependencies of a shorter
+        scope (e.g. a SINGLETON holding a REQUEST session) as errors, and synchronous
+        SINGLETON/THREAD providers depending on async ones as warnings.
+        Also available as `python -m depin check module:container`.
+
+        ### Example:
+            ```python
+            for issue in container.check():
+                print(issue)
+            ```
+        """
+
+        from depin._internal.check import check_container
+
+        return check_container(self)
+
+    def cache_info(self) -> CacheInfo:
+        """Returns hit/miss statistics of the signature and type hint cache.
+
+        The cache is shared by a container and its children. It holds inspected callables
+        weakly, so registering lambdas or generated classes doesn't keep them alive.
+        """
+
+        return self._introspection.cache_info()
+
+    def wiring_info(self) -> 'WiringInfo | None':
+        """Returns how many providers the generated wiring module covers and which entries are stale.
+
+        None when the container was created without `wiring`.
+        """
+
+        return self._wiring.info() if self._wiring is not None else None
+
+    def override(
+        self,
+        abstract: ProviderSource,
+        source: ProviderSource | None = None,
+        scope: Scope | None = None,
+        *,
+        value: Any = MISSING,
+    ) -> ProviderOverride:
+        """Overrides a registered provider for the current context only.
+
+        Works with both `with` and `async with`. The override is visible to the current
+        thread / asyncio task (and the tasks it spawns) until the block exits, other
+        contexts keep resolving the registered provider. `source` is a class or a factory,
+        built with the overridden provider's scope unless `scope` is given, `value` an
+        instance returned as is. Instances built before the override keep their dependencies,
+        singletons and scoped instances depending on it that are first resolved inside the
+        block are built for the block only.
+
+        ### Example:
+            ```python
+            with container.override(Engine, FakeEngine):
+                repo = container.get(UserRepo)  # built with FakeEngine
+
+            async with container.override(Settings, value=Settings(debug=True)):
+                ...
+            ```
+        """
+
+        overridden = self._get_provider_info(abstract)
+
+        if overridden is None:
+            raise MissingProviderError(f'Provider for {abstract} not registered')
+
+        if (source is None) == (value is MISSING):
+            raise ValueError('Pass either a source or a value to override')
+
+        if value is not MISSING:
+            source, scope = (lambda: value), Scope.TRANSIENT
+        elif not callable(source):
+            raise TypeError(f'Override source {source!r} is not a class or a factory, pass instances as `value=`')
+
+        scope = scope or overridden.scope
+        self._check_scope_supports(source, scope)
+
+        resources: dict[Any, Any] = {}
+        provider_info = self._build_provider_info(
+            scope=scope,
+            implementation=source if isinstance(source, type) else None,  # type: ignore[arg-type]
+            callable_source=None if isinstance(source, type) else source,
+            # a dedicated key keeps the override's instances apart from the registered provider's
+            cache_key=object(),
+            instances={},
+            resources=resources,
+        )
+
+        return ProviderOverride(self._overrides, abstract, provider_info, resources)
+
+    def warm(self, *sources: ProviderSource) -> None:
+        """Eagerly builds singletons, all synchronous SINGLETON providers when no source is given.
+
+        Warming fork-safe singletons in a prefork master (before the workers are forked) builds
+        them once and lets every worker share them copy-on-write.
+
+        ### Example:
+            ```python
+            container.warm(Settings, load_model)
+            ```
+        """
+
+        profiler = get_startup_profiler()
+
+        for source in sources or self._singleton_sources(include_async=False):
+            with profiler.measure('construction', source) if profiler is not None else nullcontext():
+                self.get(source)
+
+    async def warm_async(self, *sources: ProviderSource) -> None:
+        """Asynchronous version of `warm`, also builds asynchronous SINGLETON providers."""
+
+        profiler = get_startup_profiler()
+
+        for source in sources or self._singleton_sources(include_async=True):
+            with profiler.measure('construction', source) if profiler is not None else nullcontext():
+                await self.get_async(source)
+
+    def close(self) -> None:
+        """Tears down SINGLETON generator providers in reverse creation order.
+
+        Raises `RuntimeError` when an asynchronous resource is open, use `aclose` instead.
+        """
+
+        self._check_sync_resources(self._singleton_resources, 'aclose')
+        self._exit_resources(self._pop_singleton_resources(list(self._singleton_resources)))
+
+    async def aclose(self) -> None:
+        """Tears down SINGLETON generator providers in reverse dependency order.
+
+        Resources are closed only after everything depending on them is closed,
+        resources independent of each other are closed concurrently.
+
+        ### Example:
+            ```python
+            @container.register(Scope.SINGLETON)
+            async def db_pool():
+                async with create_pool() as pool:
+                    yield pool
+
+            await container.aclose()
+            ```
+        """
+
+        await self._exit_resources_async(self._pop_singleton_resources(list(self._singleton_resources)))
+
+    def snapshot(self) -> ContainerSnapshot:
+        """Captures the bindings and singleton instances of this container.
+
+        Only the mappings are copied, providers and instances are shared with the snapshot,
+        so taking and restoring one is cheap even for large graphs.
+
+        ### Example:
+            ```python
+            @pytest.fixture(scope='session')
+            def warmed_container():
+                container.warm()
+                return container.snapshot()
+
+            @pytest.fixture(autouse=True)
+            def clean_container(warmed_container):
+                yield
+                container.restore(warmed_container)
+            ```
+        """
+
+        with self._lock:
+            return ContainerSnapshot(
+                providers=dict(self._providers),
+                singletons=dict(self._singletons),
+                singleton_resources=dict(self._singleton_resources),
+            )
+
+    def restore(self, snapshot: ContainerSnapshot) -> None:
+        """Restores the state captured by `snapshot`.
+
+        SINGLETON resources opened after the snapshot are torn down, raises `RuntimeError`
+        when one of them is asynchronous, use `arestore` instead.
+        """
+
+        opened = self._opened_since(snapshot)
+
+        self._check_sync_resources({source: self._singleton_resources[source] for source in opened}, 'arestore')
+        self._exit_resources(self._pop_singleton_resources(opened))
+        self._restore(snapshot)
+
+    async def arestore(self, snapshot: ContainerSnapshot) -> None:
+        """Asynchronous version of `restore`."""
+
+        opened = self._opened_since(snapshot)
+
+        await self._exit_resources_async(self._pop_singleton_resources(opened))
+        self._restore(snapshot)
+
     def inject[T, **K](self, func: Callable[K, T]) -> Callable[K, T]:
         """Decorator used to inject dependencies into function/method parameters.
 
@@ -411,8 +1294,8 @@ class Container:
             ```
         """
 
-        signature = get_cached_signature(func)
-        type_hints = get_cached_type_hints(func)
+        signature = self._introspection.signature(func)
+        type_hints = self._introspection.type_hints(func)
 
         injectable_params = set()
 
@@ -445,13 +1328,13 @@ class Container:
                             default: ProviderDependency = signature.parameters[param_name].default
                             source = default.provider_source
 
-                        provider = self._get_provider(source)
+                        provider_info = self._get_required_provider_info(source)
 
-                        if is_async_callable(provider):
+                        if provider_info.is_async:
                             raise RuntimeError(
                                 f'Async dependencies not supported in sync functions.'
                                 ' The dependency probably has async arguments in its signature.'
-                                f'{param_name=} {source=} {provider=}'
+                                f'{param_name=} {source=} provider={provider_info.provider}'
                             )
 
                         bound.arguments[param_name] = self.get(source)
@@ -459,6 +1342,8 @@ class Container:
                 return func(*bound.args, **bound.kwargs)
 
             sync_wrapper.__name__ = func.__name__
+            sync_wrapper.__qualname__ = func.__qualname__
+            sync_wrapper.__module__ = func.__module__
             sync_wrapper.__doc__ = func.__doc__
             sync_wrapper.__annotations__ = func.__annotations__
             return sync_wrapper
@@ -481,6 +1366,8 @@ class Container:
                 return await func(*bound.args, **bound.kwargs)  # pyright: ignore[reportGeneralTypeIssues]
 
             async_wrapper.__name__ = func.__name__
+            async_wrapper.__qualname__ = func.__qualname__
+            async_wrapper.__module__ = func.__module__
             async_wrapper.__doc__ = func.__doc__
             async_wrapper.__annotations__ = func.__annotations__
             return async_wrapper  # pyright: ignore[reportReturnType]
@@ -488,6 +1375,9 @@ class Container:
     def Depends(self, t: ProviderSource):
         """Wrapper used to convert some dependency to be used in FastAPI.
 
+        The wrapped dependency callable is created once per provider and container, so
+        FastAPI's per-request dependency cache dedupes every usage of the same provider.
+
         Args:
             t: Dependency to be used in FastAPI.
 
@@ -499,147 +1389,203 @@ class Container:
             ```
         """
 
-        async def _dep():
-            return await self.get_async(t)
+        # FastAPI is only imported when the integration is actually used
+        from depin.extensions.fastapi import depends
+
+        return depends(self, t)
+
+    def flatten_depends[**P, T](self, func: Callable[P, T]) -> Callable[P, T]:
+        """Decorator merging a FastAPI route's `Container.Depends` parameters into a single dependency.
 
-        return Depends(_dep)
+        FastAPI then solves one dependency per request instead of one per parameter, and
+        every value is resolved in one call (cached instances directly, the rest with
+        `get_many_async`). Must be applied below the route decorator.
+
+        ### Example:
+            ```python
+            @app.get('/user')
+            @container.flatten_depends
+            async def get_user(
+                user_service: UserService = container.Depends(UserService),
+                role_service: RoleService = container.Depends(RoleService),
+            ): ...
+            ```
+        """
+
+        from depin.extensions.fastapi import flatten_depends
+
+        return flatten_depends(self, func)
 
     def _resolve_func_params[T](self, func: Resolvable[T]) -> dict[str, Any]:
-        signature = get_cached_signature(func)
-        type_hints = get_cached_type_hints(func)
+        return {name: self.get(source) for name, source in self._get_plan(func)}
+
+    async def _resolve_func_params_async[T](self, func: Resolvable[T]) -> dict[str, Any]:
+        return {name: await self.get_async(source) for name, source in self._get_plan(func)}
+
+    def _construct[T](self, cls: type[T]):
         kwargs = {}
 
-        for name, param in signature.parameters.items():
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
+        for name, source in self._get_plan(cls):
+            resolved = self.get(source)
 
-            param_type = type_hints.get(name)
+            if inspect.iscoroutine(resolved):
+                raise UnexpectedCoroutineError(
+                    f"Parameter '{name}' of class {cls.__name__} depends on an asynchronous provider. "
+                    f'This is not allowed in SINGLETON/TRANSIENT scope with synchronous classes. '
+                    f'Consider using scope=Scope.REQUEST or making all dependencies synchronous.'
+                )
 
-            if param.default and isinstance(param.default, ProviderDependency):
-                resolved = self.get(param.default.provider_source)
-                kwargs[name] = resolved
+            kwargs[name] = resolved
 
-            elif param_type and self._has_provider_for(param_type):
-                resolved = self.get(param_type)
-                kwargs[name] = resolved
+        return cls(**kwargs)
 
-            else:
-                if param.default is not INSPECT_EMPTY:
-                    pass
-                else:
-                    raise MissingProviderError(
-                        f"Cannot resolve parameter '{name}' (type: {param_type}) for {func}. "
-                        'Missing provider or default value.'
-                    )
+    async def _construct_async[T](self, cls: type[T], blocking: bool = False):
+        kwargs = {name: await self.get_async(source) for name, source in self._get_plan(cls)}
 
-        return kwargs
+        if blocking:
+            return await self._run_blocking(lambda: cls(**kwargs))
 
-    async def _resolve_func_params_async[T](self, func: Resolvable[T]) -> dict[str, Any]:
-        signature = get_cached_signature(func)
-        type_hints = get_cached_type_hints(func)
-        kwargs = {}
+        return cls(**kwargs)
 
-        for name, param in signature.parameters.items():
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
+    def _get_plan(self, source: ProviderSource) -> tuple[tuple[str, ProviderSource], ...]:
+        """Parameters to inject into `source`, compiled once per registry version of this layer."""
 
-            param_type = type_hints.get(name)
+        version = self._registry_version()
+        cached = self._plans.get(source)
 
-            if param.default and isinstance(param.default, ProviderDependency):
-                resolved = await self.get_async(param.default.provider_source)
-                kwargs[name] = resolved
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
-            elif param_type and self._has_provider_for(param_type):
-                resolved = await self.get_async(param_type)
-                kwargs[name] = resolved
+        plan = self._compile_plan(source)
+        self._plans[source] = (version, plan)
 
-            else:
-                if param.default is not INSPECT_EMPTY:
-                    pass
-                else:
-                    raise MissingProviderError(
-                        f"Cannot resolve parameter '{name}' (type: {param_type}) for {func}. "
-                        'Missing provider or default value.'
-                    )
+        return plan
 
-        return kwargs
+    def _compile_plan(self, source: ProviderSource, strict: bool = True) -> tuple[tuple[str, ProviderSource], ...]:
+        plan = []
 
-    def _construct[T](self, cls: type[T]):
-        signature = get_cached_signature(cls.__init__)
-        type_hints = get_cached_type_hints(cls.__init__)
-        kwargs = {}
+        for name, dependency, inject, required in self._get_parameters(source):
+            if inject:
+                plan.append((name, dependency))
 
-        for name, param in signature.parameters.items():
-            if name == 'self':
-                continue
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
+            elif dependency and self._has_provider_for(dependency):
+                plan.append((name, dependency))
 
-            param_type = type_hints.get(name)
+            elif strict and required:
+                raise MissingProviderError(
+                    f"Cannot resolve parameter '{name}' (type: {dependency}) for {source}. "
+                    'Missing provider or default value.'
+                )
 
-            if param.default and isinstance(param.default, ProviderDependency):
-                resolved = self.get(param.default.provider_source)
+        return tuple(plan)
 
-                if inspect.iscoroutine(resolved):
-                    raise UnexpectedCoroutineError(
-                        f"Parameter '{name}' of class {cls.__name__} depends on an asynchronous provider. "
-                        f'This is not allowed in SINGLETON/TRANSIENT scope with synchronous classes. '
-                        f'Consider using scope=Scope.REQUEST or making all dependencies synchronous.'
-                    )
+    @staticmethod
+    def _load_wiring(module: str) -> 'Wiring':
+        from depin._internal.wiring import Wiring
 
-                kwargs[name] = resolved
+        return Wiring.load(module)
 
-            elif param_type and self._has_provider_for(param_type):
-                resolved = self.get(param_type)
+    def _get_parameters(self, source: ProviderSource) -> tuple[Parameter, ...]:
+        if self._wiring is not None:
+            parameters = self._wiring.get(source)
 
-                if inspect.iscoroutine(resolved):
-                    raise UnexpectedCoroutineError(
-                        f"Parameter '{name}' (type {param_type.__name__}) of class {cls.__name__} "
-                        f'depends on an asynchronous provider. '
-                        f'This is not allowed in SINGLETON/TRANSIENT scope with synchronous classes. '
-                        f'Consider using scope=Scope.REQUEST or making all dependencies synchronous.'
-                    )
+            if parameters is not None:
+                return parameters
 
-                kwargs[name] = resolved
-            else:
-                if param.default is not INSPECT_EMPTY:
-                    pass
-                else:
-                    raise MissingProviderError(
-                        f"Cannot resolve parameter '{name}' (type: {param_type}) for {cls}. "
-                        'Missing provider or default value.'
-                    )
+        return inspect_parameters(self._introspection, source)
 
-        return cls(**kwargs)
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        import asyncio
 
-    async def _construct_async[T](self, cls: type[T]):
-        signature = get_cached_signature(cls.__init__)
-        type_hints = get_cached_type_hints(cls.__init__)
-        kwargs = {}
+        # the copied context keeps request/override lookups working inside the worker thread
+        context = copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, context.run, func, *args)
 
-        for name, param in signature.parameters.items():
-            if name == 'self':
-                continue
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
+    def _get_batch_plan(self, sources: tuple[ProviderSource, ...]) -> tuple[tuple[ProviderSource, ...], ...]:
+        version = self._registry_version()
+        cached = self._batch_plans.get(sources)
 
-            param_type = type_hints.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
-            if param.default and isinstance(param.default, ProviderDependency):
-                kwargs[name] = await self.get_async(param.default.provider_source)
+        plan = self._compile_batch_plan(sources)
+        self._batch_plans[sources] = (version, plan)
 
-            elif param_type and self._has_provider_for(param_type):
-                kwargs[name] = await self.get_async(param_type)
+        return plan
+
+    def _compile_batch_plan(self, sources: tuple[ProviderSource, ...]) -> tuple[tuple[ProviderSource, ...], ...]:
+        """Groups the async, cached (non-transient) dependencies of `sources` by level.
+
+        Every group only depends on groups before it, so the members of a group can be
+        resolved concurrently once the previous groups are resolved.
+        """
+
+        levels: dict[ProviderSource, int] = {}
+        highest: dict[ProviderSource, int] = {}
+
+        def visit(source: ProviderSource, visiting: set[ProviderSource]) -> int:
+            if source in highest:
+                return highest[source]
+
+            if source in visiting:
+                return -1
+
+            visiting.add(source)
+            provider_info = self._get_provider_info(source)
+            implementation = provider_info.source if provider_info else source
+            below = max((visit(d, visiting) for d in self._get_dependency_sources(implementation)), default=-1)
+            visiting.discard(source)
+
+            if provider_info is not None and provider_info.needs_async and provider_info.scope != Scope.TRANSIENT:
+                levels[source] = highest[source] = below + 1
             else:
-                if param.default is not INSPECT_EMPTY:
-                    pass
-                else:
-                    raise MissingProviderError(
-                        f"Cannot resolve parameter '{name}' (type: {param_type}) for {cls}. "
-                        'Missing provider or default value.'
-                    )
+                highest[source] = below
 
-        return cls(**kwargs)
+            return highest[source]
+
+        for source in sources:
+            visit(source, set())
+
+        groups: list[list[ProviderSource]] = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+
+        for source, level in levels.items():
+            groups[level].append(source)
+
+        return tuple(tuple(group) for group in groups)
+
+    def _registry_version(self) -> int:
+        # generations only grow, so the sum changes whenever any layer of the chain is re-bound
+        version = self._generation
+        parent = self._parent
+
+        while parent is not None:
+            version += parent._generation
+            parent = parent._parent
+
+        return version
+
+    def _scoped_store(self, store: dict[Any, Any], child_stores_key: str) -> dict[Any, Any]:
+        """The part of a REQUEST/THREAD/EVENT_LOOP store holding this container's instances.
+
+        Children resolve inherited providers with their own overrides, so they can't share
+        the parent's instances. Theirs live in sub-stores keyed weakly by the child, thread
+        and event loop stores outlive most children and must not keep them alive.
+        """
+
+        if self._parent is None:
+            return store
+
+        child_stores = store.get(child_stores_key)
+
+        if child_stores is None:
+            child_stores = store[child_stores_key] = weakref.WeakKeyDictionary()
+
+        child_store = child_stores.get(self)
+
+        if child_store is None:
+            child_store = child_stores[self] = {}
+
+        return child_store
 
     def _class_needs_async_resolution[T](self, cls: type[T]) -> bool:
         return self._class_needs_async_resolution_recursive(cls, {cls: True})
@@ -661,28 +1607,19 @@ class Container:
         visited[source] = True
 
         try:
-            if not self._has_provider_for(source):
-                if isinstance(source, type):
-                    try:
-                        get_cached_signature(source.__init__)
-                        get_cached_type_hints(source.__init__)
-                    except (TypeError, AttributeError):
-                        return False
-
-                elif callable(source):
-                    try:
-                        get_cached_signature(source)
-                        get_cached_type_hints(source)
-                    except (TypeError, AttributeError):
-                        return False
-
-            if self._has_provider_for(source):
-                provider_info = self._providers[source]
+            if not self._has_provider_for(source) and (isinstance(source, type) or callable(source)):
+                try:
+                    self._get_parameters(source)
+                except (TypeError, AttributeError):
+                    return False
+
+            provider_info = self._get_provider_info(source)
 
+            if provider_info is not None:
                 if provider_info.needs_async:
                     return True
 
-                if is_async_callable(provider_info.provider):
+                if provider_info.is_async:
                     return True
 
             if isinstance(source, type):
@@ -703,22 +1640,13 @@ class Container:
         visited: dict[Any, Literal[True]],
     ) -> bool:
         try:
-            signature = get_cached_signature(func)
-            type_hints = get_cached_type_hints(func)
+            parameters = self._get_parameters(func)
         except (TypeError, AttributeError):
             return False
 
-        for name, param in signature.parameters.items():
-            param_type = type_hints.get(name, None)
-
-            if param.default and isinstance(param.default, ProviderDependency):
-                dep = param.default.provider_source
-                if self._source_needs_async_recursive(dep, visited):
-                    return True
-
-            elif param_type:
-                if self._source_needs_async_recursive(param_type, visited):
-                    return True
+        for _, dependency, _, _ in parameters:
+            if dependency and self._source_needs_async_recursive(dependency, visited):
+                return True
 
         return False
 
@@ -728,40 +1656,222 @@ class Container:
         visited: dict[Any, Literal[True]],
     ) -> bool:
         try:
-            signature = get_cached_signature(cls.__init__)
-            type_hints = get_cached_type_hints(cls.__init__)
+            parameters = self._get_parameters(cls)
         except (TypeError, AttributeError):
             return False
 
-        for name, param in signature.parameters.items():
-            if name == 'self':
-                continue
+        for _, dependency, _, _ in parameters:
+            if dependency and self._source_needs_async_recursive(dependency, visited):
+                return True
 
-            param_type = type_hints.get(name, None)
+        return False
 
-            if param.default and isinstance(param.default, ProviderDependency):
-                dep = param.default.provider_source
-                if self._source_needs_async_recursive(dep, visited):
-                    return True
+    def _opened_since(self, snapshot: ContainerSnapshot) -> list[ProviderSource]:
+        # compared by identity: a resource may have been retired (re-keyed), or its source re-bound and rebuilt
+        kept = {id(ctx) for ctx in snapshot.singleton_resources.values()}
+        return [source for source, ctx in self._singleton_resources.items() if id(ctx) not in kept]
 
-            elif param_type:
-                if self._source_needs_async_recursive(param_type, visited):
-                    return True
+    def _restore(self, snapshot: ContainerSnapshot):
+        with self._lock:
+            self._providers = dict(snapshot.providers)
 
-        return False
+            # provider closures hold references to these mappings, so they must be updated in place
+            self._singletons.clear()
+            self._singletons.update(snapshot.singletons)
+            self._singleton_resources.clear()
+            self._singleton_resources.update(snapshot.singleton_resources)
+
+            self._generation += 1
+
+    def _retire_singleton_resource(self, source: ProviderSource, provider_info: ProviderInfo | None):
+        """Keeps the open resource of a re-bound singleton for `close`/`aclose`, at its creation position.
+
+        The next build stores its own resource under `source`, overwriting it would leave the
+        previous generator to the garbage collector.
+        """
+
+        if source not in self._singleton_resources:
+            return
+
+        retired = _RetiredResource(source, provider_info.fork_safe if provider_info is not None else True)
+        resources = list(self._singleton_resources.items())
+
+        # provider closures hold a reference to this mapping, so it must be updated in place
+        self._singleton_resources.clear()
+        self._singleton_resources.update((retired if key is source else key, ctx) for key, ctx in resources)
+
+    def _pop_singleton_resources(self, sources: list[ProviderSource]) -> dict[ProviderSource, Any]:
+        resources = {}
+
+        with self._lock:
+            # provider closures hold references to these mappings, so they must be updated in place
+            for source in sources:
+                if source in self._singleton_resources:
+                    resources[source] = self._singleton_resources.pop(source)
+                    self._singletons.pop(source, None)
+
+        return resources
+
+    def _check_sync_resources(self, resources: dict[ProviderSource, Any], async_alternative: str):
+        for source, ctx in resources.items():
+            if not hasattr(ctx, '__exit__'):
+                raise RuntimeError(f'Singleton resource for {source} is asynchronous, use {async_alternative} instead.')
+
+    def _exit_resources(self, resources: dict[ProviderSource, Any]):
+        for ctx in reversed(resources.values()):
+            try:
+                ctx.__exit__(None, None, None)
+            except Exception:
+                pass
+
+    async def _exit_resources_async(self, resources: dict[ProviderSource, Any]):
+        import asyncio
+
+        for group in self._teardown_groups(list(resources)):
+            await asyncio.gather(*(self._exit_resource_async(resources[source]) for source in group))
+
+    def _teardown_groups(self, sources: list[ProviderSource]) -> list[list[ProviderSource]]:
+        # retired resources are ordered like the provider they were built for
+        provided = {source: source.source if isinstance(source, _RetiredResource) else source for source in sources}
+        dependencies = {source: self._collect_dependencies(provided[source]) for source in sources}
+        levels: dict[ProviderSource, int] = {}
+        groups: list[list[ProviderSource]] = []
+
+        # sources are in creation order, so dependents are visited before their dependencies
+        for source in reversed(sources):
+            levels[source] = max(
+                (level + 1 for dependent, level in levels.items() if provided[source] in dependencies[dependent]),
+                default=0,
+            )
+
+        for source, level in levels.items():
+            while len(groups) <= level:
+                groups.append([])
+
+            groups[level].append(source)
+
+        return groups
+
+    async def _exit_resource_async(self, ctx: Any):
+        try:
+            if hasattr(ctx, '__aexit__'):
+                await ctx.__aexit__(None, None, None)
+            else:
+                ctx.__exit__(None, None, None)
+        except Exception:
+            pass
+
+    def _get_dependency_sources(self, source: ProviderSource) -> list[ProviderSource]:
+        try:
+            return [dependency for _, dependency in self._compile_plan(source, strict=False)]
+        except (TypeError, AttributeError, NameError):
+            return []
+
+    def _collect_dependencies(self, source: ProviderSource) -> set[ProviderSource]:
+        """Every registered provider reachable from `source`, excluding itself."""
+
+        collected: set[ProviderSource] = set()
+        pending = [source]
+
+        while pending:
+            current = pending.pop()
+            provider_info = self._get_provider_info(current)
+            implementation = provider_info.source if provider_info else current
+
+            for dependency in self._get_dependency_sources(implementation):
+                if dependency not in collected and dependency is not source:
+                    collected.add(dependency)
+                    pending.append(dependency)
+
+        return collected
+
+    def _singleton_sources(self, include_async: bool) -> list[ProviderSource]:
+        return [
+            source
+            for source, provider_info in self._providers.items()
+            if provider_info.scope == Scope.SINGLETON and (include_async or not provider_info.needs_async)
+        ]
+
+    def _reset_after_fork(self):
+        # the locks may have been held by a thread that doesn't exist in the child
+        self._lock = threading.RLock()
+
+        for construction_lock in self._construction_locks:
+            construction_lock.lock = threading.RLock()
+            construction_lock.pending = None
+
+        for source in self._fork_unsafe_singletons():
+            self._singletons.pop(source, None)
+            # the resource belongs to the parent process, it must not be torn down by the child
+            self._singleton_resources.pop(source, None)
+
+        for source in list(self._singleton_resources):
+            if isinstance(source, _RetiredResource) and not source.fork_safe:
+                self._singleton_resources.pop(source, None)
+
+    def _fork_unsafe_singletons(self) -> list[ProviderSource]:
+        """Built singletons that are fork-unsafe, or hold one through their dependencies."""
+
+        def is_unsafe(source: ProviderSource) -> bool:
+            provider_info = self._get_provider_info(source)
+            return provider_info is not None and provider_info.scope == Scope.SINGLETON and not provider_info.fork_safe
+
+        return [
+            source
+            for source in list(self._singletons)
+            if is_unsafe(source) or any(is_unsafe(dependency) for dependency in self._collect_dependencies(source))
+        ]
 
     def _has_provider_for(self, t: ProviderSource) -> bool:
-        return t in self._providers
+        return self._get_provider_info(t) is not None
+
+    def _get_provider_info(self, t: ProviderSource) -> ProviderInfo | None:
+        container = self
+
+        while container is not None:
+            overrides = container._overrides.get()
+
+            if overrides is not None and t in overrides:
+                return overrides[t]
+
+            provider_info = container._providers.get(t)
+
+            if provider_info is not None:
+                return provider_info
+
+            container = container._parent
+
+        return None
 
     def _is_Inject_param(self, param: inspect.Parameter):
         if param.default != INSPECT_EMPTY and isinstance(param.default, ProviderDependency):
             return True
         return False
 
-    def _get_provider[T](self, t: ProviderSource[T]) -> Provider[T]:
-        provider_info = self._providers.get(t)
+    def _get_cached(self, provider_info: ProviderInfo) -> Any:
+        lookup = provider_info.lookup
+
+        if lookup is None:
+            return MISSING
+
+        return lookup(self)
+
+    def _get_required_provider_info[T](self, t: ProviderSource[T]) -> ProviderInfo[T]:
+        provider_info = self._get_provider_info(t)
 
         if not provider_info:
             raise MissingProviderError(f'Provider for {t} not registered')
 
-        return provider_info.provider  # pyright: ignore[reportReturnType]
+        return provider_info
+
+
+_FORK_AWARE_CONTAINERS: weakref.WeakSet[Container] = weakref.WeakSet()
+
+
+def _reset_containers_after_fork():
+    for container in list(_FORK_AWARE_CONTAINERS):
+        container._reset_after_fork()  # pyright: ignore[reportPrivateUsage]
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_containers_after_fork)
@@ -0,0 +1,100 @@
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # asyncio is imported lazily, processes that never run a loop don't pay for it
+    from asyncio import AbstractEventLoop
+
+_EVENT_LOOP_STORES: weakref.WeakKeyDictionary['AbstractEventLoop', dict[Any, Any]] = weakref.WeakKeyDictionary()
+
+
+async def _exit_context_managers_async(context_managers: list[Any]):
+    for cm in reversed(context_managers):
+        try:
+            if hasattr(cm, '__aexit__'):
+                await cm.__aexit__(None, None, None)
+            elif hasattr(cm, '__exit__'):
+                cm.__exit__(None, None, None)
+            elif hasattr(cm, 'aclose'):
+                await cm.aclose()
+            elif hasattr(cm, 'close'):
+                cm.close()
+        except Exception:
+            pass
+
+    context_managers.clear()
+
+
+async def _shutdown_hook(context_managers: list[Any]):
+    try:
+        yield
+    finally:
+        import asyncio
+
+        _EVENT_LOOP_STORES.pop(asyncio.get_running_loop(), None)
+        await _exit_context_managers_async(context_managers)
+
+
+class EventLoopScopeService:
+    CONTEXT_MANAGERS_KEY = '__Context_Managers__'
+    CHILD_STORES_KEY = '__Child_Stores__'
+    SHUTDOWN_HOOK_KEY = '__Shutdown_Hook__'
+
+    @classmethod
+    def get_event_loop_store(cls) -> dict[Any, Any]:
+        import asyncio
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                'No running event loop found. EVENT_LOOP scoped providers can only be resolved '
+                'while an event loop is running in the current thread.'
+            ) from None
+
+        store = _EVENT_LOOP_STORES.get(loop)
+
+        if store is None:
+            store = cls._start_event_loop_scope(loop)
+
+        return store
+
+    @classmethod
+    def get_event_loop_key(cls, item):
+        return item
+
+    @classmethod
+    async def exit_event_loop_scope(cls):
+        """Tears down every EVENT_LOOP scoped instance of the running loop.
+
+        This happens automatically on `loop.shutdown_asyncgens()` (called by `asyncio.run`),
+        call it explicitly for loops that are closed without shutting down their async generators.
+        """
+
+        import asyncio
+
+        store = _EVENT_LOOP_STORES.pop(asyncio.get_running_loop(), None)
+
+        if store is None:
+            return
+
+        await store[cls.SHUTDOWN_HOOK_KEY].aclose()
+
+    @classmethod
+    def _start_event_loop_scope(cls, loop: 'AbstractEventLoop'):
+        store: dict[Any, Any] = {}
+        context_managers: list[Any] = []
+        hook = _shutdown_hook(context_managers)
+
+        # the first iteration registers the hook in the running loop's async generators,
+        # so loop.shutdown_asyncgens() closes it and the cleanup runs inside the loop
+        try:
+            hook.asend(None).send(None)
+        except StopIteration:
+            pass
+
+        store[cls.CONTEXT_MANAGERS_KEY] = context_managers
+        store[cls.SHUTDOWN_HOOK_KEY] = hook
+        _EVENT_LOOP_STORES[loop] = store
+
+        return store
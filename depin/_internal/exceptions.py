@@ -12,6 +12,7 @@ class UnexpectedCoroutineError(RuntimeError):
 
 class CircularDependencyError(Exception):
     def __init__(self, visited: dict[Any, Literal[True]], source: Any) -> None:
+        self.source = source
         dependency_graph_string = self._get_dependency_graph_string(visited, source)
         super().__init__(f'Circular dependency detected:\n{dependency_graph_string}')
 
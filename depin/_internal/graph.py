@@ -0,0 +1,158 @@
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from depin._internal.check import describe, get_bindings
+from depin._internal.types import Scope
+
+if TYPE_CHECKING:
+    from depin._internal.container import Container
+    from depin._internal.profiling import ResolutionProfile
+
+SCOPE_COLORS = {
+    Scope.SINGLETON: '#c6e5b3',
+    Scope.THREAD: '#b3d4e5',
+    Scope.EVENT_LOOP: '#c9c3e6',
+    Scope.REQUEST: '#f5deb3',
+    Scope.TRANSIENT: '#f4b6b6',
+}
+
+
+@dataclass(frozen=True)
+class GraphNode:
+    id: str
+    source: Any
+    # None for dependencies without a provider
+    scope: Scope | None
+    is_async: bool
+    is_generator: bool
+    constructions: int | None = None
+    total_ns: int | None = None
+    self_ns: int | None = None
+
+
+@dataclass(frozen=True)
+class GraphEdge:
+    source: str
+    target: str
+    parameter: str
+
+
+@dataclass(frozen=True)
+class DependencyGraph:
+    """Providers and their dependencies, returned by `Container.graph`."""
+
+    nodes: tuple[GraphNode, ...]
+    edges: tuple[GraphEdge, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'nodes': [
+                {
+                    'id': node.id,
+                    'scope': node.scope.value if node.scope else None,
+                    'is_async': node.is_async,
+                    'is_generator': node.is_generator,
+                    'constructions': node.constructions,
+                    'total_ns': node.total_ns,
+                    'self_ns': node.self_ns,
+                }
+                for node in self.nodes
+            ],
+            'edges': [
+                {'source': edge.source, 'target': edge.target, 'parameter': edge.parameter} for edge in self.edges
+            ],
+        }
+
+    def to_json(self, indent: int | None = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_dot(self) -> str:
+        lines = [
+            'digraph depin {',
+            '    rankdir=LR;',
+            '    node [shape=box, style="rounded,filled", fontname="Helvetica"];',
+        ]
+
+        for node in self.nodes:
+            label = [node.id.rsplit('.', 1)[-1], node.scope.value if node.scope else 'missing']
+
+            if node.is_async:
+                label[1] += ', async'
+
+            if node.constructions:
+                label.append(f'{node.constructions}x, {(node.total_ns or 0) / 1_000_000:.2f}ms')
+
+            color = SCOPE_COLORS[node.scope] if node.scope else '#ffffff'
+            text = '\n'.join(label)
+            lines.append(f'    {_quote(node.id)} [label={_quote(text)}, fillcolor="{color}"];')
+
+        for edge in self.edges:
+            lines.append(f'    {_quote(edge.source)} -> {_quote(edge.target)} [label={_quote(edge.parameter)}];')
+
+        lines.append('}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def build_graph(container: 'Container', profile: 'ResolutionProfile | None' = None) -> DependencyGraph:
+    ids: dict[Any, str] = {}
+    taken: set[str] = set()
+    pending: deque[Any] = deque()
+    nodes: list[GraphNode] = []
+    edges: list[GraphEdge] = []
+
+    def node_id(source: Any) -> str:
+        if source not in ids:
+            name = candidate = describe(source)
+            suffix = 1
+
+            # local classes and functions can share a qualified name
+            while candidate in taken:
+                suffix += 1
+                candidate = f'{name}#{suffix}'
+
+            ids[source] = candidate
+            taken.add(candidate)
+            pending.append(source)
+
+        return ids[source]
+
+    for source in get_bindings(container):
+        node_id(source)
+
+    while pending:
+        source = pending.popleft()
+        provider_info = container._get_provider_info(source)  # pyright: ignore[reportPrivateUsage]
+        stats = profile.get(source) if profile is not None else None
+
+        nodes.append(
+            GraphNode(
+                id=ids[source],
+                source=source,
+                scope=provider_info.scope if provider_info is not None else None,
+                is_async=provider_info.is_async if provider_info is not None else False,
+                is_generator=provider_info.is_generator if provider_info is not None else False,
+                constructions=stats.constructions if stats else None,
+                total_ns=stats.total_ns if stats else None,
+                self_ns=stats.self_ns if stats else None,
+            )
+        )
+
+        if provider_info is None:
+            continue
+
+        try:
+            plan = container._compile_plan(provider_info.source, strict=False)  # pyright: ignore[reportPrivateUsage]
+        except (TypeError, AttributeError, NameError):
+            plan = ()
+
+        for name, dependency in plan:
+            edges.append(GraphEdge(ids[source], node_id(dependency), name))
+
+    return DependencyGraph(nodes=tuple(nodes), edges=tuple(edges))
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
@@ -1,6 +1,18 @@
 import inspect
-from functools import lru_cache
-from typing import Any, Callable, get_type_hints
+import threading
+from collections import OrderedDict
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, get_type_hints
+from weakref import WeakKeyDictionary
+
+from depin._internal.profiling import get_startup_profiler
+from depin._internal.types import ProviderDependency, ProviderSource
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# name, dependency (the `Inject` source or the type hint), whether it comes from `Inject`, whether it has no default
+type Parameter = tuple[str, ProviderSource | None, bool, bool]
 
 
 class ClassProperty:
@@ -27,11 +39,141 @@ def is_coroutine(obj: Any) -> bool:
     return inspect.iscoroutine(obj)
 
 
-@lru_cache(None)
-def get_cached_signature(func: Callable[..., Any]) -> inspect.Signature:
-    return inspect.signature(func)
+def import_object(path: str) -> Any:
+    module_name, _, qualname = path.partition(':')
+    obj: Any = import_module(module_name)
+
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+
+    return obj
+
+
+class ConstructionLock:
+    """Serialises the cold construction of one provider, replaced in the child after `os.fork`.
+
+    Synchronous providers hold `lock` while building, asynchronous ones can't hold it across
+    awaits and publish the build in progress as `pending` instead.
+    """
+
+    __slots__ = ('lock', 'pending', '__weakref__')
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.pending: Future[None] | None = None
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class IntrospectionCache:
+    """Signature and type hint cache keyed weakly by the inspected callable.
+
+    Callables that cannot be weakly referenced (builtins, slot wrappers) fall back to a
+    bounded LRU, and unhashable ones are inspected on every call. Safe to share between
+    threads, hit/miss counters are approximate under contention.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._weak: WeakKeyDictionary[Any, dict[str, Any]] = WeakKeyDictionary()
+        self._lru: OrderedDict[Any, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def signature(self, func: Callable[..., Any]) -> inspect.Signature:
+        return self._lookup(func, 'signature', inspect.signature)
+
+    def type_hints(self, func: Callable[..., Any]) -> dict[str, Any]:
+        return self._lookup(func, 'type_hints', get_type_hints)
+
+    def cached(self, func: Callable[..., Any], kind: str, compute: Callable[[Any], Any]) -> Any:
+        """`compute(func)` cached under `kind`, not reported to the startup profiler."""
+
+        return self._lookup(func, kind, compute, measure=None)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._weak) + len(self._lru))
+
+    def clear(self):
+        self._weak.clear()
+        self._lru.clear()
+        self.hits = self.misses = 0
+
+    def _lookup(
+        self,
+        func: Callable[..., Any],
+        kind: str,
+        compute: Callable[[Any], Any],
+        measure: str | None = 'introspection',
+    ) -> Any:
+        try:
+            entry = self._weak.get(func)
+            weak = True
+        except TypeError:
+            try:
+                with self._lock:
+                    entry = self._lru.get(func)
+
+                    if entry is not None:
+                        self._lru.move_to_end(func)
+            except TypeError:
+                self.misses += 1
+                return compute(func)
+
+            weak = False
+
+        if entry is not None and kind in entry:
+            self.hits += 1
+            return entry[kind]
+
+        self.misses += 1
+        profiler = get_startup_profiler()
+
+        if profiler is None or measure is None:
+            value = compute(func)
+        else:
+            with profiler.measure(measure, func):
+                value = compute(func)
+
+        if entry is None:
+            if weak:
+                entry = self._weak.setdefault(func, {})
+            else:
+                with self._lock:
+                    entry = self._lru.setdefault(func, {})
+
+                    if len(self._lru) > self.maxsize:
+                        self._lru.popitem(last=False)
+
+        entry[kind] = value
+
+        return value
+
+
+def inspect_parameters(introspection: IntrospectionCache, source: ProviderSource) -> tuple[Parameter, ...]:
+    """Injectable parameters of a class (its `__init__`) or callable, `self` and `*args`/`**kwargs` excluded."""
+
+    is_class = isinstance(source, type)
+    func = source.__init__ if is_class else source
+    signature = introspection.signature(func)
+    type_hints = introspection.type_hints(func)
+    parameters = []
+
+    for name, param in signature.parameters.items():
+        if is_class and name == 'self':
+            continue
+        if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            continue
 
+        if isinstance(param.default, ProviderDependency):
+            parameters.append((name, param.default.provider_source, True, False))
+        else:
+            parameters.append((name, type_hints.get(name), False, param.default is inspect.Parameter.empty))
 
-@lru_cache(None)
-def get_cached_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
-    return get_type_hints(func)
+    return tuple(parameters)
@@ -0,0 +1,170 @@
+import gc
+import tracemalloc
+import weakref
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any
+
+from depin._internal.check import describe
+from depin._internal.profiling import ResolutionObserver
+from depin._internal.request_scope import RequestScopeService
+from depin._internal.types import ProviderInfo, ProviderSource
+
+if TYPE_CHECKING:
+    from depin._internal.container import Container
+
+
+class _ScopeRecord:
+    __slots__ = ('allocated_bytes', 'token')
+
+    def __init__(self):
+        self.allocated_bytes = 0
+        self.token: Token[Any] | None = None
+
+
+class RequestLeakDetector(ResolutionObserver):
+    """Debug helper accounting memory per request scope and finding instances that outlive it.
+
+    While installed, bytes allocated (and still held) by resolutions made in request scopes
+    are measured with `tracemalloc`, and weak references to every instance of the request
+    store (the `Request` included) are checked by `collect` once the scope ended. Instances
+    still alive after a garbage collection were captured by something longer-lived, such as
+    a singleton or a background task. Instances that can't be weakly referenced (e.g. dicts)
+    are counted as `unchecked`.
+
+    Meant for tests and debugging sessions, `tracemalloc` slows allocations down noticeably.
+
+    ### Example:
+        ```py
+        detector = RequestLeakDetector().install(DI)
+        run_smoke_tests()
+
+        print(detector.report())
+        ```
+    """
+
+    def __init__(self, track_allocations: bool = True):
+        self.track_allocations = track_allocations
+        self.scopes = 0
+        self.allocated_bytes = 0
+        self.max_allocated_bytes = 0
+        self.allocated_bytes_by_provider: dict[ProviderSource, int] = {}
+        self.leaks: dict[ProviderSource, int] = {}
+        self.unchecked = 0
+        self._pending: list[tuple[ProviderSource, weakref.ref[Any]]] = []
+        self._scope: ContextVar[_ScopeRecord | None] = ContextVar('depin_leak_scope', default=None)
+        self._building: ContextVar[bool] = ContextVar('depin_leak_building', default=False)
+        self._started_tracemalloc = False
+
+    def install(self, container: 'Container') -> 'RequestLeakDetector':
+        """Starts accounting request scopes and resolutions through `container`."""
+
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        container.add_observer(self)
+        RequestScopeService.add_observer(self)
+
+        return self
+
+    def uninstall(self, container: 'Container'):
+        container.remove_observer(self)
+        RequestScopeService.remove_observer(self)
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def collect(self) -> dict[ProviderSource, int]:
+        """Runs the garbage collector and returns the instances of ended request scopes still alive, per provider.
+
+        They are also added to `leaks`.
+        """
+
+        gc.collect()
+
+        survivors: dict[ProviderSource, int] = {}
+
+        for source, ref in self._pending:
+            if ref() is not None:
+                survivors[source] = survivors.get(source, 0) + 1
+
+        self._pending.clear()
+
+        for source, count in survivors.items():
+            self.leaks[source] = self.leaks.get(source, 0) + count
+
+        return survivors
+
+    def report(self) -> str:
+        self.collect()
+
+        mean = self.allocated_bytes // self.scopes if self.scopes else 0
+        lines = [
+            f'{self.scopes} request scopes, {mean} bytes per scope on average, '
+            f'{self.max_allocated_bytes} at most ({self.unchecked} instances not checked for leaks)'
+        ]
+
+        for source, allocated in sorted(self.allocated_bytes_by_provider.items(), key=lambda item: -item[1]):
+            lines.append(f'  {describe(source)}: {allocated} bytes')
+
+        for source, count in self.leaks.items():
+            lines.append(f'leak: {count} instances of {describe(source)} outlived their request scope')
+
+        return '\n'.join(lines)
+
+    def on_start(self, source: ProviderSource, provider_info: ProviderInfo) -> Any:
+        # only the outermost construction is measured, it includes its dependencies
+        if self._scope.get() is None or self._building.get() or not tracemalloc.is_tracing():
+            return None
+
+        return self._building.set(True), tracemalloc.get_traced_memory()[0]
+
+    def on_end(
+        self, source: ProviderSource, provider_info: ProviderInfo, state: Any, error: BaseException | None
+    ) -> None:
+        if state is None:
+            return
+
+        token, before = state
+        allocated = max(tracemalloc.get_traced_memory()[0] - before, 0)
+        self._building.reset(token)
+
+        record = self._scope.get()
+
+        if record is not None:
+            record.allocated_bytes += allocated
+
+        self.allocated_bytes_by_provider[source] = self.allocated_bytes_by_provider.get(source, 0) + allocated
+
+    def on_request_scope_start(self):
+        record = _ScopeRecord()
+        record.token = self._scope.set(record)
+
+    def on_request_scope_end(self, store_size: int, teardown_ns: int, failures: int):
+        record = self._scope.get()
+        store = RequestScopeService.get_request_store()
+        instances = list(RequestScopeService.iter_instances(store))
+        request = store.get(RequestScopeService.CURRENT_REQUEST_KEY)
+
+        if request is not None:
+            instances.append((type(request), request))
+
+        for source, instance in instances:
+            try:
+                self._pending.append((source, weakref.ref(instance)))
+            except TypeError:
+                self.unchecked += 1
+
+        if record is None or record.token is None:
+            return
+
+        self.scopes += 1
+        self.allocated_bytes += record.allocated_bytes
+        self.max_allocated_bytes = max(self.max_allocated_bytes, record.allocated_bytes)
+
+        try:
+            self._scope.reset(record.token)
+        except ValueError:
+            # the scope was entered in another context (e.g. a middleware task)
+            self._scope.set(None)
@@ -0,0 +1,195 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from depin._internal.check import describe
+from depin._internal.profiling import ResolutionObserver
+from depin._internal.request_scope import RequestScopeService
+from depin._internal.types import ProviderInfo, ProviderSource
+
+if TYPE_CHECKING:
+    from depin._internal.container import Container
+
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+type Labels = tuple[str, str]
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> list[str]:
+        separator = ',' if labels else ''
+        lines = []
+        cumulative = 0
+
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels}{separator}le="{bound:g}"}} {cumulative}')
+
+        lines.append(f'{name}_bucket{{{labels}{separator}le="+Inf"}} {self.count}')
+        lines.append(f'{name}_sum{{{labels}}} {self.sum:.9g}' if labels else f'{name}_sum {self.sum:.9g}')
+        lines.append(f'{name}_count{{{labels}}} {self.count}' if labels else f'{name}_count {self.count}')
+
+        return lines
+
+
+class ContainerMetrics(ResolutionObserver):
+    """In-process metrics collector rendering the Prometheus text exposition format.
+
+    Collects resolutions, cache hits, construction latency and failures per provider and
+    scope from the containers it is installed on, and request scope activity (live scopes,
+    store size, teardown duration and failures) from `RequestScopeService`.
+
+    ### Example:
+        ```py
+        metrics = ContainerMetrics().install(DI)
+
+        print(metrics.render())
+        ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._labels: dict[ProviderSource, Labels] = {}
+        self.resolutions: dict[Labels, int] = {}
+        self.cache_hits: dict[Labels, int] = {}
+        self.construction_failures: dict[Labels, int] = {}
+        self.construction_seconds: dict[Labels, _Histogram] = {}
+        self.active_request_scopes = 0
+        self.request_store_size = _Histogram(SIZE_BUCKETS)
+        self.request_teardown_seconds = _Histogram(LATENCY_BUCKETS)
+        self.request_teardown_failures = 0
+
+    def install(self, container: 'Container') -> 'ContainerMetrics':
+        """Starts collecting from `container` and from every request scope."""
+
+        container.add_observer(self)
+        RequestScopeService.add_observer(self)
+
+        return self
+
+    def uninstall(self, container: 'Container'):
+        container.remove_observer(self)
+        RequestScopeService.remove_observer(self)
+
+    def on_hit(self, source: ProviderSource, provider_info: ProviderInfo) -> None:
+        labels = self._get_labels(source, provider_info)
+
+        with self._lock:
+            self.resolutions[labels] = self.resolutions.get(labels, 0) + 1
+            self.cache_hits[labels] = self.cache_hits.get(labels, 0) + 1
+
+    def on_start(self, source: ProviderSource, provider_info: ProviderInfo) -> Any:
+        return time.perf_counter_ns()
+
+    def on_end(
+        self, source: ProviderSource, provider_info: ProviderInfo, state: Any, error: BaseException | None
+    ) -> None:
+        elapsed = (time.perf_counter_ns() - state) / 1_000_000_000
+        labels = self._get_labels(source, provider_info)
+
+        with self._lock:
+            self.resolutions[labels] = self.resolutions.get(labels, 0) + 1
+
+            if error is not None:
+                self.construction_failures[labels] = self.construction_failures.get(labels, 0) + 1
+                return
+
+            histogram = self.construction_seconds.get(labels)
+
+            if histogram is None:
+                histogram = self.construction_seconds[labels] = _Histogram(LATENCY_BUCKETS)
+
+            histogram.observe(elapsed)
+
+    def on_request_scope_start(self):
+        with self._lock:
+            self.active_request_scopes += 1
+
+    def on_request_scope_end(self, store_size: int, teardown_ns: int, failures: int):
+        with self._lock:
+            self.active_request_scopes -= 1
+            self.request_store_size.observe(store_size)
+            self.request_teardown_seconds.observe(teardown_ns / 1_000_000_000)
+            self.request_teardown_failures += failures
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format (version 0.0.4)."""
+
+        with self._lock:
+            lines = []
+
+            for name, kind, help_text, values in (
+                (
+                    'depin_resolutions_total',
+                    'counter',
+                    'Resolutions per provider, cache hits included.',
+                    self.resolutions,
+                ),
+                ('depin_cache_hits_total', 'counter', 'Resolutions answered from a scope cache.', self.cache_hits),
+                (
+                    'depin_construction_failures_total',
+                    'counter',
+                    'Providers that raised while building an instance.',
+                    self.construction_failures,
+                ),
+            ):
+                lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+                lines += [f'{name}{{{_format_labels(labels)}}} {value}' for labels, value in sorted(values.items())]
+
+            lines += [
+                '# HELP depin_construction_seconds Time spent building instances, dependencies included.',
+                '# TYPE depin_construction_seconds histogram',
+            ]
+
+            for labels, histogram in sorted(self.construction_seconds.items()):
+                lines += histogram.render('depin_construction_seconds', _format_labels(labels))
+
+            lines += [
+                '# HELP depin_request_scopes_active Request scopes currently open.',
+                '# TYPE depin_request_scopes_active gauge',
+                f'depin_request_scopes_active {self.active_request_scopes}',
+                '# HELP depin_request_store_size Instances cached in a request scope when it ends.',
+                '# TYPE depin_request_store_size histogram',
+                *self.request_store_size.render('depin_request_store_size', ''),
+                '# HELP depin_request_teardown_seconds Time spent tearing down request scopes.',
+                '# TYPE depin_request_teardown_seconds histogram',
+                *self.request_teardown_seconds.render('depin_request_teardown_seconds', ''),
+                '# HELP depin_request_teardown_failures_total Request-scoped resources that raised on teardown.',
+                '# TYPE depin_request_teardown_failures_total counter',
+                f'depin_request_teardown_failures_total {self.request_teardown_failures}',
+            ]
+
+        return '\n'.join(lines) + '\n'
+
+    def _get_labels(self, source: ProviderSource, provider_info: ProviderInfo) -> Labels:
+        labels = self._labels.get(source)
+
+        if labels is None:
+            labels = self._labels[source] = (describe(source), provider_info.scope.value)
+
+        return labels
+
+
+def _format_labels(labels: Labels) -> str:
+    provider, scope = labels
+    provider = provider.replace('\\', '\\\\').replace('"', '\\"')
+
+    return f'provider="{provider}",scope="{scope}"'
@@ -0,0 +1,90 @@
+from contextvars import ContextVar, Token
+from typing import Any
+
+from depin._internal.types import ProviderInfo, ProviderSource
+
+type OverridesMap = dict[ProviderSource, ProviderInfo]
+
+
+class OverrideCache:
+    """Instances built while an override they depend on is active, and their open resources.
+
+    They live as long as the override block, caching them in their container or scope
+    store would leak the override into other contexts and past the block.
+    """
+
+    __slots__ = ('instances', 'resources', 'affected')
+
+    def __init__(self):
+        # keyed by (container, provider key)
+        self.instances: dict[Any, Any] = {}
+        self.resources: list[Any] = []
+        self.affected: dict[Any, bool] = {}
+
+
+OVERRIDE_CACHE: ContextVar[OverrideCache | None] = ContextVar('depin_override_cache', default=None)
+
+
+class ProviderOverride:
+    """Context manager returned by `Container.override`.
+
+    The override is stored in a ContextVar overlay, so it is only visible to the current
+    context (thread / asyncio task) and the tasks it spawns while the block is active.
+    """
+
+    def __init__(
+        self,
+        overrides: ContextVar[OverridesMap | None],
+        source: ProviderSource,
+        provider_info: ProviderInfo,
+        resources: dict[Any, Any],
+    ) -> None:
+        self._overrides = overrides
+        self._source = source
+        self._provider_info = provider_info
+        self._resources = resources
+        self._token: Token[OverridesMap | None] | None = None
+        self._cache_token: Token[OverrideCache | None] | None = None
+
+    def __enter__(self):
+        active = self._overrides.get()
+        self._token = self._overrides.set({**(active or {}), self._source: self._provider_info})
+        self._cache_token = OVERRIDE_CACHE.set(OverrideCache())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for ctx in self._reset():
+            try:
+                ctx.__exit__(None, None, None)
+            except Exception:
+                pass
+
+        self._resources.clear()
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        for ctx in self._reset():
+            try:
+                if hasattr(ctx, '__aexit__'):
+                    await ctx.__aexit__(None, None, None)
+                else:
+                    ctx.__exit__(None, None, None)
+            except Exception:
+                pass
+
+        self._resources.clear()
+
+    def _reset(self) -> list[Any]:
+        """Leaves the override, returning the resources to tear down, dependents first."""
+
+        assert self._token is not None, 'override was not entered'
+        assert self._cache_token is not None
+
+        cache = OVERRIDE_CACHE.get()
+        self._overrides.reset(self._token)
+        OVERRIDE_CACHE.reset(self._cache_token)
+        self._token = self._cache_token = None
+
+        return [*reversed(cache.resources if cache is not None else []), *reversed(list(self._resources.values()))]
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+from depin._internal.helpers import import_object, is_async_callable
+from depin._internal.types import ProviderInfo, ProviderSource, Scope
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+    from depin._internal.container import Container
+
+_WORKER_CONTAINER: 'Container | None' = None
+_INJECTED: dict[Callable[..., Any], Callable[..., Any]] = {}
+
+
+@dataclass(frozen=True)
+class BindingSpec:
+    source: str
+    scope: Scope
+    abstract: str | None = None
+    aliases: tuple[str, ...] = ()
+    fork_safe: bool = True
+    blocking: bool = False
+
+
+@dataclass(frozen=True)
+class ContainerSpec:
+    """Picklable description of a container, built with `Container.spec`.
+
+    Holds import paths instead of provider closures, so it can be sent to worker processes
+    and rebuilt there with `build`.
+    """
+
+    container: str | None
+    bindings: tuple[BindingSpec, ...]
+    blocking: bool = False
+
+    @classmethod
+    def from_container(cls, container: 'Container', path: str | None = None) -> 'ContainerSpec':
+        if path is not None and import_object(path) is not container:
+            raise ValueError(f'{path!r} does not refer to this container')
+
+        keys: dict[int, list[Any]] = {}
+        infos: dict[int, ProviderInfo] = {}
+
+        # a binding's key is registered before its aliases, all sharing the same record
+        for key, info in container._providers.items():  # pyright: ignore[reportPrivateUsage]
+            keys.setdefault(id(info), []).append(key)
+            infos[id(info)] = info
+
+        bindings = []
+
+        for info_id, (key, *aliases) in keys.items():
+            info = infos[info_id]
+
+            bindings.append(
+                BindingSpec(
+                    source=import_path(info.source),
+                    scope=info.scope,
+                    abstract=None if key is info.source else import_path(key),
+                    aliases=tuple(import_path(alias) for alias in aliases),
+                    fork_safe=info.fork_safe,
+                    blocking=info.blocking,
+                )
+            )
+
+        return cls(container=path, bindings=tuple(bindings), blocking=container._blocking)  # pyright: ignore[reportPrivateUsage]
+
+    def build(self) -> 'Container':
+        """Imports the container (or creates a new one) and binds every provider it is missing."""
+
+        from depin._internal.container import Container
+
+        container = import_object(self.container) if self.container is not None else Container(blocking=self.blocking)
+
+        for binding in self.bindings:
+            source = import_object(binding.source)
+            abstract = import_object(binding.abstract) if binding.abstract is not None else None
+            current = container._providers.get(abstract or source)  # pyright: ignore[reportPrivateUsage]
+
+            # bindings made at import time of the container module are already there
+            if current is not None and current.source is source and current.scope == binding.scope:
+                continue
+
+            container.bind(
+                source=source,
+                abstract=abstract,
+                scope=binding.scope,
+                aliases=[import_object(alias) for alias in binding.aliases] or None,
+                fork_safe=binding.fork_safe,
+                blocking=binding.blocking,
+            )
+
+        return container
+
+
+class ProcessPoolService:
+    """Rebuilds a container in `ProcessPoolExecutor` workers and runs injected functions there.
+
+    ### Example:
+        ```py
+        spec = DI.spec('app.di:DI')
+
+        with ProcessPoolExecutor(initializer=ProcessPoolService.initializer, initargs=(spec,)) as pool:
+            future = ProcessPoolService.submit(pool, render_report, report_id)
+        ```
+    """
+
+    @classmethod
+    def initializer(cls, spec: ContainerSpec, warm: bool = True):
+        """Pool initializer building the container once per worker, warming its singletons."""
+
+        global _WORKER_CONTAINER
+
+        container = spec.build()
+
+        if warm:
+            container.warm()
+
+        _WORKER_CONTAINER = container
+        _INJECTED.clear()
+
+    @classmethod
+    def get_container(cls) -> 'Container':
+        if _WORKER_CONTAINER is None:
+            raise RuntimeError('No worker container found. Create the pool with ProcessPoolService.initializer.')
+
+        return _WORKER_CONTAINER
+
+    @classmethod
+    def submit[T](cls, executor: 'Executor', func: Callable[..., T], *args: Any, **kwargs: Any) -> 'Future[T]':
+        """Submits `func` to the pool, injecting its dependencies from the worker container.
+
+        `func` must be importable by the workers (defined at module level); async functions
+        are run with `asyncio.run` in the worker.
+        """
+
+        return executor.submit(_call_injected, func, args, kwargs)
+
+
+def _call_injected(func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    injected = _INJECTED.get(func)
+
+    if injected is None:
+        injected = _INJECTED[func] = ProcessPoolService.get_container().inject(func)
+
+    if is_async_callable(func):
+        import asyncio
+
+        return asyncio.run(injected(*args, **kwargs))
+
+    return injected(*args, **kwargs)
+
+
+def import_path(obj: ProviderSource) -> str:
+    module = getattr(obj, '__module__', None)
+    qualname = getattr(obj, '__qualname__', None)
+
+    if module is None or qualname is None or '<' in qualname:
+        raise ValueError(f'{obj!r} cannot be imported by worker processes, define it at module level')
+
+    path = f'{module}:{qualname}'
+
+    try:
+        found = import_object(path)
+    except (ImportError, AttributeError):
+        found = None
+
+    if found is not obj:
+        raise ValueError(f'{obj!r} cannot be imported by worker processes, {path!r} refers to another object')
+
+    return path
@@ -0,0 +1,232 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from depin._internal.types import ProviderInfo, ProviderSource
+
+
+class ResolutionObserver:
+    """Hooks called around resolutions through a container, see `Container.add_observer`.
+
+    `on_start` runs before a provider builds an instance and its return value is handed to
+    `on_end`, which also gets the exception raised by the provider, if any. Resolutions
+    answered from a cache (singletons, REQUEST/THREAD/EVENT_LOOP stores) only call `on_hit`.
+    """
+
+    def on_hit(self, source: ProviderSource, provider_info: ProviderInfo) -> None:
+        pass
+
+    def on_start(self, source: ProviderSource, provider_info: ProviderInfo) -> Any:
+        return None
+
+    def on_end(
+        self, source: ProviderSource, provider_info: ProviderInfo, state: Any, error: BaseException | None
+    ) -> None:
+        pass
+
+
+@dataclass
+class ProviderStats:
+    constructions: int = 0
+    # including the dependencies built on the way
+    total_ns: int = 0
+    # excluding them
+    self_ns: int = 0
+
+
+class _Frame:
+    __slots__ = ('children_ns', 'path')
+
+    def __init__(self, path: tuple[ProviderSource, ...]):
+        self.children_ns = 0
+        self.path = path
+
+
+class ResolutionProfile(ResolutionObserver):
+    """Construction counts and times per provider, recorded while `Container.profile` is active.
+
+    Cache hits are not recorded. Times of dependencies built concurrently by
+    `get_many_async` overlap, so their parents' `self_ns` is a lower bound.
+
+    Self times are also aggregated per dependency path (the provider and the ones it was
+    built for), exported for flamegraph tools by `to_collapsed`.
+    """
+
+    def __init__(self):
+        self.stats: dict[ProviderSource, ProviderStats] = {}
+        self.stacks: dict[tuple[ProviderSource, ...], int] = {}
+        self._frame: ContextVar[_Frame | None] = ContextVar('depin_profile_frame', default=None)
+
+    def get(self, source: ProviderSource) -> ProviderStats | None:
+        return self.stats.get(source)
+
+    def to_collapsed(self) -> str:
+        """Returns the self time of each dependency path, in microseconds, in the collapsed-stack format.
+
+        One `Root;Dependency;Leaf 1234` line per path, consumable by `flamegraph.pl`,
+        speedscope or inferno.
+        """
+
+        from depin._internal.check import describe
+
+        names: dict[ProviderSource, str] = {}
+        lines = []
+
+        for path, self_ns in self.stacks.items():
+            for source in path:
+                if source not in names:
+                    names[source] = describe(source).replace(';', ':').replace(' ', '_')
+
+            lines.append(f'{";".join(names[source] for source in path)} {self_ns // 1000}')
+
+        return '\n'.join(sorted(lines)) + '\n' if lines else ''
+
+    def write_collapsed(self, path: str):
+        with open(path, 'w') as file:
+            file.write(self.to_collapsed())
+
+    def on_start(self, source: ProviderSource, provider_info: ProviderInfo) -> Any:
+        parent = self._frame.get()
+        frame = _Frame((*parent.path, source) if parent is not None else (source,))
+        return frame, self._frame.set(frame), time.perf_counter_ns()
+
+    def on_end(
+        self, source: ProviderSource, provider_info: ProviderInfo, state: Any, error: BaseException | None
+    ) -> None:
+        frame, token, start = state
+        elapsed = time.perf_counter_ns() - start
+        self._frame.reset(token)
+
+        stats = self.stats.get(source)
+
+        if stats is None:
+            stats = self.stats[source] = ProviderStats()
+
+        stats.constructions += 1
+        stats.total_ns += elapsed
+        self_ns = max(elapsed - frame.children_ns, 0)
+        stats.self_ns += self_ns
+        self.stacks[frame.path] = self.stacks.get(frame.path, 0) + self_ns
+
+        parent = self._frame.get()
+
+        if parent is not None:
+            parent.children_ns += elapsed
+
+
+_STARTUP_PROFILER: 'StartupProfiler | None' = None
+
+STARTUP_PHASES = ('register', 'analysis', 'introspection', 'construction')
+
+
+@dataclass
+class StartupStats:
+    # includes the analysis and introspection triggered by the registration
+    register_ns: int = 0
+    # includes the introspection triggered by the analysis
+    analysis_ns: int = 0
+    introspection_ns: int = 0
+    construction_ns: int = 0
+
+    @property
+    def total_ns(self) -> int:
+        return self.register_ns + self.construction_ns
+
+
+class StartupProfiler:
+    """Records per provider the time depin spends registering, inspecting, analysing and warming it.
+
+    While active (as a context manager, process-wide) every container reports to it.
+
+    ### Example:
+        ```py
+        with StartupProfiler() as startup:
+            import app.main
+            DI.warm()
+
+        print(startup.report())
+        startup.write_json('startup.json')
+        ```
+    """
+
+    def __init__(self):
+        self.stats: dict[Any, StartupStats] = {}
+        self._current: ContextVar[Any] = ContextVar('depin_startup_provider', default=None)
+        self._previous: StartupProfiler | None = None
+
+    def __enter__(self) -> 'StartupProfiler':
+        global _STARTUP_PROFILER
+
+        self._previous, _STARTUP_PROFILER = _STARTUP_PROFILER, self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _STARTUP_PROFILER
+
+        _STARTUP_PROFILER = self._previous
+
+    @contextmanager
+    def measure(self, phase: str, source: Any) -> Iterator[None]:
+        # introspection is attributed to the provider being registered when there is one
+        source = self._current.get() if phase == 'introspection' and self._current.get() is not None else source
+        token = self._current.set(source) if phase == 'register' else None
+        start = time.perf_counter_ns()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - start
+
+            if token is not None:
+                self._current.reset(token)
+
+            stats = self.stats.get(source)
+
+            if stats is None:
+                stats = self.stats[source] = StartupStats()
+
+            setattr(stats, f'{phase}_ns', getattr(stats, f'{phase}_ns') + elapsed)
+
+    def ranked(self) -> list[tuple[Any, StartupStats]]:
+        return sorted(self.stats.items(), key=lambda item: item[1].total_ns or item[1].introspection_ns, reverse=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        from depin._internal.check import describe
+
+        return {
+            'total_ns': {
+                phase: sum(getattr(s, f'{phase}_ns') for s in self.stats.values()) for phase in STARTUP_PHASES
+            },
+            'providers': [
+                {'provider': describe(source), **{f'{phase}_ns': getattr(s, f'{phase}_ns') for phase in STARTUP_PHASES}}
+                for source, s in self.ranked()
+            ],
+        }
+
+    def write_json(self, path: str):
+        import json
+
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def report(self, limit: int = 20) -> str:
+        from depin._internal.check import describe
+
+        totals = self.to_dict()['total_ns']
+        header = f'{"provider":<60} {"register":>10} {"analysis":>10} {"introspect":>10} {"construct":>10}'
+        lines = [header, '-' * len(header)]
+
+        for source, s in self.ranked()[:limit]:
+            times = (s.register_ns, s.analysis_ns, s.introspection_ns, s.construction_ns)
+            lines.append(f'{describe(source)[-60:]:<60} ' + ' '.join(f'{ns / 1_000_000:>8.2f}ms' for ns in times))
+
+        lines.append('-' * len(header))
+        lines.append(f'{"total":<60} ' + ' '.join(f'{totals[phase] / 1_000_000:>8.2f}ms' for phase in STARTUP_PHASES))
+
+        return '\n'.join(lines)
+
+
+def get_startup_profiler() -> StartupProfiler | None:
+    return _STARTUP_PROFILER
@@ -1,8 +1,10 @@
+import time
 from contextlib import asynccontextmanager, contextmanager
 from contextvars import ContextVar
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
 
-from fastapi import Request
+if TYPE_CHECKING:
+    from starlette.requests import Request
 
 _GLOBAL_REQUEST_STORE: ContextVar[dict[Any, Any]] = ContextVar(
     '_GLOBAL_REQUEST_STORE',
@@ -10,9 +12,31 @@ _GLOBAL_REQUEST_STORE: ContextVar[dict[Any, Any]] = ContextVar(
 )
 
 
+_OBSERVERS: list[Any] = []
+
+
 class RequestScopeService:
     CONTEXT_MANAGERS_KEY = '__Context_Managers__'
     CURRENT_REQUEST_KEY = '__Current_Request__'
+    TRACE_KEY = '__Resolution_Trace__'
+    # instances of child containers, see `Container._scoped_store`
+    CHILD_STORES_KEY = '__Child_Stores__'
+
+    @classmethod
+    def add_observer(cls, observer: Any):
+        """Installs an observer notified when request scopes start and end.
+
+        The observer implements `on_request_scope_start()` and
+        `on_request_scope_end(store_size, teardown_ns, failures)`.
+        """
+
+        if observer not in _OBSERVERS:
+            _OBSERVERS.append(observer)
+
+    @classmethod
+    def remove_observer(cls, observer: Any):
+        if observer in _OBSERVERS:
+            _OBSERVERS.remove(observer)
 
     @classmethod
     def get_request_store(cls):
@@ -23,12 +47,25 @@ class RequestScopeService:
         return item
 
     @classmethod
-    def set_current_request(cls, request: Request):
+    def iter_instances(cls, store: dict[Any, Any]) -> Iterator[tuple[Any, Any]]:
+        """Provider sources and instances held by a request store, child containers' included."""
+
+        special = (cls.CONTEXT_MANAGERS_KEY, cls.CURRENT_REQUEST_KEY, cls.TRACE_KEY, cls.CHILD_STORES_KEY)
+
+        for key, instance in list(store.items()):
+            if key not in special:
+                yield key, instance
+
+        for child_store in list(store.get(cls.CHILD_STORES_KEY, {}).values()):
+            yield from list(child_store.items())
+
+    @classmethod
+    def set_current_request(cls, request: 'Request'):
         store = cls.get_request_store()
         store[cls.CURRENT_REQUEST_KEY] = request
 
     @classmethod
-    def get_current_request(cls) -> Request:
+    def get_current_request(cls) -> 'Request':
         store = cls.get_request_store()
 
         request = store.get(cls.CURRENT_REQUEST_KEY)
@@ -82,11 +119,25 @@ class RequestScopeService:
     @classmethod
     def _start_request_scope(cls):
         token = _GLOBAL_REQUEST_STORE.set({})
+
+        for observer in _OBSERVERS:
+            observer.on_request_scope_start()
+
         return token
 
+    @classmethod
+    def _notify_request_scope_end(cls, store: dict[Any, Any], start: int, failures: int):
+        teardown_ns = time.perf_counter_ns() - start
+        store_size = sum(1 for _ in cls.iter_instances(store))
+
+        for observer in _OBSERVERS:
+            observer.on_request_scope_end(store_size, teardown_ns, failures)
+
     @classmethod
     def _exit_request_scope(cls, token, exc_info=None):
         store = _GLOBAL_REQUEST_STORE.get(token)
+        start = time.perf_counter_ns()
+        failures = 0
 
         context_managers = store.get(cls.CONTEXT_MANAGERS_KEY, [])
 
@@ -99,7 +150,7 @@ class RequestScopeService:
                         cm.close()
 
                 except Exception:
-                    pass
+                    failures += 1
         else:
             for cm in reversed(context_managers):
                 try:
@@ -109,13 +160,18 @@ class RequestScopeService:
                         cm.close()
 
                 except Exception:
-                    pass
+                    failures += 1
+
+        if _OBSERVERS:
+            cls._notify_request_scope_end(store, start, failures)
 
         _GLOBAL_REQUEST_STORE.reset(token)
 
     @classmethod
     async def _exit_request_scope_async(cls, token, exc_info=None):
         store = _GLOBAL_REQUEST_STORE.get()
+        start = time.perf_counter_ns()
+        failures = 0
         context_managers = store.get(cls.CONTEXT_MANAGERS_KEY, [])
 
         if exc_info and exc_info[0] is not None:
@@ -130,7 +186,7 @@ class RequestScopeService:
                     elif hasattr(cm, 'close'):
                         cm.close()
                 except Exception:
-                    pass
+                    failures += 1
         else:
             for cm in reversed(context_managers):
                 try:
@@ -143,6 +199,9 @@ class RequestScopeService:
                     elif hasattr(cm, 'close'):
                         cm.close()
                 except Exception:
-                    pass
+                    failures += 1
+
+        if _OBSERVERS:
+            cls._notify_request_scope_end(store, start, failures)
 
         _GLOBAL_REQUEST_STORE.reset(token)
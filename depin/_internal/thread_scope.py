@@ -0,0 +1,104 @@
+import threading
+import weakref
+from typing import Any
+
+_THREAD_LOCAL = threading.local()
+
+
+class _ThreadStore(dict[Any, Any]):
+    """Plain dict subclass, only needed so the store can be weakly referenced."""
+
+
+class ThreadScopeService:
+    CONTEXT_MANAGERS_KEY = '__Context_Managers__'
+    CHILD_STORES_KEY = '__Child_Stores__'
+
+    @classmethod
+    def get_thread_store(cls) -> dict[Any, Any]:
+        store = getattr(_THREAD_LOCAL, 'store', None)
+
+        if store is None:
+            store = cls._start_thread_scope()
+
+        return store
+
+    @classmethod
+    def get_thread_key(cls, item):
+        return item
+
+    @classmethod
+    def exit_thread_scope(cls):
+        """Tears down every THREAD scoped instance of the current thread.
+
+        This happens automatically when the thread exits, call it explicitly for
+        long-lived threads (e.g. the main thread) that want to release their instances earlier.
+        """
+
+        finalizer = getattr(_THREAD_LOCAL, 'finalizer', None)
+
+        if finalizer is None:
+            return
+
+        del _THREAD_LOCAL.store
+        del _THREAD_LOCAL.finalizer
+
+        finalizer()
+
+    @classmethod
+    def _start_thread_scope(cls):
+        store = _ThreadStore()
+        context_managers: list[Any] = []
+        store[cls.CONTEXT_MANAGERS_KEY] = context_managers
+
+        # threading.local releases the store when its thread exits, which triggers the cleanup
+        _THREAD_LOCAL.finalizer = weakref.finalize(
+            store, cls._exit_thread, threading.get_ident(), threading.current_thread().name, context_managers
+        )
+        _THREAD_LOCAL.store = store
+
+        return store
+
+    @classmethod
+    def _exit_thread(cls, ident: int, name: str, context_managers: list[Any]):
+        if any(thread.ident == ident for thread in threading.enumerate()):
+            cls._exit_context_managers(context_managers)
+            return
+
+        # the store is released while the interpreter destroys the thread state, after `threading`
+        # unregistered the thread: code calling `threading.current_thread()` there (e.g. logging)
+        # would create dummy threads. The teardown runs on a thread of its own, awaited by the exiting one
+        done = threading.Lock()
+        done.acquire()
+
+        def teardown():
+            try:
+                cls._exit_context_managers(context_managers)
+            finally:
+                done.release()
+
+        # an explicit `daemon` keeps `Thread.__init__` from calling `current_thread()`
+        thread = threading.Thread(target=teardown, name=f'{name}-teardown', daemon=False)
+
+        try:
+            thread.start()
+        except RuntimeError:
+            # threads can't be started during interpreter shutdown
+            done.release()
+            cls._exit_context_managers(context_managers)
+            return
+
+        done.acquire()
+
+    @staticmethod
+    def _exit_context_managers(context_managers: list[Any]):
+        for cm in reversed(context_managers):
+            try:
+                if hasattr(cm, '__exit__'):
+                    cm.__exit__(None, None, None)
+                elif hasattr(cm, 'close'):
+                    cm.close()
+
+            except Exception:
+                pass
+
+        context_managers.clear()
@@ -0,0 +1,228 @@
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Callable
+
+from depin._internal.check import describe
+from depin._internal.profiling import ResolutionObserver
+from depin._internal.request_scope import RequestScopeService
+from depin._internal.types import ProviderInfo, ProviderSource, Scope
+
+if TYPE_CHECKING:
+    from depin._internal.container import Container
+
+logger = logging.getLogger('depin.trace')
+
+
+class TraceNode:
+    __slots__ = ('source', 'scope', 'cached', 'start_ns', 'duration_ns', 'failed', 'children')
+
+    def __init__(self, source: ProviderSource, scope: Scope, cached: bool, start_ns: int):
+        self.source = source
+        self.scope = scope
+        self.cached = cached
+        self.start_ns = start_ns
+        self.duration_ns = 0
+        self.failed = False
+        self.children: list[TraceNode] = []
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'provider': describe(self.source),
+            'scope': self.scope.value,
+            'cached': self.cached,
+            'duration_ns': self.duration_ns,
+            'failed': self.failed,
+            'children': [child.to_dict() for child in self.children],
+        }
+
+
+class RequestTrace:
+    """Resolutions made in one request scope, as a tree of `TraceNode`s.
+
+    Dependencies built for a provider are its children; cache hits are leaves with `cached` set.
+    """
+
+    __slots__ = ('start_ns', 'duration_ns', 'children', '_token')
+
+    def __init__(self, start_ns: int):
+        self.start_ns = start_ns
+        # set when the request scope ends
+        self.duration_ns: int | None = None
+        self.children: list[TraceNode] = []
+        self._token: Token[Any] | None = None
+
+    @property
+    def resolution_ns(self) -> int:
+        return sum(child.duration_ns for child in self.children)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'duration_ns': self.duration_ns,
+            'resolution_ns': self.resolution_ns,
+            'children': [child.to_dict() for child in self.children],
+        }
+
+    def render(self) -> str:
+        duration = f'{self.duration_ns / 1_000_000:.2f}ms' if self.duration_ns is not None else 'open'
+        lines = [f'request scope {duration}, {self.resolution_ns / 1_000_000:.2f}ms resolving']
+
+        def visit(node: TraceNode, depth: int):
+            status = 'hit' if node.cached else f'{node.duration_ns / 1_000_000:.2f}ms'
+
+            if node.failed:
+                status += ', failed'
+
+            lines.append(f'{"  " * depth}{describe(node.source)} [{node.scope.value}] {status}')
+
+            for child in node.children:
+                visit(child, depth + 1)
+
+        for child in self.children:
+            visit(child, 1)
+
+        return '\n'.join(lines)
+
+
+class ResolutionTracer(ResolutionObserver):
+    """Records the resolution tree of sampled request scopes.
+
+    The trace of the current request scope is returned by `ResolutionTracer.current()`.
+    Traces of request scopes lasting `threshold` seconds or more are handed to `report`
+    (logged as warnings on the `depin.trace` logger by default). The tracer only observes
+    the container while a sampled request scope is active: resolutions pay nothing
+    otherwise, and a context variable lookup in unsampled scopes running alongside one.
+
+    ### Example:
+        ```py
+        tracer = ResolutionTracer(sample_rate=0.01, threshold=0.5).install(DI)
+
+        @app.get('/debug')
+        async def handler():
+            trace = ResolutionTracer.current()
+        ```
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        threshold: float | None = None,
+        report: Callable[[RequestTrace], None] | None = None,
+    ):
+        self.sample_rate = sample_rate
+        self.threshold_ns = int(threshold * 1_000_000_000) if threshold is not None else None
+        self.report = report or _log_trace
+        self._node: ContextVar[TraceNode | RequestTrace | None] = ContextVar('depin_trace_node', default=None)
+        self._containers: tuple['Container', ...] = ()
+        # sampled request scopes in progress, the tracer observes its containers while there are some
+        self._sampled = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def current(cls) -> RequestTrace | None:
+        """Returns the trace of the current request scope, None when it is not sampled."""
+
+        return RequestScopeService.get_request_store().get(RequestScopeService.TRACE_KEY)
+
+    def install(self, container: 'Container') -> 'ResolutionTracer':
+        """Starts tracing resolutions through `container` in sampled request scopes."""
+
+        with self._lock:
+            self._containers = (*self._containers, container)
+
+            if self._sampled:
+                container.add_observer(self)
+
+        RequestScopeService.add_observer(self)
+
+        return self
+
+    def uninstall(self, container: 'Container'):
+        with self._lock:
+            self._containers = tuple(item for item in self._containers if item is not container)
+            container.remove_observer(self)
+
+        if not self._containers:
+            RequestScopeService.remove_observer(self)
+
+    def on_hit(self, source: ProviderSource, provider_info: ProviderInfo) -> None:
+        parent = self._node.get()
+
+        if parent is not None:
+            parent.children.append(TraceNode(source, provider_info.scope, True, time.perf_counter_ns()))
+
+    def on_start(self, source: ProviderSource, provider_info: ProviderInfo) -> Any:
+        parent = self._node.get()
+
+        if parent is None:
+            return None
+
+        node = TraceNode(source, provider_info.scope, False, time.perf_counter_ns())
+        parent.children.append(node)
+
+        return node, self._node.set(node)
+
+    def on_end(
+        self, source: ProviderSource, provider_info: ProviderInfo, state: Any, error: BaseException | None
+    ) -> None:
+        if state is None:
+            return
+
+        node, token = state
+        node.duration_ns = time.perf_counter_ns() - node.start_ns
+        node.failed = error is not None
+        self._node.reset(token)
+
+    def on_request_scope_start(self):
+        if random.random() >= self.sample_rate:
+            return
+
+        store = RequestScopeService.get_request_store()
+
+        # the scope is traced by another tracer already
+        if RequestScopeService.TRACE_KEY in store:
+            return
+
+        with self._lock:
+            self._sampled += 1
+
+            if self._sampled == 1:
+                for container in self._containers:
+                    container.add_observer(self)
+
+        trace = RequestTrace(time.perf_counter_ns())
+        trace._token = self._node.set(trace)  # pyright: ignore[reportPrivateUsage]
+        store[RequestScopeService.TRACE_KEY] = trace
+
+    def on_request_scope_end(self, store_size: int, teardown_ns: int, failures: int):
+        trace = RequestScopeService.get_request_store().get(RequestScopeService.TRACE_KEY)
+
+        # the trace is another tracer's when several are installed
+        if trace is None or trace._token is None or trace._token.var is not self._node:  # pyright: ignore[reportPrivateUsage]
+            return
+
+        trace.duration_ns = time.perf_counter_ns() - trace.start_ns
+
+        try:
+            self._node.reset(trace._token)  # pyright: ignore[reportPrivateUsage]
+        except ValueError:
+            # the scope was entered in another context (e.g. a middleware task)
+            self._node.set(None)
+
+        trace._token = None  # pyright: ignore[reportPrivateUsage]
+
+        with self._lock:
+            self._sampled -= 1
+
+            if not self._sampled:
+                for container in self._containers:
+                    container.remove_observer(self)
+
+        if self.threshold_ns is not None and trace.duration_ns >= self.threshold_ns:
+            self.report(trace)
+
+
+def _log_trace(trace: RequestTrace):
+    logger.warning('slow request scope\n%s', trace.render())
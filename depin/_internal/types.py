@@ -10,10 +10,13 @@ type Resolvable[T] = (
     | Callable[..., Generator[T, Any, Any]]
 )
 
-type Provider[T] = Callable[[], T] | Callable[[], Awaitable[T]]
+type Provider[T] = Callable[[Any], T] | Callable[[Any], Awaitable[T]]
 type ProviderSource[T = Any] = type[T] | Resolvable[T]
 
 
+MISSING: Any = object()
+
+
 class Request[T]: ...
 
 
@@ -27,6 +30,8 @@ class Scope(Enum):
     SINGLETON = 'singleton'
     TRANSIENT = 'transient'
     REQUEST = 'request'
+    THREAD = 'thread'
+    EVENT_LOOP = 'event_loop'
 
 
 @dataclass
@@ -34,14 +39,33 @@ class Token:
     name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderInfo[T = Any]:
+    """Immutable provider record, shared by a binding's key and all of its aliases.
+
+    Flags are computed once at registration so resolution never re-inspects the source.
+    """
+
     provider: Provider[T]
     source: ProviderSource[T]
     needs_async: bool
     scope: Scope
+    is_async: bool = False
+    is_generator: bool = False
+    fork_safe: bool = True
+    blocking: bool = False
+    lookup: Callable[[Any], Any] | None = None
+
+
+@dataclass(frozen=True)
+class ContainerSnapshot:
+    providers: dict[Any, ProviderInfo]
+    singletons: dict[Any, Any]
+    singleton_resources: dict[Any, Any]
 
 
 class ProviderDependency:
+    __slots__ = ('provider_source',)
+
     def __init__(self, provider_source: ProviderSource[Any]) -> None:
         self.provider_source = provider_source
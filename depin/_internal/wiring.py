@@ -0,0 +1,205 @@
+import hashlib
+import inspect
+import threading
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from depin._internal.helpers import IntrospectionCache, Parameter, import_object, inspect_parameters
+from depin._internal.types import ProviderDependency, ProviderSource
+
+if TYPE_CHECKING:
+    from depin._internal.container import Container
+
+# bumped when the layout of generated modules changes, older modules are ignored
+WIRING_VERSION = 1
+
+# `Parameter` with the dependency as an import path
+type WiredParameter = tuple[str, str | None, bool, bool]
+
+
+class WiringInfo(NamedTuple):
+    module: str | None
+    providers: int
+    hits: int
+    stale: tuple[str, ...]
+
+
+class Wiring:
+    """Provider parameters recorded by `python -m depin generate`, used instead of introspecting providers.
+
+    Records are keyed by the provider's import path and carry a fingerprint of its
+    signature, a provider changed since the module was generated is introspected at
+    runtime instead.
+    """
+
+    def __init__(self, module: str | None, records: dict[str, tuple[str, tuple[WiredParameter, ...]]]):
+        self.module = module
+        self.records = records
+        self.hits = 0
+        self.stale: set[str] = set()
+        # weak like the introspection cache, wired parameters must not keep local classes and lambdas alive
+        self._resolved = IntrospectionCache()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, module: str) -> 'Wiring':
+        """Imports a generated module, a missing or outdated one gives an empty wiring."""
+
+        try:
+            generated = import_module(module)
+        except ImportError:
+            return cls(module, {})
+
+        if getattr(generated, 'WIRING_VERSION', None) != WIRING_VERSION:
+            return cls(module, {})
+
+        return cls(module, generated.WIRING)
+
+    def get(self, source: ProviderSource) -> tuple[Parameter, ...] | None:
+        parameters = self._resolved.cached(source, 'parameters', self._resolve)
+
+        if parameters is not None:
+            with self._lock:
+                self.hits += 1
+
+        return parameters
+
+    def info(self) -> WiringInfo:
+        return WiringInfo(self.module, len(self.records), self.hits, tuple(sorted(self.stale)))
+
+    def _resolve(self, source: ProviderSource) -> tuple[Parameter, ...] | None:
+        key = wiring_key(source)
+
+        if key is None or key not in self.records:
+            return None
+
+        expected, wired = self.records[key]
+
+        if fingerprint(source) != expected:
+            self.stale.add(key)
+            return None
+
+        try:
+            return tuple(
+                (name, import_object(dependency) if dependency is not None else None, inject, required)
+                for name, dependency, inject, required in wired
+            )
+        except (ImportError, AttributeError):
+            self.stale.add(key)
+            return None
+
+
+def wiring_key(source: ProviderSource) -> str | None:
+    # generic aliases and bound methods forward `__qualname__` to another object
+    if not isinstance(source, type) and not inspect.isfunction(source):
+        return None
+
+    module = getattr(source, '__module__', None)
+    qualname = getattr(source, '__qualname__', None)
+
+    # local classes and functions can share a qualified name
+    if not isinstance(module, str) or not isinstance(qualname, str) or '<' in qualname:
+        return None
+
+    return f'{module}:{qualname}'
+
+
+def fingerprint(source: ProviderSource) -> str:
+    """Hash of the parameter names, annotations and defaults of a provider, computed without `inspect`."""
+
+    func = inspect.unwrap(source.__init__ if isinstance(source, type) else source)
+    code = getattr(func, '__code__', None)
+
+    if code is None:
+        # builtins and slot wrappers (e.g. `object.__init__`) have no parameters to inject
+        data: Any = repr(func)
+    else:
+        names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount + code.co_posonlyargcount]
+        annotations = func.__annotations__ or {}
+        defaults = [*(func.__defaults__ or ()), *(func.__kwdefaults__ or {}).values()]
+        data = (
+            names,
+            sorted((name, _describe_annotation(value)) for name, value in annotations.items()),
+            [_describe_default(value) for value in defaults],
+        )
+
+    return hashlib.blake2b(repr(data).encode(), digest_size=8).hexdigest()
+
+
+def generate_wiring(container: 'Container', target: str | None = None) -> str:
+    """Returns the source of a wiring module for every provider registered in `container`.
+
+    Providers defined in local scopes or depending on objects that can't be imported
+    (e.g. generic aliases) are left out and introspected at runtime.
+    """
+
+    from depin._internal.check import get_bindings
+    from depin._internal.process_pool import import_path
+
+    records: dict[str, tuple[str, tuple[WiredParameter, ...]]] = {}
+    pending = [provider_info.source for provider_info in get_bindings(container).values()]
+    seen: set[Any] = set()
+
+    while pending:
+        source = pending.pop()
+
+        if source in seen:
+            continue
+
+        seen.add(source)
+        key = wiring_key(source)
+
+        if key is None:
+            continue
+
+        try:
+            parameters = inspect_parameters(container._introspection, source)  # pyright: ignore[reportPrivateUsage]
+            wired = tuple(
+                (name, import_path(dependency) if dependency is not None else None, inject, required)
+                for name, dependency, inject, required in parameters
+            )
+        except (TypeError, AttributeError, NameError, ValueError):
+            continue
+
+        records[key] = (fingerprint(source), wired)
+        # unbound dependencies are inspected too when checking whether providers need async resolution
+        pending.extend(dependency for _, dependency, _, _ in parameters if dependency is not None)
+
+    command = f'python -m depin generate {target}' if target else 'python -m depin generate'
+    lines = [
+        f'"""Generated by `{command}`, do not edit.',
+        '',
+        'Regenerate it when providers change, stale entries are introspected at runtime.',
+        '"""',
+        '',
+        f'WIRING_VERSION = {WIRING_VERSION}',
+        '',
+        'WIRING = {',
+    ]
+
+    for key, (digest, wired) in sorted(records.items()):
+        lines.append(f'    {key!r}: ({digest!r}, {wired!r}),')
+
+    lines.append('}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def _describe_annotation(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+
+    module = getattr(value, '__module__', None)
+    qualname = getattr(value, '__qualname__', None)
+
+    if module is not None and qualname is not None:
+        return f'{module}.{qualname}'
+
+    return repr(value)
+
+
+def _describe_default(value: Any) -> str:
+    if isinstance(value, ProviderDependency):
+        return f'Inject({_describe_annotation(value.provider_source)})'
+
+    return type(value).__qualname__
@@ -1,4 +1,5 @@
 import contextlib
+import sys
 
 
 def wrap_sync_gen(gen_fn, params):
@@ -48,3 +49,53 @@ async def wrap_async_gen(gen_fn, params):
             if exception_to_raise:
                 raise exception_to_raise
             raise
+
+
+class wrap_async_gen_untracked:
+    """Same as `wrap_async_gen` but the generator is hidden from the running loop's asyncgen hooks.
+
+    `loop.shutdown_asyncgens()` closes every tracked generator concurrently, generators
+    wrapped here are only finalized by whoever owns the context (in reverse order).
+    """
+
+    def __init__(self, gen_fn, params):
+        self._gen = gen_fn(**params)
+
+    async def __aenter__(self):
+        firstiter, finalizer = sys.get_asyncgen_hooks()
+        sys.set_asyncgen_hooks(firstiter=None, finalizer=None)
+
+        try:
+            first = self._gen.__anext__()
+        finally:
+            sys.set_asyncgen_hooks(firstiter=firstiter, finalizer=finalizer)
+
+        return await first
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_value is None:
+                await self._gen.__anext__()
+            else:
+                await self._gen.athrow(exc_value)
+        except StopAsyncIteration:
+            pass
+        except Exception as e:
+            if e is not exc_value:
+                raise
+
+        return False
+
+
+class wrap_blocking_exit:
+    """Exposes the `__exit__` of a sync context manager as `__aexit__` running through `run_blocking`."""
+
+    def __init__(self, ctx, run_blocking):
+        self._ctx = ctx
+        self._run_blocking = run_blocking
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._ctx.__exit__(exc_type, exc_value, traceback)
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return await self._run_blocking(self._ctx.__exit__, exc_type, exc_value, traceback)
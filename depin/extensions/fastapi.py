@@ -1,9 +1,165 @@
-from typing import override
+import inspect
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import wraps
+from typing import Annotated, Any, Callable, cast, get_origin, override
 
-from fastapi import Request
+from fastapi import Depends, Request, params
+from fastapi.responses import PlainTextResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from depin._internal.container import Container
+from depin._internal.helpers import is_async_callable, is_async_generator_callable, is_generator_callable
+from depin._internal.metrics import ContainerMetrics
 from depin._internal.request_scope import RequestScopeService
+from depin._internal.types import MISSING, ProviderSource
+
+_FLAT_PARAM = '_depin_dependencies'
+METRICS_MEDIA_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def depends(container: Container, t: ProviderSource):
+    """Builds the FastAPI dependency returned by `Container.Depends`."""
+
+    dependency = container._dependencies.get(t)  # pyright: ignore[reportPrivateUsage]
+
+    if dependency is None:
+        dependency = container._dependencies[t] = _build_dependency(container, t)  # pyright: ignore[reportPrivateUsage]
+
+    return Depends(dependency)
+
+
+def flatten_depends[**P, T](container: Container, func: Callable[P, T]) -> Callable[P, T]:
+    """Rewrites `func` so all of its `Container.Depends` parameters come from one FastAPI dependency.
+
+    Used by `Container.flatten_depends`.
+    """
+
+    signature = inspect.signature(func)
+    dependencies = {dependency: source for source, dependency in container._dependencies.items()}  # pyright: ignore[reportPrivateUsage]
+    names: list[str] = []
+    sources: list[ProviderSource] = []
+
+    for name, param in signature.parameters.items():
+        source = _get_depends_source(param, dependencies)
+
+        if source is not None:
+            names.append(name)
+            sources.append(source)
+
+    if not sources:
+        return func
+
+    async def dependency():
+        # observers (metrics, tracing, profiling) see every resolution, cache hits included
+        if container._observers:  # pyright: ignore[reportPrivateUsage]
+            return await container.get_many_async(*sources)
+
+        values = []
+
+        for source in sources:
+            cached = container._get_cached(container._get_required_provider_info(source))  # pyright: ignore[reportPrivateUsage]
+
+            if cached is MISSING:
+                return await container.get_many_async(*sources)
+
+            values.append(cached)
+
+        return values
+
+    dependency.__name__ = dependency.__qualname__ = f'depends_{func.__name__}'
+
+    parameters = [param for name, param in signature.parameters.items() if name not in names]
+    flat_param = inspect.Parameter(_FLAT_PARAM, inspect.Parameter.KEYWORD_ONLY, default=Depends(dependency))
+
+    if parameters and parameters[-1].kind == inspect.Parameter.VAR_KEYWORD:
+        parameters.insert(len(parameters) - 1, flat_param)
+    else:
+        parameters.append(flat_param)
+
+    if is_async_callable(func):
+
+        @wraps(func)
+        async def async_endpoint(*args, **kwargs):
+            kwargs.update(zip(names, kwargs.pop(_FLAT_PARAM)))
+            return await func(*args, **kwargs)  # type: ignore[misc]
+
+        endpoint = async_endpoint
+
+    else:
+
+        @wraps(func)
+        def sync_endpoint(*args, **kwargs):
+            kwargs.update(zip(names, kwargs.pop(_FLAT_PARAM)))
+            return func(*args, **kwargs)
+
+        endpoint = sync_endpoint
+
+    endpoint.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+
+    return cast(Callable[P, T], endpoint)
+
+
+def _get_depends_source(param: inspect.Parameter, dependencies: dict[Any, ProviderSource]) -> ProviderSource | None:
+    candidates = [param.default]
+
+    if get_origin(param.annotation) is Annotated:
+        candidates.extend(param.annotation.__metadata__)
+
+    for candidate in candidates:
+        if isinstance(candidate, params.Depends) and candidate.dependency in dependencies:
+            return dependencies[candidate.dependency]
+
+    return None
+
+
+def _build_dependency(container: Container, t: ProviderSource) -> Callable[[], Any]:
+    # always a coroutine function: FastAPI runs sync dependencies in its threadpool, which
+    # cached instances and non-blocking sync providers don't need
+    async def dependency():
+        provider_info = container._get_required_provider_info(t)  # pyright: ignore[reportPrivateUsage]
+
+        # observers (metrics, tracing, profiling) see every resolution, cache hits included
+        if container._observers:  # pyright: ignore[reportPrivateUsage]
+            return await container._resolve_observed_async(t, provider_info)  # pyright: ignore[reportPrivateUsage]
+
+        cached = container._get_cached(provider_info)  # pyright: ignore[reportPrivateUsage]
+
+        if cached is not MISSING:
+            return cached
+
+        if provider_info.is_async or provider_info.blocking:
+            return await container.get_async(t)
+
+        return provider_info.provider(container)
+
+    name = getattr(t, '__name__', None) or type(t).__name__
+    dependency.__name__ = dependency.__qualname__ = f'depends_{name}'
+
+    return_type = _get_return_type(container, t)
+
+    if return_type is not None:
+        dependency.__annotations__ = {'return': return_type}
+
+    return dependency
+
+
+def _get_return_type(container: Container, t: ProviderSource) -> Any:
+    provider_info = container._get_provider_info(t)  # pyright: ignore[reportPrivateUsage]
+    source = provider_info.source if provider_info is not None else t
+
+    if isinstance(t, type):
+        return t
+
+    if isinstance(source, type):
+        return source
+
+    if is_generator_callable(source) or is_async_generator_callable(source):
+        return None
+
+    try:
+        return container._introspection.type_hints(source).get('return')  # pyright: ignore[reportPrivateUsage]
+    except (TypeError, NameError):
+        return None
 
 
 class RequestScopeMiddleware(BaseHTTPMiddleware):
@@ -30,3 +186,46 @@ class RequestScopeMiddleware(BaseHTTPMiddleware):
             RequestScopeService.set_current_request(request)
 
             return await call_next(request)
+
+
+def container_lifespan(container: Container, lifespan: Callable[[Any], AbstractAsyncContextManager[Any]] | None = None):
+    """Builds a FastAPI lifespan that tears down the container's SINGLETON resources on shutdown.
+
+    Args:
+        container: Container closed (`Container.aclose`) when the application shuts down.
+        lifespan: Optional application lifespan wrapped by the returned one.
+
+    ### Example:
+        ```py
+        app = FastAPI(lifespan=container_lifespan(DI))
+        ```
+    """
+
+    @asynccontextmanager
+    async def _lifespan(app: Any):
+        try:
+            if lifespan is None:
+                yield
+            else:
+                async with lifespan(app) as state:
+                    yield state
+        finally:
+            await container.aclose()
+
+    return _lifespan
+
+
+def add_metrics_route(app: Any, metrics: ContainerMetrics, path: str = '/metrics'):
+    """Exposes `metrics` on `path` in the Prometheus text exposition format.
+
+    ### Example:
+        ```py
+        metrics = ContainerMetrics().install(DI)
+        add_metrics_route(app, metrics)
+        ```
+    """
+
+    async def depin_metrics() -> PlainTextResponse:
+        return PlainTextResponse(metrics.render(), media_type=METRICS_MEDIA_TYPE)
+
+    app.add_api_route(path, depin_metrics, methods=['GET'], include_in_schema=False)
@@ -9,7 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
 from fastapi import FastAPI, Request
 
 from depin import Inject, RequestScopeService, Scope
-from depin.extensions.fastapi import RequestScopeMiddleware
+from depin.extensions.fastapi import RequestScopeMiddleware, container_lifespan
 from example.database import Session
 from example.dependencies.container import DI
 from example.dependencies.database import db_session
@@ -28,7 +28,7 @@ async def lifespan(app: FastAPI):
     yield
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=container_lifespan(DI, lifespan))
 
 app.add_middleware(RequestScopeMiddleware)
 
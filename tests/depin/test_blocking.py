@@ -0,0 +1,173 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from depin import Container, Inject, RequestScopeService, Scope
+
+
+@pytest.mark.asyncio
+async def test_blocking_provider_runs_off_the_event_loop():
+    c = Container()
+    threads = []
+
+    @c.register(Scope.TRANSIENT, blocking=True)
+    def client():
+        threads.append(threading.get_ident())
+        return 'client'
+
+    assert await c.get_async(client) == 'client'
+    assert threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_blocking_cache_hits_do_not_leave_the_loop():
+    c = Container()
+    calls = []
+
+    @c.register(Scope.SINGLETON, blocking=True)
+    def settings():
+        calls.append(threading.get_ident())
+        return object()
+
+    assert await c.get_async(settings) is await c.get_async(settings)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_blocking_provider_sees_request_scope():
+    c = Container()
+
+    @c.register(Scope.REQUEST)
+    def session():
+        return object()
+
+    @c.register(Scope.REQUEST, blocking=True)
+    def repository(s: object = Inject(session)):
+        return s
+
+    async with RequestScopeService.request_scope_async():
+        s = c.get(session)
+
+        assert await c.get_async(repository) is s
+        assert await c.get_async(repository) is s
+
+
+@pytest.mark.asyncio
+async def test_blocking_teardown_runs_in_executor():
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='depin-test')
+    c = Container(blocking=True, executor=executor)
+    closed = []
+
+    @c.register(Scope.REQUEST)
+    def connection():
+        yield 'connection'
+
+        closed.append(threading.current_thread().name)
+
+    async with RequestScopeService.request_scope_async():
+        assert await c.get_async(connection) == 'connection'
+
+    executor.shutdown()
+
+    assert len(closed) == 1
+    assert closed[0].startswith('depin-test')
+
+
+def test_blocking_provider_resolves_inline_on_sync_path():
+    c = Container(blocking=True)
+
+    @c.register(Scope.SINGLETON)
+    def pool():
+        yield threading.get_ident()
+
+        closed.append(pool)
+
+    closed = []
+
+    assert c.get(pool) == threading.get_ident()
+
+    c.close()
+
+    assert closed == [pool]
+
+
+@pytest.mark.asyncio
+async def test_blocking_provider_with_async_dependencies_runs_off_the_event_loop():
+    c = Container()
+    loop_thread = threading.get_ident()
+    threads = {}
+
+    @c.register(Scope.REQUEST)
+    async def session():
+        threads['session'] = threading.get_ident()
+        return 'session'
+
+    @c.register(Scope.REQUEST, blocking=True)
+    def repository(s: str = Inject(session)):
+        threads['repository'] = threading.get_ident()
+        return f'repository:{s}'
+
+    class Service:
+        def __init__(self, repository: str = Inject(repository), s: str = Inject(session)):
+            threads['service'] = threading.get_ident()
+            self.repository = repository
+
+    c.bind(source=Service, scope=Scope.TRANSIENT, blocking=True)
+
+    async with RequestScopeService.request_scope_async():
+        service = await c.get_async(Service)
+
+    assert service.repository == 'repository:session'
+    assert threads['session'] == loop_thread
+    assert threads['repository'] != loop_thread
+    assert threads['service'] != loop_thread
+
+
+def test_blocking_event_loop_scope_rejected():
+    c = Container()
+
+    with pytest.raises(ValueError, match='not supported in event_loop scope'):
+
+        @c.register(Scope.EVENT_LOOP, blocking=True)
+        def client():
+            return 'client'
+
+
+def test_container_default_skips_event_loop_scope():
+    c = Container(blocking=True)
+
+    @c.register(Scope.EVENT_LOOP)
+    def client():
+        return 'client'
+
+    assert c._get_provider_info(client).blocking is False  # type: ignore[union-attr]
+
+
+def test_blocking_thread_scope_rejected():
+    c = Container()
+
+    with pytest.raises(ValueError, match='not supported in thread scope'):
+
+        @c.register(Scope.THREAD, blocking=True)
+        def connection():
+            return 'connection'
+
+
+@pytest.mark.asyncio
+async def test_container_default_skips_thread_scope():
+    c = Container(blocking=True)
+    threads = []
+
+    class Connection:
+        def __init__(self):
+            threads.append(threading.get_ident())
+
+    c.bind(source=Connection, scope=Scope.THREAD)
+
+    first = await c.get_async(Connection)
+    second = await c.get_async(Connection)
+
+    assert first is second
+    assert c.get(Connection) is first
+    assert threads == [threading.get_ident()]
@@ -0,0 +1,154 @@
+import pytest
+
+from depin import Container, Inject, Scope
+from depin._internal.cli import main
+
+BROKEN = Container()
+HEALTHY = Container()
+
+
+class Session: ...
+
+
+class Repository:
+    def __init__(self, session: Session):
+        self.session = session
+
+
+class Cache:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+
+BROKEN.bind(source=Session, scope=Scope.REQUEST)
+BROKEN.bind(source=Repository, scope=Scope.TRANSIENT)
+BROKEN.bind(source=Cache, scope=Scope.SINGLETON)
+
+HEALTHY.bind(source=Session, scope=Scope.REQUEST)
+HEALTHY.bind(source=Repository, scope=Scope.REQUEST)
+
+
+def kinds(container: Container) -> list[str]:
+    return sorted(issue.kind for issue in container.check())
+
+
+def test_check_reports_captive_dependency_through_transients():
+    [issue] = BROKEN.check()
+
+    assert (issue.kind, issue.severity, issue.source) == ('captive', 'error', Cache)
+    assert 'SINGLETON provider captures REQUEST dependency' in issue.message
+    assert 'Repository -> ' in issue.message
+
+
+def test_check_reports_missing_providers():
+    c = Container()
+
+    class Logger: ...
+
+    def audit(): ...
+
+    class Service:
+        def __init__(self, logger: Logger, sink=Inject(audit)):
+            self.logger = logger
+
+    c.bind(source=Service, scope=Scope.TRANSIENT)
+
+    [issue] = c.check()
+
+    assert issue.kind == 'missing'
+    assert "Cannot resolve parameter 'logger'" in issue.message
+
+    c.bind(source=Logger, scope=Scope.SINGLETON)
+
+    [issue] = c.check()
+
+    assert issue.kind == 'missing'
+    assert "parameter 'sink'" in issue.message
+
+
+def test_check_reports_each_cycle_once():
+    c = Container()
+
+    @c.register(Scope.TRANSIENT)
+    def config():
+        return 'default'
+
+    @c.register(Scope.TRANSIENT)
+    def service(value: str = Inject(config)):
+        return value
+
+    # the new binding is analysed against the old one, so bind can't see the cycle it closes
+    c.bind(abstract=config, source=lambda value=Inject(service): value, scope=Scope.TRANSIENT)  # type: ignore[arg-type]
+
+    [issue] = c.check()
+
+    assert issue.kind == 'cycle'
+    assert 'Circular dependency detected' in issue.message
+
+
+def test_check_warns_about_sync_singleton_with_async_dependencies():
+    c = Container()
+
+    @c.register(Scope.REQUEST)
+    async def session():
+        return 'session'
+
+    @c.register(Scope.SINGLETON)
+    def settings(s: str = Inject(session)):
+        return s
+
+    assert {(issue.kind, issue.severity) for issue in c.check()} == {('async', 'warning'), ('captive', 'error')}
+
+
+def test_check_inherits_parent_bindings():
+    child = HEALTHY.child()
+    child.bind(source=Cache, scope=Scope.SINGLETON)
+
+    assert kinds(HEALTHY) == []
+    assert kinds(child) == ['captive']
+
+
+def test_cli_exit_status(capsys):
+    assert main(['check', f'{__name__}:HEALTHY']) == 0
+    assert 'Checked 2 providers (2 request): 0 errors, 0 warnings' in capsys.readouterr().out
+
+    assert main(['check', f'{__name__}:BROKEN']) == 1
+    assert 'error[captive]' in capsys.readouterr().out
+
+
+CYCLIC_MODULE = """
+from depin import Container, Scope
+
+DI = Container()
+
+
+class A:
+    def __init__(self, b: 'B'):
+        self.b = b
+
+
+class B:
+    def __init__(self, a: A):
+        self.a = a
+
+
+DI.bind(source=A, scope=Scope.SINGLETON)
+DI.bind(source=B, scope=Scope.SINGLETON)
+"""
+
+
+def test_cli_reports_errors_raised_while_importing_the_container(tmp_path, monkeypatch, capsys):
+    (tmp_path / 'depin_check_cyclic.py').write_text(CYCLIC_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(['check', 'depin_check_cyclic:DI'])
+
+    assert exit_info.value.code == 1
+    assert 'error[cycle] depin_check_cyclic.A: Circular dependency detected' in capsys.readouterr().out
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(['check', 'depin_check_does_not_exist:DI'])
+
+    assert exit_info.value.code == 1
+    assert "error[import] 'depin_check_does_not_exist:DI': ModuleNotFoundError" in capsys.readouterr().out
@@ -0,0 +1,121 @@
+import gc
+import weakref
+
+import pytest
+
+from depin import Container, RequestScopeService, Scope
+from depin._internal.exceptions import MissingProviderError
+
+
+def test_child_falls_back_to_parent_bindings():
+    c = Container()
+
+    class Config: ...
+
+    c.bind(source=Config, scope=Scope.TRANSIENT)
+
+    assert isinstance(c.child().get(Config), Config)
+
+
+def test_child_overrides_are_local():
+    c = Container()
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    c.bind(source=Engine, scope=Scope.TRANSIENT)
+
+    child = c.child()
+    child.bind(abstract=Engine, source=FakeEngine, scope=Scope.TRANSIENT)
+
+    assert type(child.get(Engine)) is FakeEngine
+    assert type(c.get(Engine)) is Engine
+
+
+def test_child_shares_parent_singletons():
+    c = Container()
+
+    class Settings: ...
+
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+
+    assert c.child().get(Settings) is c.get(Settings) is c.child().get(Settings)
+
+
+def test_inherited_providers_resolve_dependencies_through_child():
+    c = Container()
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    class Repository:
+        def __init__(self, engine: Engine):
+            self.engine = engine
+
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+    c.bind(source=Repository, scope=Scope.REQUEST)
+
+    child = c.child()
+    child.bind(abstract=Engine, source=FakeEngine, scope=Scope.SINGLETON)
+
+    with RequestScopeService.request_scope():
+        parent_repo = c.get(Repository)
+        child_repo = child.get(Repository)
+
+        assert child.get(Repository) is child_repo
+
+    assert type(parent_repo.engine) is Engine
+    assert type(child_repo.engine) is FakeEngine
+
+
+def test_dropped_child_is_collected_with_its_thread_instances():
+    c = Container()
+
+    class Connection: ...
+
+    c.bind(source=Connection, scope=Scope.THREAD)
+
+    child = c.child()
+    connection = child.get(Connection)
+
+    assert child.get(Connection) is connection
+    assert c.get(Connection) is not connection
+
+    child_ref = weakref.ref(child)
+    connection_ref = weakref.ref(connection)
+    del child, connection
+    gc.collect()
+
+    assert child_ref() is None
+    assert connection_ref() is None
+
+
+def test_child_plans_invalidated_when_parent_is_rebound():
+    c = Container()
+    default = object()
+
+    class Config: ...
+
+    class Service:
+        def __init__(self, config: Config = default):  # type: ignore[assignment]
+            self.config = config
+
+    c.bind(source=Service, scope=Scope.TRANSIENT)
+    child = c.child()
+
+    assert child.get(Service).config is default
+
+    c.bind(source=Config, scope=Scope.SINGLETON)
+
+    assert child.get(Service).config is c.get(Config)
+
+
+def test_child_missing_provider_raises():
+    child = Container().child()
+
+    class Logger: ...
+
+    with pytest.raises(MissingProviderError, match='not registered'):
+        child.get(Logger)
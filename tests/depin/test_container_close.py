@@ -0,0 +1,186 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from depin import Container, Inject, Scope
+from depin.extensions.fastapi import container_lifespan
+
+
+def test_singleton_generator_same_instance_and_close():
+    c = Container()
+    events = []
+
+    @c.register(Scope.SINGLETON)
+    def pool():
+        events.append('open')
+        yield 'pool'
+
+        events.append('close')
+
+    assert c.get(pool) is c.get(pool)
+    assert events == ['open']
+
+    c.close()
+
+    assert events == ['open', 'close']
+
+
+def test_close_tears_down_in_reverse_dependency_order():
+    c = Container()
+    closed = []
+
+    @c.register(Scope.SINGLETON)
+    def engine():
+        yield 'engine'
+
+        closed.append(engine)
+
+    @c.register(Scope.SINGLETON)
+    def pool(e: str = Inject(engine)):
+        yield f'pool({e})'
+
+        closed.append(pool)
+
+    assert c.get(pool) == 'pool(engine)'
+
+    c.close()
+
+    assert closed == [pool, engine]
+
+
+def test_close_raises_for_async_resources():
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    async def pool():
+        yield 'pool'
+
+    asyncio.run(c.get_async(pool))
+
+    with pytest.raises(RuntimeError, match='use aclose instead'):
+        c.close()
+
+
+def test_singleton_rebuilt_after_close():
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    def pool():
+        yield object()
+
+    first = c.get(pool)
+    c.close()
+
+    assert c.get(pool) is not first
+
+
+def test_close_tears_down_resources_of_rebound_singletons():
+    c = Container()
+    closed = []
+
+    def pool(name: str):
+        def provider():
+            yield name
+
+            closed.append(name)
+
+        return provider
+
+    class Pool: ...
+
+    c.bind(abstract=Pool, source=pool('first'), scope=Scope.SINGLETON)
+    assert c.get(Pool) == 'first'
+
+    c.bind(abstract=Pool, source=pool('second'), scope=Scope.SINGLETON)
+    assert c.get(Pool) == 'second'
+    assert closed == []
+
+    c.close()
+
+    assert closed == ['second', 'first']
+
+
+def test_restore_keeps_resources_of_rebound_singletons_from_the_snapshot():
+    c = Container()
+    closed = []
+
+    @c.register(Scope.SINGLETON)
+    def pool():
+        yield 'pool'
+
+        closed.append('pool')
+
+    c.get(pool)
+    snapshot = c.snapshot()
+
+    c.register(Scope.SINGLETON)(pool)
+    c.get(pool)
+    c.restore(snapshot)
+
+    assert closed == ['pool']
+    assert c.get(pool) == 'pool'
+
+    c.close()
+
+    assert closed == ['pool', 'pool']
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_dependents_first_and_independent_concurrently():
+    c = Container()
+    events = []
+
+    @c.register(Scope.SINGLETON)
+    async def engine():
+        yield 'engine'
+
+        events.append('engine')
+
+    @c.register(Scope.SINGLETON)
+    async def pool(e: str = Inject(engine)):
+        yield 'pool'
+
+        events.append('pool:start')
+        await asyncio.sleep(0.01)
+        events.append('pool:end')
+
+    @c.register(Scope.SINGLETON)
+    async def cache():
+        yield 'cache'
+
+        events.append('cache:start')
+        await asyncio.sleep(0.01)
+        events.append('cache:end')
+
+    await c.get_async(pool)
+    await c.get_async(cache)
+
+    await c.aclose()
+
+    assert set(events[:2]) == {'pool:start', 'cache:start'}
+    assert events[-1] == 'engine'
+
+
+def test_container_lifespan_closes_container_on_shutdown():
+    c = Container()
+    closed = []
+
+    @c.register(Scope.SINGLETON)
+    async def pool():
+        yield 'pool'
+
+        closed.append(pool)
+
+    app = FastAPI(lifespan=container_lifespan(c))
+
+    @app.get('/')
+    async def index(p: str = c.Depends(pool)):
+        return {'pool': p}
+
+    with TestClient(app) as client:
+        assert client.get('/').json() == {'pool': 'pool'}
+        assert closed == []
+
+    assert closed == [pool]
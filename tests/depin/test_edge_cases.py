@@ -131,23 +131,6 @@ def test_mixed_scopes_in_dependency_tree():
     assert t1.singleton is t2.singleton is t3.singleton
 
 
-@pytest.mark.asyncio
-async def test_generators_in_singleton_scope_raises():
-    c = Container()
-
-    async def async_gen():
-        yield 23
-
-    def sync_gen():
-        yield 23
-
-    with pytest.raises(RuntimeError, match='Async generators are not supported'):
-        c.bind(source=async_gen, scope=Scope.SINGLETON)
-
-    with pytest.raises(RuntimeError, match='Generators are not supported'):
-        c.bind(source=sync_gen, scope=Scope.SINGLETON)
-
-
 @pytest.mark.asyncio
 async def test_generators_in_transient_scope_raises():
     c = Container()
@@ -206,3 +189,24 @@ def test_register_throws_exception_for_missing_sources():
 
     with pytest.raises(ValueError, match='callable_source and implementation cannot be both non-none'):
         c._register(scope=Scope.TRANSIENT, abstract=None, implementation=Container, callable_source=Container)  # type: ignore
+
+
+def test_aliases_share_one_immutable_provider_record():
+    c = Container()
+
+    class Reader: ...
+
+    class Writer: ...
+
+    class Storage(Reader, Writer): ...
+
+    c.bind(source=Storage, scope=Scope.SINGLETON, aliases=[Reader, Writer])
+
+    info = c._get_provider_info(Storage)
+
+    assert info is c._get_provider_info(Reader) is c._get_provider_info(Writer)
+    assert not hasattr(info, '__dict__')
+    assert (info.scope, info.is_async, info.is_generator) == (Scope.SINGLETON, False, False)
+
+    with pytest.raises(AttributeError):
+        info.scope = Scope.TRANSIENT  # type: ignore[misc]
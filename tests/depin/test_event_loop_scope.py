@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from depin import Container, EventLoopScopeService, Scope
+
+
+def test_event_loop_scope_same_instance_within_loop():
+    c = Container()
+
+    class Session: ...
+
+    c.bind(source=Session, scope=Scope.EVENT_LOOP)
+
+    async def main():
+        return c.get(Session), await c.get_async(Session)
+
+    s1, s2 = asyncio.run(main())
+
+    assert s1 is s2
+
+
+def test_event_loop_scope_different_instances_across_loops():
+    c = Container()
+
+    @c.register(Scope.EVENT_LOOP)
+    async def session():
+        return object()
+
+    async def main():
+        return await c.get_async(session)
+
+    assert asyncio.run(main()) is not asyncio.run(main())
+
+
+def test_event_loop_scope_async_generator_cleanup_on_loop_shutdown():
+    c = Container()
+    cleaned = []
+
+    @c.register(Scope.EVENT_LOOP)
+    async def pool1():
+        yield 1
+
+        await asyncio.sleep(0)
+        cleaned.append(pool1)
+
+    @c.register(Scope.EVENT_LOOP)
+    async def pool2():
+        yield 2
+
+        cleaned.append(pool2)
+
+    async def main():
+        assert await c.get_async(pool1) == 1
+        assert await c.get_async(pool2) == 2
+        assert cleaned == []
+
+    asyncio.run(main())
+
+    assert cleaned == [pool2, pool1]
+
+
+@pytest.mark.asyncio
+async def test_exit_event_loop_scope_cleans_running_loop():
+    c = Container()
+    cleaned = []
+
+    @c.register(Scope.EVENT_LOOP)
+    def client():
+        yield 'client'
+
+        cleaned.append(client)
+
+    first = c.get(client)
+    await EventLoopScopeService.exit_event_loop_scope()
+
+    assert first == 'client'
+    assert cleaned == [client]
+
+
+def test_event_loop_scope_raises_without_running_loop():
+    c = Container()
+
+    class Session: ...
+
+    c.bind(source=Session, scope=Scope.EVENT_LOOP)
+
+    with pytest.raises(RuntimeError, match='No running event loop found'):
+        c.get(Session)
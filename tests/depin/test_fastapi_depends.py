@@ -0,0 +1,203 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from depin import Container, ContainerMetrics, Inject, RequestScopeService, ResolutionTracer, Scope
+from depin._internal.exceptions import MissingProviderError
+from depin.extensions.fastapi import RequestScopeMiddleware
+
+
+def test_depends_returns_stable_dependency_callable():
+    c = Container()
+
+    class Service: ...
+
+    c.bind(source=Service, scope=Scope.TRANSIENT)
+
+    assert c.Depends(Service).dependency is c.Depends(Service).dependency
+
+
+def test_fastapi_dedupes_repeated_depends_within_a_request():
+    c = Container()
+
+    class Service: ...
+
+    c.bind(source=Service, scope=Scope.TRANSIENT)
+
+    app = FastAPI()
+
+    def nested(s: Service = c.Depends(Service)):
+        return s
+
+    @app.get('/')
+    def index(s: Service = c.Depends(Service), n: Service = Depends(nested)):
+        return {'same': s is n}
+
+    assert TestClient(app).get('/').json() == {'same': True}
+
+
+def test_depends_exposes_provider_return_type():
+    c = Container()
+
+    class Service: ...
+
+    @c.register(Scope.TRANSIENT)
+    async def make_service() -> Service:
+        return Service()
+
+    @c.register(Scope.REQUEST)
+    def session():
+        yield 'session'
+
+    assert c.Depends(Service).dependency.__annotations__ == {'return': Service}
+    assert c.Depends(make_service).dependency.__annotations__ == {'return': Service}
+    assert c.Depends(session).dependency.__annotations__ == {}
+
+
+def test_depends_resolves_sync_and_async_providers_inline():
+    c = Container()
+
+    @c.register(Scope.REQUEST)
+    def session():
+        return object()
+
+    @c.register(Scope.REQUEST)
+    async def user(s: object = Inject(session)):
+        return s
+
+    app = FastAPI()
+    app.add_middleware(RequestScopeMiddleware)
+
+    @app.get('/')
+    async def index(s: object = c.Depends(session), u: object = c.Depends(user)):
+        return {'same': s is u is c.get(session)}
+
+    assert TestClient(app).get('/').json() == {'same': True}
+
+
+@pytest.mark.asyncio
+async def test_depends_for_unregistered_provider_raises_on_resolution():
+    c = Container()
+
+    class Service: ...
+
+    dependency = c.Depends(Service).dependency
+
+    with pytest.raises(MissingProviderError, match='not registered'):
+        await dependency()
+
+    c.bind(source=Service, scope=Scope.SINGLETON)
+
+    async with RequestScopeService.request_scope_async():
+        assert await dependency() is c.get(Service)
+
+
+def test_flatten_depends_resolves_route_dependencies_in_one_dependency():
+    c = Container()
+
+    class Settings: ...
+
+    @c.register(Scope.REQUEST)
+    async def session():
+        return object()
+
+    @c.register(Scope.REQUEST)
+    async def users(s: object = Inject(session)):
+        return s
+
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+
+    app = FastAPI()
+    app.add_middleware(RequestScopeMiddleware)
+
+    @app.get('/items/{item_id}')
+    @c.flatten_depends
+    async def read_item(
+        item_id: int,
+        settings: Settings = c.Depends(Settings),
+        s: object = c.Depends(session),
+        u: Annotated[object, c.Depends(users)] = None,
+        q: str = 'default',
+    ):
+        return {'item_id': item_id, 'q': q, 'settings': settings is c.get(Settings), 'same': s is u}
+
+    route = app.routes[-1]
+
+    assert [d.call.__name__ for d in route.dependant.dependencies] == ['depends_read_item']  # type: ignore[attr-defined]
+
+    client = TestClient(app)
+
+    assert client.get('/items/1', params={'q': 'x'}).json() == {'item_id': 1, 'q': 'x', 'settings': True, 'same': True}
+    assert client.get('/items/2').json()['q'] == 'default'
+
+
+def test_flatten_depends_keeps_sync_endpoints_and_leaves_plain_routes_untouched():
+    c = Container()
+
+    class Settings: ...
+
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+
+    def plain(q: str = 'q'):
+        return q
+
+    assert c.flatten_depends(plain) is plain
+
+    app = FastAPI()
+
+    @app.get('/')
+    @c.flatten_depends
+    def index(settings: Settings = c.Depends(Settings)):
+        return {'settings': settings is c.get(Settings)}
+
+    assert TestClient(app).get('/').json() == {'settings': True}
+
+
+def test_depends_and_flatten_depends_are_observed():
+    c = Container()
+
+    class Settings: ...
+
+    class Session:
+        def __init__(self, settings: Settings):
+            self.settings = settings
+
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+    c.bind(source=Session, scope=Scope.REQUEST)
+
+    metrics = ContainerMetrics().install(c)
+    traces = []
+    tracer = ResolutionTracer(threshold=0, report=traces.append).install(c)
+
+    app = FastAPI()
+    app.add_middleware(RequestScopeMiddleware)
+
+    @app.get('/depends')
+    async def depends(settings: Settings = c.Depends(Settings), session: Session = c.Depends(Session)):
+        return {'same': session.settings is settings}
+
+    @app.get('/flat')
+    @c.flatten_depends
+    async def flat(settings: Settings = c.Depends(Settings), session: Session = c.Depends(Session)):
+        return {'same': session.settings is settings}
+
+    client = TestClient(app)
+
+    try:
+        with c.profile() as profile:
+            assert client.get('/depends').json() == {'same': True}
+            assert client.get('/flat').json() == {'same': True}
+    finally:
+        RequestScopeService.remove_observer(metrics)
+        RequestScopeService.remove_observer(tracer)
+
+    session = (f'{Session.__module__}.{Session.__qualname__}', 'request')
+    settings = (f'{Settings.__module__}.{Settings.__qualname__}', 'singleton')
+
+    assert metrics.resolutions[session] >= 2
+    assert metrics.cache_hits[settings] >= 2
+    assert len(traces) == 2
+    assert all(trace.children for trace in traces)
+    assert profile.get(Session).constructions == 2  # type: ignore[union-attr]
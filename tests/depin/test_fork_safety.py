@@ -0,0 +1,114 @@
+import os
+
+import pytest
+
+from depin import Container, Scope
+
+
+def _run_in_child(fn) -> bytes:
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            os.write(write_fd, fn())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+
+    with os.fdopen(read_fd, 'rb') as reader:
+        return reader.read()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_fork_unsafe_singletons_are_rebuilt_in_child():
+    c = Container()
+
+    class Pool: ...
+
+    class Settings: ...
+
+    c.bind(source=Pool, scope=Scope.SINGLETON, fork_safe=False)
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+
+    pool = c.get(Pool)
+    settings = c.get(Settings)
+
+    result = _run_in_child(lambda: bytes([c.get(Pool) is pool, c.get(Settings) is settings]))
+
+    assert result == bytes([False, True])
+    assert c.get(Pool) is pool
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_singletons_holding_fork_unsafe_ones_are_rebuilt_in_child():
+    c = Container()
+
+    class Pool: ...
+
+    class Repository:
+        def __init__(self, pool: Pool):
+            self.pool = pool
+
+    class Service:
+        def __init__(self, repository: Repository):
+            self.repository = repository
+
+    class Settings: ...
+
+    c.bind(source=Pool, scope=Scope.SINGLETON, fork_safe=False)
+    c.bind(source=Repository, scope=Scope.TRANSIENT)
+    c.bind(source=Service, scope=Scope.SINGLETON)
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+
+    service = c.get(Service)
+    settings = c.get(Settings)
+
+    def in_child() -> bytes:
+        rebuilt = c.get(Service)
+        return bytes([
+            rebuilt is service,
+            rebuilt.repository.pool is service.repository.pool,
+            c.get(Settings) is settings,
+        ])
+
+    assert _run_in_child(in_child) == bytes([False, False, True])
+    assert c.get(Service) is service
+
+
+def test_warm_builds_sync_singletons():
+    c = Container()
+    built = []
+
+    @c.register(Scope.SINGLETON)
+    def settings():
+        built.append(settings)
+        return {}
+
+    @c.register(Scope.TRANSIENT)
+    def request_id():
+        built.append(request_id)
+        return 1
+
+    c.warm()
+
+    assert built == [settings]
+
+
+@pytest.mark.asyncio
+async def test_warm_async_builds_async_singletons():
+    c = Container()
+    built = []
+
+    @c.register(Scope.SINGLETON)
+    async def engine():
+        built.append(engine)
+        return object()
+
+    await c.warm_async()
+
+    assert built == [engine]
+    assert await c.get_async(engine) is await c.get_async(engine)
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from depin import Container, Inject, RequestScopeService, Scope
+
+
+def test_get_many_returns_values_in_order():
+    c = Container()
+
+    class Logger: ...
+
+    class UserService:
+        def __init__(self, logger: Logger):
+            self.logger = logger
+
+    class RoleService:
+        def __init__(self, logger: Logger):
+            self.logger = logger
+
+    c.bind(source=Logger, scope=Scope.SINGLETON)
+    c.bind(source=UserService, scope=Scope.TRANSIENT)
+    c.bind(source=RoleService, scope=Scope.TRANSIENT)
+
+    users, roles = c.get_many(UserService, RoleService)
+
+    assert isinstance(users, UserService)
+    assert isinstance(roles, RoleService)
+    assert users.logger is roles.logger
+
+
+@pytest.mark.asyncio
+async def test_get_many_async_builds_shared_dependencies_once():
+    c = Container()
+    calls = []
+
+    @c.register(Scope.REQUEST)
+    async def session():
+        calls.append(session)
+        await asyncio.sleep(0)
+        return object()
+
+    @c.register(Scope.TRANSIENT)
+    async def users(s: object = Inject(session)):
+        return s
+
+    @c.register(Scope.TRANSIENT)
+    async def roles(s: object = Inject(session)):
+        return s
+
+    async with RequestScopeService.request_scope_async():
+        u, r = await c.get_many_async(users, roles)
+
+    assert u is r
+    assert calls == [session]
+
+
+@pytest.mark.asyncio
+async def test_get_many_async_resolves_independent_branches_concurrently():
+    c = Container()
+    events = []
+
+    @c.register(Scope.SINGLETON)
+    async def engine():
+        events.append('engine:start')
+        await asyncio.sleep(0.01)
+        events.append('engine:end')
+        return 'engine'
+
+    @c.register(Scope.SINGLETON)
+    async def cache():
+        events.append('cache:start')
+        await asyncio.sleep(0.01)
+        events.append('cache:end')
+        return 'cache'
+
+    assert await c.get_many_async(engine, cache) == ('engine', 'cache')
+    assert set(events[:2]) == {'engine:start', 'cache:start'}
+
+
+@pytest.mark.asyncio
+async def test_get_many_async_keeps_transients_separate():
+    c = Container()
+
+    class Id: ...
+
+    @c.register(Scope.TRANSIENT)
+    async def first(i: Id):
+        return i
+
+    @c.register(Scope.TRANSIENT)
+    async def second(i: Id):
+        return i
+
+    c.bind(source=Id, scope=Scope.TRANSIENT)
+
+    a, b = await c.get_many_async(first, second)
+
+    assert a is not b
@@ -0,0 +1,140 @@
+import json
+
+import pytest
+
+from depin import Container, Inject, Scope
+from depin._internal.profiling import ResolutionProfile
+
+
+class Settings: ...
+
+
+class Session:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Repository:
+    def __init__(self, session: Session):
+        self.session = session
+
+
+def audit_log(): ...
+
+
+def build_container() -> Container:
+    c = Container()
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+    c.bind(source=Session, scope=Scope.REQUEST)
+    c.bind(source=Repository, scope=Scope.TRANSIENT)
+
+    return c
+
+
+def test_graph_nodes_and_edges():
+    c = build_container()
+
+    @c.register(Scope.TRANSIENT)
+    async def handler(repository: Repository, log=Inject(audit_log)):
+        return repository
+
+    graph = c.graph()
+    nodes = {node.source: node for node in graph.nodes}
+
+    assert nodes[Settings].scope is Scope.SINGLETON
+    assert nodes[handler].is_async is True
+    assert nodes[audit_log].scope is None
+    assert {(edge.source.rsplit('.', 1)[-1], edge.parameter) for edge in graph.edges} == {
+        ('Session', 'settings'),
+        ('Repository', 'session'),
+        ('handler', 'repository'),
+        ('handler', 'log'),
+    }
+
+
+def test_graph_exports_json_and_dot():
+    graph = build_container().graph()
+    data = json.loads(graph.to_json())
+
+    assert [node['scope'] for node in data['nodes']] == ['singleton', 'request', 'transient']
+    assert {'source': f'{__name__}.Session', 'target': f'{__name__}.Settings', 'parameter': 'settings'} in data['edges']
+
+    dot = graph.to_dot()
+
+    assert dot.startswith('digraph depin {')
+    assert f'"{__name__}.Repository" -> "{__name__}.Session" [label="session"];' in dot
+    assert '"Settings\\nsingleton"' in dot
+
+
+def test_graph_annotated_with_profile():
+    c = build_container()
+
+    with c.profile() as profile:
+        for _ in range(3):
+            c.get(Repository)
+
+    assert c._observers == ()
+
+    nodes = {node.source: node for node in c.graph(profile).nodes}
+
+    assert nodes[Repository].constructions == 3
+    assert nodes[Settings].constructions == 1
+    assert nodes[Repository].total_ns >= nodes[Repository].self_ns  # type: ignore[operator]
+    assert 'Repository\\ntransient\\n3x' in c.graph(profile).to_dot()
+
+
+@pytest.mark.asyncio
+async def test_profile_records_async_constructions():
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    async def engine():
+        return 'engine'
+
+    @c.register(Scope.TRANSIENT)
+    async def client(e: str = Inject(engine)):
+        return e
+
+    with c.profile() as profile:
+        await c.get_async(client)
+        await c.get_async(client)
+
+    assert profile.stats[client].constructions == 2
+    assert profile.stats[engine].constructions == 1
+    assert profile.stats[client].total_ns >= profile.stats[engine].total_ns
+
+
+def test_profile_exports_collapsed_stacks(tmp_path):
+    c = Container()
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+    c.bind(source=Session, scope=Scope.TRANSIENT)
+    c.bind(source=Repository, scope=Scope.TRANSIENT)
+
+    with c.profile() as profile:
+        c.get(Repository)
+
+    # a second run keeps aggregating into the same profile
+    with c.profile(profile):
+        c.get(Repository)
+        c.get(Session)
+
+    assert set(profile.stacks) == {(Repository,), (Repository, Session), (Repository, Session, Settings), (Session,)}
+    assert profile.stats[Repository].constructions == 2
+
+    lines = profile.to_collapsed().splitlines()
+    stacks = [line.rsplit(' ', 1)[0] for line in lines]
+
+    assert f'{__name__}.Repository;{__name__}.Session;{__name__}.Settings' in stacks
+    assert f'{__name__}.Session' in stacks
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+    profile.write_collapsed(str(tmp_path / 'stacks.txt'))
+    assert (tmp_path / 'stacks.txt').read_text() == profile.to_collapsed()
+
+
+def test_collapsed_stacks_escape_separators():
+    profile = ResolutionProfile()
+    profile.stacks[('a;b c',)] = 5000
+
+    assert profile.to_collapsed() == "'a:b_c' 5\n"
+    assert ResolutionProfile().to_collapsed() == ''
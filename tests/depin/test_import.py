@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.parent.resolve()
+
+
+def test_import_depin_does_not_load_web_frameworks():
+    probe = (
+        'import sys; import depin; '
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'fastapi', 'starlette', 'pydantic', 'asyncio'}))"
+    )
+
+    output = subprocess.check_output([sys.executable, '-c', probe], cwd=ROOT, text=True)
+
+    assert output.strip() == '[]'
+
+
+def test_depends_loads_fastapi_integration_lazily():
+    probe = (
+        'import sys; from depin import Container, Scope; '
+        'c = Container(); c.bind(source=object, scope=Scope.TRANSIENT); c.Depends(object); '
+        "print('fastapi' in sys.modules)"
+    )
+
+    output = subprocess.check_output([sys.executable, '-c', probe], cwd=ROOT, text=True)
+
+    assert output.strip() == 'True'
+
+
+def test_tooling_modules_are_imported_on_first_use():
+    probe = (
+        'import sys; import depin; '
+        "tooling = ['check', 'graph', 'leaks', 'metrics', 'process_pool', 'tracing', 'wiring']; "
+        "print([name for name in tooling if f'depin._internal.{name}' in sys.modules]); "
+        'from depin import ContainerMetrics, ContainerSpec; '
+        "print(ContainerMetrics.__module__, ContainerSpec.__module__, 'depin._internal.check' in sys.modules)"
+    )
+
+    output = subprocess.check_output([sys.executable, '-c', probe], cwd=ROOT, text=True).splitlines()
+
+    assert output == ['[]', 'depin._internal.metrics depin._internal.process_pool True']
@@ -0,0 +1,71 @@
+import gc
+
+from depin import Container, Scope
+from depin._internal.helpers import IntrospectionCache
+
+
+def test_cache_info_counts_hits_and_misses():
+    c = Container()
+
+    class Logger: ...
+
+    class Service:
+        def __init__(self, logger: Logger):
+            self.logger = logger
+
+    c.bind(source=Logger, scope=Scope.TRANSIENT)
+    c.bind(source=Service, scope=Scope.TRANSIENT)
+
+    misses = c.cache_info().misses
+    c.inject(lambda s: s)
+
+    assert c.cache_info().misses == misses + 2
+
+    hits = c.cache_info().hits
+    c.child()._construct(Service)
+
+    assert c.cache_info().hits > hits
+
+
+def test_cache_does_not_keep_callables_alive():
+    c = Container()
+
+    def make_provider():
+        return lambda: 'value'
+
+    provider = make_provider()
+    c.inject(provider)
+    size = c.cache_info().currsize
+
+    del provider
+    gc.collect()
+
+    assert c.cache_info().currsize == size - 1
+
+
+def test_unweakrefable_callables_use_bounded_lru():
+    cache = IntrospectionCache(maxsize=2)
+
+    for func in (object.__init__, object.__repr__, object.__eq__):
+        cache.signature(func)
+
+    cache.signature(object.__eq__)
+
+    assert cache.cache_info() == (1, 3, 2, 2)
+
+
+def test_unhashable_callables_are_not_cached():
+    class Handler:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, value: int) -> int:
+            return value
+
+    cache = IntrospectionCache()
+    handler = Handler()
+
+    cache.signature(handler)
+    cache.signature(handler)
+
+    assert cache.cache_info().hits == 0
+    assert cache.cache_info().currsize == 0
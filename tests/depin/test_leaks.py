@@ -0,0 +1,155 @@
+import tracemalloc
+
+import pytest
+
+from depin import Container, RequestLeakDetector, RequestScopeService, Scope
+
+
+class Session:
+    def __init__(self):
+        self.buffer = bytearray(64 * 1024)
+
+
+class Cache:
+    def __init__(self):
+        self.captured = []
+
+
+@pytest.fixture
+def detectors():
+    installed = []
+    yield installed
+
+    for container, detector in installed:
+        detector.uninstall(container)
+
+
+def install(detectors, container, **kwargs) -> RequestLeakDetector:
+    detector = RequestLeakDetector(**kwargs).install(container)
+    detectors.append((container, detector))
+    return detector
+
+
+def test_request_instances_collected_after_the_scope(detectors):
+    c = Container()
+    c.bind(source=Session, scope=Scope.REQUEST)
+    detector = install(detectors, c)
+
+    with RequestScopeService.request_scope():
+        c.get(Session)
+
+    assert detector.collect() == {}
+    assert detector.leaks == {}
+
+
+def test_instances_captured_by_singletons_are_reported(detectors):
+    c = Container()
+    c.bind(source=Cache, scope=Scope.SINGLETON)
+
+    @c.register(Scope.REQUEST)
+    def session(cache: Cache):
+        instance = Session()
+        cache.captured.append(instance)
+        return instance
+
+    detector = install(detectors, c)
+
+    for _ in range(2):
+        with RequestScopeService.request_scope():
+            c.get(session)
+
+    assert detector.collect() == {session: 2}
+    assert 'leak: 2 instances' in detector.report()
+    assert detector.collect() == {}
+
+
+def test_instances_of_child_containers_are_checked(detectors):
+    c = Container()
+    c.bind(source=Cache, scope=Scope.SINGLETON)
+
+    @c.register(Scope.REQUEST)
+    def session(cache: Cache):
+        instance = Session()
+        cache.captured.append(instance)
+        return instance
+
+    detector = install(detectors, c)
+    child = c.child()
+
+    with RequestScopeService.request_scope():
+        child.get(session)
+
+    assert detector.collect() == {session: 1}
+
+
+@pytest.mark.asyncio
+async def test_async_request_scopes_are_checked(detectors):
+    c = Container()
+    captured = []
+
+    @c.register(Scope.REQUEST)
+    async def session():
+        instance = Session()
+        captured.append(instance)
+        return instance
+
+    @c.register(Scope.REQUEST)
+    async def counter():
+        return {}
+
+    detector = install(detectors, c)
+
+    async with RequestScopeService.request_scope_async():
+        await c.get_async(session)
+        await c.get_async(counter)
+
+    assert detector.collect() == {session: 1}
+    assert detector.unchecked == 1
+
+
+def test_allocations_are_accounted_per_request_scope(detectors):
+    c = Container()
+
+    class Repository:
+        def __init__(self, session: Session):
+            self.session = session
+
+    c.bind(source=Session, scope=Scope.REQUEST)
+    c.bind(source=Repository, scope=Scope.REQUEST)
+    detector = install(detectors, c)
+
+    with RequestScopeService.request_scope():
+        c.get(Repository)
+
+    assert detector.scopes == 1
+    assert detector.max_allocated_bytes >= 64 * 1024
+    assert list(detector.allocated_bytes_by_provider) == [Repository]
+
+
+def test_allocations_tracking_can_be_disabled(detectors):
+    was_tracing = tracemalloc.is_tracing()
+    c = Container()
+    c.bind(source=Session, scope=Scope.REQUEST)
+    detector = install(detectors, c, track_allocations=False)
+
+    with RequestScopeService.request_scope():
+        c.get(Session)
+
+    assert tracemalloc.is_tracing() is was_tracing
+    assert detector.allocated_bytes == 0 or was_tracing
+    assert detector.collect() == {}
+
+
+def test_uninstall_stops_tracemalloc():
+    if tracemalloc.is_tracing():
+        pytest.skip('tracemalloc was started elsewhere')
+
+    c = Container()
+    detector = RequestLeakDetector().install(c)
+
+    assert tracemalloc.is_tracing()
+
+    detector.uninstall(c)
+
+    assert not tracemalloc.is_tracing()
+    assert c._observers == ()
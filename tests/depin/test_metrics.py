@@ -0,0 +1,167 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from depin import Container, ContainerMetrics, Inject, RequestScopeService, Scope
+from depin.extensions.fastapi import RequestScopeMiddleware, add_metrics_route
+
+
+@pytest.fixture
+def metrics():
+    collector = ContainerMetrics()
+    yield collector
+    RequestScopeService.remove_observer(collector)
+
+
+def test_metrics_count_resolutions_hits_and_constructions(metrics):
+    c = Container()
+
+    class Config: ...
+
+    class Service:
+        def __init__(self, config: Config):
+            self.config = config
+
+    c.bind(source=Config, scope=Scope.SINGLETON)
+    c.bind(source=Service, scope=Scope.TRANSIENT)
+    metrics.install(c)
+
+    c.get(Service)
+    c.get(Service)
+
+    config = (f'{Config.__module__}.{Config.__qualname__}', 'singleton')
+    service = (f'{Service.__module__}.{Service.__qualname__}', 'transient')
+
+    assert metrics.resolutions == {config: 2, service: 2}
+    assert metrics.cache_hits == {config: 1}
+    assert metrics.construction_seconds[config].count == 1
+    assert metrics.construction_seconds[service].count == 2
+
+
+def test_metrics_count_construction_failures(metrics):
+    c = Container()
+
+    @c.register(Scope.TRANSIENT)
+    def broken():
+        raise ValueError('boom')
+
+    metrics.install(c)
+
+    with pytest.raises(ValueError, match='boom'):
+        c.get(broken)
+
+    assert list(metrics.construction_failures.values()) == [1]
+    assert metrics.construction_seconds == {}
+
+
+def test_metrics_track_request_scopes(metrics):
+    c = Container()
+
+    class Session: ...
+
+    def failing():
+        yield object()
+        raise RuntimeError('teardown')
+
+    c.bind(source=Session, scope=Scope.REQUEST)
+    c.bind(source=failing, scope=Scope.REQUEST)
+    metrics.install(c)
+
+    with RequestScopeService.request_scope():
+        assert metrics.active_request_scopes == 1
+        c.get(Session)
+        c.get(failing)
+
+    assert metrics.active_request_scopes == 0
+    assert metrics.request_store_size.count == 1
+    assert metrics.request_store_size.sum == 2
+    assert metrics.request_teardown_seconds.count == 1
+    assert metrics.request_teardown_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_track_async_request_scopes(metrics):
+    c = Container()
+
+    @c.register(Scope.REQUEST)
+    async def session():
+        return object()
+
+    metrics.install(c)
+
+    async with RequestScopeService.request_scope_async():
+        await c.get_async(session)
+        await c.get_async(session)
+
+    assert list(metrics.cache_hits.values()) == [1]
+    assert metrics.request_store_size.sum == 1
+    assert metrics.active_request_scopes == 0
+
+
+def test_metrics_uninstall_stops_collecting(metrics):
+    c = Container()
+
+    class Service: ...
+
+    c.bind(source=Service, scope=Scope.TRANSIENT)
+    metrics.install(c)
+    metrics.uninstall(c)
+
+    c.get(Service)
+
+    with RequestScopeService.request_scope():
+        pass
+
+    assert metrics.resolutions == {}
+    assert metrics.request_store_size.count == 0
+
+
+def test_metrics_render_prometheus_text(metrics):
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    def config():
+        return {}
+
+    @c.register(Scope.TRANSIENT)
+    def service(cfg: dict = Inject(config)):
+        return cfg
+
+    metrics.install(c)
+    c.get(service)
+
+    text = metrics.render()
+    name = f'{service.__module__}.{service.__qualname__}'
+
+    assert '# TYPE depin_resolutions_total counter' in text
+    assert f'depin_resolutions_total{{provider="{name}",scope="transient"}} 1' in text
+    assert f'depin_construction_seconds_bucket{{provider="{name}",scope="transient",le="+Inf"}} 1' in text
+    assert f'depin_construction_seconds_count{{provider="{name}",scope="transient"}} 1' in text
+    assert 'depin_request_scopes_active 0' in text
+    assert 'depin_request_store_size_bucket{le="+Inf"} 0' in text
+    assert text.endswith('\n')
+
+
+def test_metrics_route(metrics):
+    c = Container()
+
+    class Session: ...
+
+    c.bind(source=Session, scope=Scope.REQUEST)
+    metrics.install(c)
+
+    app = FastAPI()
+    app.add_middleware(RequestScopeMiddleware)
+    add_metrics_route(app, metrics)
+
+    @app.get('/')
+    async def index(session: Session = c.Depends(Session)):
+        return {}
+
+    client = TestClient(app)
+    client.get('/')
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    assert 'depin_request_store_size_count 1' in response.text
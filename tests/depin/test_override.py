@@ -0,0 +1,275 @@
+import asyncio
+
+import pytest
+
+from depin import Container, Inject, Scope, ThreadScopeService
+from depin._internal.exceptions import MissingProviderError
+
+
+def test_override_visible_only_inside_block():
+    c = Container()
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    c.bind(source=Engine, scope=Scope.TRANSIENT)
+
+    with c.override(Engine, FakeEngine):
+        assert type(c.get(Engine)) is FakeEngine
+
+    assert type(c.get(Engine)) is Engine
+
+
+def test_override_used_by_dependents():
+    c = Container()
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    class Repository:
+        def __init__(self, engine: Engine):
+            self.engine = engine
+
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+    c.bind(source=Repository, scope=Scope.TRANSIENT)
+
+    engine = c.get(Engine)
+
+    with c.override(Engine, FakeEngine):
+        assert type(c.get(Repository).engine) is FakeEngine
+        assert c.get(Engine) is c.get(Engine)
+
+    assert c.get(Repository).engine is engine
+
+
+def test_override_with_plain_value():
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    def settings():
+        return {'debug': False}
+
+    with c.override(settings, value={'debug': True}):
+        assert c.get(settings) == {'debug': True}
+
+    assert c.get(settings) == {'debug': False}
+
+
+def test_override_with_callable_value():
+    c = Container()
+
+    def default_handler():
+        return 'default'
+
+    @c.register(Scope.SINGLETON)
+    def handler():
+        return default_handler
+
+    with c.override(handler, value=len):
+        assert c.get(handler) is len
+
+    assert c.get(handler) is default_handler
+
+
+def test_override_rejects_non_callable_source():
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    def settings():
+        return {'debug': False}
+
+    with pytest.raises(TypeError, match='pass instances as `value=`'):
+        c.override(settings, {'debug': True})
+
+    with pytest.raises(ValueError, match='either a source or a value'):
+        c.override(settings)
+
+    with pytest.raises(ValueError, match='either a source or a value'):
+        c.override(settings, dict, value={'debug': True})
+
+
+def test_override_unregistered_provider_raises():
+    c = Container()
+
+    class Engine: ...
+
+    with pytest.raises(MissingProviderError, match='not registered'):
+        c.override(Engine, Engine)
+
+
+def test_override_generator_closed_on_exit():
+    c = Container()
+    closed = []
+
+    @c.register(Scope.SINGLETON)
+    def pool():
+        return 'pool'
+
+    def fake_pool():
+        yield 'fake'
+
+        closed.append(fake_pool)
+
+    with c.override(pool, fake_pool):
+        assert c.get(pool) == 'fake'
+        assert closed == []
+
+    assert closed == [fake_pool]
+
+
+@pytest.mark.asyncio
+async def test_async_override_is_context_local():
+    c = Container()
+
+    @c.register(Scope.TRANSIENT)
+    async def backend():
+        return 'primary'
+
+    async def canary():
+        return 'canary'
+
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def with_override():
+        async with c.override(backend, canary):
+            started.set()
+            await release.wait()
+            return await c.get_async(backend)
+
+    async def without_override():
+        await started.wait()
+        result = await c.get_async(backend)
+        release.set()
+        return result
+
+    assert await asyncio.gather(with_override(), without_override()) == ['canary', 'primary']
+
+
+def test_override_does_not_leak_into_singleton_dependents():
+    c = Container()
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    class Repository:
+        def __init__(self, engine: Engine):
+            self.engine = engine
+
+    class Settings: ...
+
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+    c.bind(source=Repository, scope=Scope.SINGLETON)
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+
+    with c.override(Engine, FakeEngine):
+        repository = c.get(Repository)
+        settings = c.get(Settings)
+
+        assert type(repository.engine) is FakeEngine
+        assert c.get(Repository) is repository
+
+    assert type(c.get(Repository).engine) is Engine
+    assert c.get(Repository) is not repository
+    # singletons not depending on the override are cached as usual
+    assert c.get(Settings) is settings
+
+
+def test_override_closes_singleton_dependent_resources():
+    c = Container()
+    closed = []
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    @c.register(Scope.SINGLETON)
+    def connection(engine: Engine):
+        yield engine
+        closed.append(engine)
+
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+
+    with c.override(Engine, FakeEngine):
+        fake = c.get(connection)
+
+    assert closed == [fake]
+    assert type(c.get(connection)) is Engine
+
+
+@pytest.mark.asyncio
+async def test_async_override_does_not_leak_into_singleton_dependents():
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    async def backend():
+        return 'primary'
+
+    async def canary():
+        return 'canary'
+
+    @c.register(Scope.SINGLETON)
+    async def client(name: str = Inject(backend)):
+        return f'client:{name}'
+
+    async with c.override(backend, canary):
+        assert await c.get_async(client) == 'client:canary'
+
+    assert await c.get_async(client) == 'client:primary'
+
+
+def test_override_does_not_leak_into_thread_scoped_dependents():
+    c = Container()
+    closed = []
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    class Repository:
+        def __init__(self, engine: Engine):
+            self.engine = engine
+
+    @c.register(Scope.THREAD)
+    def connection(engine: Engine):
+        yield engine
+        closed.append(engine)
+
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+    c.bind(source=Repository, scope=Scope.THREAD)
+
+    with c.override(Engine, FakeEngine):
+        repository = c.get(Repository)
+        fake = c.get(connection)
+
+        assert type(repository.engine) is FakeEngine
+        assert c.get(Repository) is repository
+
+    assert closed == [fake]
+    assert type(c.get(Repository).engine) is Engine
+    assert type(c.get(connection)) is Engine
+
+    ThreadScopeService.exit_thread_scope()
+
+
+@pytest.mark.asyncio
+async def test_override_does_not_leak_into_event_loop_scoped_dependents():
+    c = Container()
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    @c.register(Scope.EVENT_LOOP)
+    async def client(engine: Engine):
+        return engine
+
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+
+    async with c.override(Engine, FakeEngine):
+        assert type(await c.get_async(client)) is FakeEngine
+
+    assert type(await c.get_async(client)) is Engine
@@ -0,0 +1,110 @@
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from depin import Container, ContainerSpec, Inject, ProcessPoolService, Scope
+
+DI = Container()
+
+
+class Settings:
+    def __init__(self):
+        self.pid = os.getpid()
+
+
+class Renderer:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+class Report:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+def renderer_factory(settings: Settings) -> Renderer:
+    return Renderer(settings)
+
+
+DI.bind(source=Settings, scope=Scope.SINGLETON)
+DI.bind(source=renderer_factory, scope=Scope.TRANSIENT)
+
+
+@DI.inject
+def render(value: int, renderer: Renderer = Inject(renderer_factory)) -> tuple[int, int]:
+    return value * 2, renderer.settings.pid
+
+
+def settings_pid(settings: Settings) -> int:
+    return settings.pid
+
+
+async def async_settings_pid(settings: Settings) -> int:
+    return settings.pid
+
+
+def report_pid(report: Report) -> int:
+    return report.settings.pid
+
+
+@pytest.fixture
+def pool():
+    # bindings made after import only reach the workers through the spec
+    DI.bind(source=Report, scope=Scope.TRANSIENT)
+
+    spec = DI.spec(f'{__name__}:DI')
+    context = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=context, initializer=ProcessPoolService.initializer, initargs=(spec,)
+    ) as executor:
+        yield executor
+
+
+def test_spec_is_picklable_and_rebuilds_bindings():
+    c = Container()
+    c.bind(source=Settings, scope=Scope.SINGLETON, fork_safe=False)
+    c.bind(source=renderer_factory, scope=Scope.TRANSIENT)
+
+    spec = pickle.loads(pickle.dumps(c.spec()))
+    rebuilt = spec.build()
+
+    assert isinstance(spec, ContainerSpec)
+    assert rebuilt is not c
+    assert rebuilt.get(renderer_factory).settings is rebuilt.get(Settings)
+    assert rebuilt._get_provider_info(Settings).fork_safe is False  # type: ignore[union-attr]
+
+
+def test_spec_rejects_local_providers():
+    c = Container()
+
+    @c.register(Scope.TRANSIENT)
+    def local():
+        return 'local'
+
+    with pytest.raises(ValueError, match='cannot be imported by worker processes'):
+        c.spec()
+
+
+def test_injected_function_runs_in_worker_with_rebuilt_container(pool):
+    value, pid = pool.submit(render, 21).result()
+
+    assert value == 42
+    assert pid != os.getpid()
+
+
+def test_submit_injects_plain_functions(pool):
+    pids = {ProcessPoolService.submit(pool, settings_pid).result() for _ in range(3)}
+    pids.add(ProcessPoolService.submit(pool, async_settings_pid).result())
+    pids.add(ProcessPoolService.submit(pool, report_pid).result())
+
+    assert len(pids) == 1
+    assert os.getpid() not in pids
+
+
+def test_get_container_outside_worker_raises():
+    with pytest.raises(RuntimeError, match='No worker container found'):
+        ProcessPoolService.get_container()
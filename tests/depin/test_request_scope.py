@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 from fastapi import Request
 
@@ -226,3 +228,22 @@ def test_cleanup_in_reverse_order():
         assert cleaned == []
 
     assert cleaned == [gen3, gen2, gen1]
+
+
+@pytest.mark.asyncio
+async def test_get_async_returns_request_cache_hit_without_calling_provider():
+    c = Container()
+
+    @c.register(Scope.REQUEST)
+    async def session():
+        return object()
+
+    async with RequestScopeService.request_scope_async():
+        built = await c.get_async(session)
+
+        def fail(_container):
+            raise AssertionError('provider called for a cached request instance')
+
+        c._providers[session] = replace(c._providers[session], provider=fail)
+
+        assert await c.get_async(session) is built
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 
 from depin import Container, Inject, Scope
@@ -102,3 +104,21 @@ async def test_singleton_class_that_needs_async():
     a3 = await c.get_async(A)
 
     assert a1 is a2 is a3
+
+
+@pytest.mark.asyncio
+async def test_get_async_returns_built_singleton_without_calling_provider():
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    async def engine():
+        return object()
+
+    built = await c.get_async(engine)
+
+    def fail(_container):
+        raise AssertionError('provider called for a cached singleton')
+
+    c._providers[engine] = replace(c._providers[engine], provider=fail)
+
+    assert await c.get_async(engine) is built
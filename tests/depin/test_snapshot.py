@@ -0,0 +1,108 @@
+import pytest
+
+from depin import Container, Scope
+
+
+def test_restore_resets_singletons_built_after_snapshot():
+    c = Container()
+
+    class Settings: ...
+
+    class Cache: ...
+
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+    c.bind(source=Cache, scope=Scope.SINGLETON)
+
+    settings = c.get(Settings)
+    snapshot = c.snapshot()
+
+    cache = c.get(Cache)
+    c.restore(snapshot)
+
+    assert c.get(Settings) is settings
+    assert c.get(Cache) is not cache
+
+
+def test_restore_removes_bindings_added_after_snapshot():
+    c = Container()
+
+    class Engine: ...
+
+    class FakeEngine(Engine): ...
+
+    c.bind(source=Engine, scope=Scope.TRANSIENT)
+    snapshot = c.snapshot()
+
+    c.bind(abstract=Engine, source=FakeEngine, scope=Scope.TRANSIENT)
+    assert type(c.get(Engine)) is FakeEngine
+
+    c.restore(snapshot)
+    assert type(c.get(Engine)) is Engine
+
+
+def test_snapshot_can_be_restored_many_times():
+    c = Container()
+
+    class Client: ...
+
+    c.bind(source=Client, scope=Scope.SINGLETON)
+    snapshot = c.snapshot()
+
+    built = []
+
+    for _ in range(3):
+        built.append(c.get(Client))
+        c.restore(snapshot)
+
+    assert len({id(client) for client in built}) == 3
+
+
+def test_restore_tears_down_resources_opened_after_snapshot():
+    c = Container()
+    closed = []
+
+    @c.register(Scope.SINGLETON)
+    def engine():
+        yield 'engine'
+
+        closed.append(engine)
+
+    @c.register(Scope.SINGLETON)
+    def pool():
+        yield 'pool'
+
+        closed.append(pool)
+
+    c.get(engine)
+    snapshot = c.snapshot()
+    c.get(pool)
+
+    c.restore(snapshot)
+
+    assert closed == [pool]
+
+    c.close()
+
+    assert closed == [pool, engine]
+
+
+@pytest.mark.asyncio
+async def test_arestore_tears_down_async_resources():
+    c = Container()
+    closed = []
+
+    @c.register(Scope.SINGLETON)
+    async def pool():
+        yield 'pool'
+
+        closed.append(pool)
+
+    snapshot = c.snapshot()
+    await c.get_async(pool)
+
+    with pytest.raises(RuntimeError, match='use arestore instead'):
+        c.restore(snapshot)
+
+    await c.arestore(snapshot)
+
+    assert closed == [pool]
@@ -0,0 +1,84 @@
+import json
+
+from depin import Container, Inject, Scope, StartupProfiler
+from depin._internal.cli import main
+from depin._internal.profiling import get_startup_profiler
+
+
+class Settings: ...
+
+
+class Engine:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+def test_startup_profiler_records_registration_phases():
+    with StartupProfiler() as profiler:
+        c = Container()
+        c.bind(source=Settings, scope=Scope.SINGLETON)
+        c.bind(source=Engine, scope=Scope.SINGLETON)
+        c.warm()
+
+    assert get_startup_profiler() is None
+
+    stats = profiler.stats[Engine]
+
+    assert stats.register_ns >= stats.analysis_ns > 0
+    assert stats.introspection_ns > 0
+    assert stats.construction_ns > 0
+    assert stats.total_ns == stats.register_ns + stats.construction_ns
+
+
+def test_startup_profiler_attributes_dependency_introspection_to_registered_provider():
+    c = Container()
+
+    def engine_factory(settings: Settings) -> Engine:
+        return Engine(settings)
+
+    def build(engine: Engine = Inject(engine_factory)):
+        return engine
+
+    with StartupProfiler() as profiler:
+        c.bind(source=build, scope=Scope.TRANSIENT)
+
+    assert list(profiler.stats) == [build]
+
+
+def test_inactive_profiler_records_nothing():
+    profiler = StartupProfiler()
+
+    c = Container()
+    c.bind(source=Engine, scope=Scope.TRANSIENT)
+
+    assert profiler.stats == {}
+
+
+def test_report_and_json(tmp_path):
+    with StartupProfiler() as profiler:
+        c = Container()
+        c.bind(source=Settings, scope=Scope.SINGLETON)
+
+    report = profiler.report()
+
+    assert report.splitlines()[0].split() == ['provider', 'register', 'analysis', 'introspect', 'construct']
+    assert f'{__name__}.Settings' in report
+
+    path = tmp_path / 'startup.json'
+    profiler.write_json(str(path))
+    data = json.loads(path.read_text())
+
+    assert data['providers'][0]['provider'] == f'{__name__}.Settings'
+    assert set(data['total_ns']) == {'register', 'analysis', 'introspection', 'construction'}
+
+
+DI = Container()
+DI.bind(source=Settings, scope=Scope.SINGLETON)
+
+
+def test_cli_startup_report(capsys, tmp_path):
+    path = tmp_path / 'startup.json'
+
+    assert main(['startup', f'{__name__}:DI', '--warm', '--json', str(path)]) == 0
+    assert 'total' in capsys.readouterr().out
+    assert path.exists()
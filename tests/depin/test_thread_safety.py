@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from depin import Container, Scope
+
+THREADS = 16
+
+
+def run_concurrently(func, threads: int = THREADS) -> list:
+    barrier = threading.Barrier(threads)
+
+    def task():
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(lambda _: task(), range(threads)))
+
+
+def test_cold_singleton_built_once_across_threads():
+    c = Container()
+    calls = []
+
+    class Engine:
+        def __init__(self):
+            calls.append(self)
+            time.sleep(0.01)
+
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+
+    engines = run_concurrently(lambda: c.get(Engine))
+
+    assert len(calls) == 1
+    assert all(engine is calls[0] for engine in engines)
+
+
+def test_singleton_generator_opened_once_across_threads():
+    c = Container()
+    opened = []
+
+    @c.register(Scope.SINGLETON)
+    def pool():
+        opened.append(pool)
+        time.sleep(0.01)
+        yield object()
+
+    assert len({id(p) for p in run_concurrently(lambda: c.get(pool))}) == 1
+    assert opened == [pool]
+
+    c.close()
+
+
+def test_concurrent_binds_and_resolutions():
+    c = Container()
+
+    class Config: ...
+
+    class Service:
+        def __init__(self, config: Config):
+            self.config = config
+
+    c.bind(source=Config, scope=Scope.SINGLETON)
+    c.bind(source=Service, scope=Scope.TRANSIENT)
+
+    def task():
+        for _ in range(200):
+            assert isinstance(c.get(Service).config, Config)
+            c.bind(source=Config, scope=Scope.SINGLETON)
+
+        return True
+
+    assert all(run_concurrently(task, threads=8))
+
+
+def test_unrelated_cold_singletons_are_built_in_parallel():
+    c = Container()
+    both_started = threading.Barrier(2, timeout=5)
+
+    class Engine:
+        def __init__(self):
+            both_started.wait()
+
+    class Cache:
+        def __init__(self):
+            both_started.wait()
+
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+    c.bind(source=Cache, scope=Scope.SINGLETON)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        engine = executor.submit(c.get, Engine)
+        cache = executor.submit(c.get, Cache)
+
+        assert isinstance(engine.result(timeout=5), Engine)
+        assert isinstance(cache.result(timeout=5), Cache)
+
+
+def test_constructor_waiting_on_another_thread_resolving_does_not_deadlock():
+    c = Container()
+
+    class Settings: ...
+
+    class Engine:
+        def __init__(self):
+            resolved = []
+            thread = threading.Thread(target=lambda: resolved.append(c.get(Settings)), daemon=True)
+            thread.start()
+            thread.join(timeout=5)
+            self.settings = resolved[0] if resolved else None
+
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+    c.bind(source=Engine, scope=Scope.SINGLETON)
+
+    assert c.get(Engine).settings is c.get(Settings)
+
+
+class Pool:
+    pass
+
+
+def test_cold_async_singleton_built_once_across_event_loops():
+    c = Container()
+    opened = []
+    closed = []
+
+    async def make_pool():
+        pool = Pool()
+        opened.append(pool)
+        await asyncio.sleep(0.01)
+        yield pool
+        closed.append(pool)
+
+    c.bind(source=make_pool, abstract=Pool, scope=Scope.SINGLETON)
+
+    results = run_concurrently(lambda: asyncio.run(c.get_async(Pool)), threads=4)
+
+    assert len(opened) == 1
+    assert all(result is opened[0] for result in results)
+
+    asyncio.run(c.aclose())
+
+    assert closed == opened
+
+
+@pytest.mark.asyncio
+async def test_cold_async_singleton_built_once_across_tasks():
+    c = Container()
+    calls = []
+
+    async def make_pool() -> Pool:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return Pool()
+
+    c.bind(source=make_pool, abstract=Pool, scope=Scope.SINGLETON)
+
+    results = await asyncio.gather(*(c.get_async(Pool) for _ in range(8)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_async_singleton_build_is_retried():
+    c = Container()
+    calls = []
+
+    async def make_pool() -> Pool:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+
+        if len(calls) == 1:
+            raise RuntimeError('unavailable')
+
+        return Pool()
+
+    c.bind(source=make_pool, abstract=Pool, scope=Scope.SINGLETON)
+
+    results = await asyncio.gather(c.get_async(Pool), c.get_async(Pool), return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert isinstance(results[1], Pool)
+    assert len(calls) == 2
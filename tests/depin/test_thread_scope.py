@@ -0,0 +1,116 @@
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from depin import Container, Scope, ThreadScopeService
+
+
+def test_thread_scope_same_instance_within_thread():
+    c = Container()
+
+    class Client: ...
+
+    c.bind(source=Client, scope=Scope.THREAD)
+
+    assert c.get(Client) is c.get(Client)
+
+    ThreadScopeService.exit_thread_scope()
+
+
+def test_thread_scope_different_instances_across_threads():
+    c = Container()
+
+    class Client: ...
+
+    c.bind(source=Client, scope=Scope.THREAD)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        barrier = threading.Barrier(2)
+
+        def resolve():
+            first = c.get(Client)
+            barrier.wait()
+            return first, c.get(Client)
+
+        results = list(pool.map(lambda _: resolve(), range(2)))
+
+    (a1, a2), (b1, b2) = results
+
+    assert a1 is a2
+    assert b1 is b2
+    assert a1 is not b1
+
+
+def test_thread_scope_generator_cleanup_when_thread_exits():
+    c = Container()
+    cleaned = []
+
+    @c.register(Scope.THREAD)
+    def client():
+        yield 'client'
+
+        cleaned.append('client')
+
+    resolved = []
+    thread = threading.Thread(target=lambda: resolved.append(c.get(client)), name='worker')
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert resolved == ['client']
+    assert cleaned == ['client']
+
+
+def test_thread_scope_teardown_does_not_create_dummy_threads():
+    c = Container()
+    teardown_threads = []
+
+    @c.register(Scope.THREAD)
+    def client():
+        yield 'client'
+
+        teardown_threads.append(threading.current_thread().name)
+
+    thread = threading.Thread(target=lambda: c.get(client), name='worker')
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert teardown_threads == ['worker-teardown']
+    assert not [t.name for t in threading.enumerate() if t.name.startswith('Dummy')]
+
+
+def test_exit_thread_scope_cleans_current_thread():
+    c = Container()
+    cleaned = []
+
+    @c.register(Scope.THREAD)
+    def gen1():
+        yield 1
+
+        cleaned.append(gen1)
+
+    @c.register(Scope.THREAD)
+    def gen2():
+        yield 2
+
+        cleaned.append(gen2)
+
+    assert c.get(gen1) == 1
+    assert c.get(gen2) == 2
+
+    ThreadScopeService.exit_thread_scope()
+
+    assert cleaned == [gen2, gen1]
+
+
+def test_async_generators_in_thread_scope_raises():
+    c = Container()
+
+    async def async_gen():
+        yield 23
+
+    with pytest.raises(RuntimeError, match='Async generators are not supported'):
+        c.bind(source=async_gen, scope=Scope.THREAD)
@@ -0,0 +1,169 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from depin import Container, Inject, RequestScopeService, ResolutionTracer, Scope
+
+
+@pytest.fixture
+def graph():
+    c = Container()
+
+    @c.register(Scope.SINGLETON)
+    def config():
+        return {}
+
+    @c.register(Scope.REQUEST)
+    def session(cfg: dict = Inject(config)):
+        return object()
+
+    @c.register(Scope.TRANSIENT)
+    def repository(s: object = Inject(session)):
+        return s
+
+    return SimpleNamespace(container=c, config=config, session=session, repository=repository)
+
+
+@pytest.fixture
+def tracers():
+    installed = []
+    yield installed
+
+    for tracer in installed:
+        RequestScopeService.remove_observer(tracer)
+
+
+def test_tracer_records_the_resolution_tree(graph, tracers):
+    tracers.append(ResolutionTracer().install(graph.container))
+
+    with RequestScopeService.request_scope():
+        graph.container.get(graph.repository)
+        graph.container.get(graph.session)
+        trace = ResolutionTracer.current()
+
+    assert trace is not None
+    assert trace.duration_ns is not None
+
+    repository, session = trace.children
+    assert repository.source is graph.repository
+    assert not repository.cached
+    assert [child.source for child in repository.children] == [graph.session]
+    assert [child.source for child in repository.children[0].children] == [graph.config]
+    assert session.source is graph.session
+    assert session.cached
+
+
+@pytest.mark.asyncio
+async def test_tracer_records_async_resolutions(tracers):
+    c = Container()
+
+    @c.register(Scope.REQUEST)
+    async def session():
+        return object()
+
+    @c.register(Scope.TRANSIENT)
+    async def repository(s: object = Inject(session)):
+        raise RuntimeError('broken')
+
+    tracers.append(ResolutionTracer().install(c))
+
+    async with RequestScopeService.request_scope_async():
+        with pytest.raises(RuntimeError, match='broken'):
+            await c.get_async(repository)
+
+        trace = ResolutionTracer.current()
+
+    (node,) = trace.children
+    assert node.failed
+    assert node.children[0].source is session
+
+
+def test_unsampled_request_scopes_have_no_trace(graph, tracers):
+    tracers.append(ResolutionTracer(sample_rate=0).install(graph.container))
+
+    with RequestScopeService.request_scope():
+        graph.container.get(graph.repository)
+
+        assert ResolutionTracer.current() is None
+
+
+def test_tracer_observes_the_container_only_in_sampled_request_scopes(graph, tracers):
+    unsampled = ResolutionTracer(sample_rate=0).install(graph.container)
+    tracers.append(unsampled)
+
+    with RequestScopeService.request_scope():
+        assert graph.container._observers == ()
+
+    sampled = ResolutionTracer().install(graph.container)
+    tracers.append(sampled)
+
+    with RequestScopeService.request_scope():
+        assert graph.container._observers == (sampled,)
+
+        with RequestScopeService.request_scope():
+            pass
+
+        assert graph.container._observers == (sampled,)
+
+    assert graph.container._observers == ()
+
+
+def test_request_scopes_are_traced_by_one_tracer(graph, tracers):
+    first = ResolutionTracer().install(graph.container)
+    second = ResolutionTracer().install(graph.container)
+    tracers.extend([first, second])
+
+    with RequestScopeService.request_scope():
+        graph.container.get(graph.repository)
+        trace = ResolutionTracer.current()
+
+    assert [child.source for child in trace.children] == [graph.repository]
+    assert graph.container._observers == ()
+
+
+def test_resolutions_outside_request_scopes_are_not_traced(graph, tracers):
+    tracer = ResolutionTracer().install(graph.container)
+    tracers.append(tracer)
+
+    graph.container.get(graph.config)
+
+    assert tracer._node.get() is None
+
+
+def test_slow_request_scopes_are_reported(graph, tracers):
+    reported = []
+    tracers.append(ResolutionTracer(threshold=0, report=reported.append).install(graph.container))
+
+    with RequestScopeService.request_scope():
+        graph.container.get(graph.repository)
+
+    (trace,) = reported
+    text = trace.render()
+
+    assert 'repository [transient]' in text
+    assert '    ' + f'{graph.session.__module__}.{graph.session.__qualname__} [request]' in text
+
+
+def test_slow_request_scopes_are_logged_by_default(graph, tracers, caplog):
+    tracers.append(ResolutionTracer(threshold=0).install(graph.container))
+
+    with caplog.at_level(logging.WARNING, logger='depin.trace'):
+        with RequestScopeService.request_scope():
+            graph.container.get(graph.session)
+
+    assert 'slow request scope' in caplog.text
+
+
+def test_trace_to_dict(graph, tracers):
+    tracers.append(ResolutionTracer().install(graph.container))
+
+    with RequestScopeService.request_scope():
+        graph.container.get(graph.session)
+        trace = ResolutionTracer.current()
+
+    (node,) = trace.to_dict()['children']
+
+    assert node['scope'] == 'request'
+    assert node['cached'] is False
+    assert node['children'][0]['scope'] == 'singleton'
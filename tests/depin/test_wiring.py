@@ -0,0 +1,146 @@
+import gc
+import weakref
+
+import pytest
+
+from depin import Container, Inject, RequestScopeService, Scope
+from depin._internal.cli import main
+from depin._internal.wiring import Wiring, generate_wiring
+
+DI = Container()
+
+
+class Settings: ...
+
+
+class Session:
+    def __init__(self, settings: Settings, timeout: float = 1.0):
+        self.settings = settings
+        self.timeout = timeout
+
+
+async def open_client(settings: Settings):
+    return settings
+
+
+class Repository:
+    def __init__(self, session: Session, client=Inject(open_client)):
+        self.session = session
+        self.client = client
+
+
+def bind(container: Container):
+    container.bind(source=Settings, scope=Scope.SINGLETON)
+    container.bind(source=Session, scope=Scope.REQUEST)
+    container.bind(source=open_client, scope=Scope.REQUEST)
+    container.bind(source=Repository, scope=Scope.TRANSIENT)
+
+
+bind(DI)
+
+
+@pytest.fixture
+def wiring_module(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def write(name: str, source: str) -> str:
+        (tmp_path / f'{name}.py').write_text(source)
+        return name
+
+    return write
+
+
+@pytest.mark.asyncio
+async def test_wired_container_skips_introspection(wiring_module):
+    module = wiring_module('depin_wiring_fresh', generate_wiring(DI, f'{__name__}:DI'))
+    c = Container(wiring=module)
+    bind(c)
+
+    async with RequestScopeService.request_scope_async():
+        repository = await c.get_async(Repository)
+
+    assert repository.client is repository.session.settings
+    assert repository.session.timeout == 1.0
+    assert c.cache_info().misses == 0
+
+    info = c.wiring_info()
+    assert info is not None
+    assert info.providers == 5
+    assert info.hits > 0
+    assert info.stale == ()
+
+
+def test_wiring_is_shared_with_children(wiring_module):
+    module = wiring_module('depin_wiring_children', generate_wiring(DI))
+    c = Container(wiring=module)
+
+    assert c.child().wiring_info() == c.wiring_info()
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_fall_back_to_introspection(wiring_module):
+    source = generate_wiring(DI).replace(f"'{__name__}:Session': ('", f"'{__name__}:Session': ('0")
+    module = wiring_module('depin_wiring_stale', source)
+    c = Container(wiring=module)
+    bind(c)
+
+    async with RequestScopeService.request_scope_async():
+        repository = await c.get_async(Repository)
+
+    assert isinstance(repository.session, Session)
+    assert c.wiring_info().stale == (f'{__name__}:Session',)  # pyright: ignore[reportOptionalMemberAccess]
+    assert c.cache_info().misses > 0
+
+
+def test_missing_wiring_module_falls_back_to_introspection():
+    c = Container(wiring='depin_wiring_does_not_exist')
+    c.bind(source=Settings, scope=Scope.SINGLETON)
+
+    assert isinstance(c.get(Settings), Settings)
+    assert c.wiring_info() == ('depin_wiring_does_not_exist', 0, 0, ())
+
+
+def test_wiring_does_not_keep_providers_alive(wiring_module):
+    wiring = Wiring.load(wiring_module('depin_wiring_weak', generate_wiring(DI)))
+
+    class Local:
+        def __init__(self, settings: Settings):
+            self.settings = settings
+
+    assert wiring.get(Local) is None
+    assert wiring.get(Settings) == ()
+
+    ref = weakref.ref(Local)
+    del Local
+    gc.collect()
+
+    assert ref() is None
+    assert wiring.info().hits == 1
+
+
+def test_container_without_wiring():
+    assert Container().wiring_info() is None
+
+
+def test_generated_module_records_parameters():
+    namespace: dict = {}
+    exec(generate_wiring(DI), namespace)
+
+    digest, parameters = namespace['WIRING'][f'{__name__}:Repository']
+
+    assert namespace['WIRING_VERSION'] == 1
+    assert parameters == (
+        ('session', f'{__name__}:Session', False, True),
+        ('client', f'{__name__}:open_client', True, False),
+    )
+    assert namespace['WIRING'][f'{__name__}:Session'][1][1] == ('timeout', 'builtins:float', False, False)
+
+
+def test_generate_command(tmp_path, capsys):
+    output = tmp_path / 'wiring_generated.py'
+
+    assert main(['generate', f'{__name__}:DI', '-o', str(output)]) == 0
+    assert f'`python -m depin generate {__name__}:DI`' in output.read_text()
+
+    assert main(['generate', f'{__name__}:DI']) == 0
+    assert capsys.readouterr().out == output.read_text()